@@ -0,0 +1,102 @@
+"""Benchmark da verificação de dígitos verificadores do CNPJ.
+
+Compara, sobre uma lista sintética de CNPJs com DVs corretos, a regra atual
+(``CNPJ_REGEX``, só formato) com a regra de formato seguida da verificação
+dos DVs registro a registro (``is_valid_cnpj``) e em lote
+(``check_digits_valid_many``, NumPy). Também mede ``validate_many`` com e
+sem ``verify_check_digits``.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_cnpj.py --records 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.cnpj import (  # noqa: E402
+    FIRST_WEIGHTS, SECOND_WEIGHTS, check_digits_valid_many, is_valid_cnpj)
+from petrobahia.validators import CNPJ_REGEX, CustomerValidator  # noqa: E402
+
+
+def _digit(base: str, weights: tuple[int, ...]) -> str:
+    remainder = sum(int(d) * w for d, w in zip(base, weights)) % 11
+    return "0" if remainder < 2 else str(11 - remainder)
+
+
+def synthetic_cnpjs(total: int) -> list[str]:
+    """CNPJs distintos com dígitos verificadores corretos."""
+    cnpjs = []
+    for i in range(total):
+        base = f"{i + 1:08d}0001"
+        base += _digit(base, FIRST_WEIGHTS)
+        cnpjs.append(base + _digit(base, SECOND_WEIGHTS))
+    return cnpjs
+
+
+def regex_only(cnpjs: list[str]) -> None:
+    """Regra atual: apenas o formato."""
+    match = CNPJ_REGEX.match
+    for cnpj in cnpjs:
+        match(cnpj)
+
+
+def regex_and_digits(cnpjs: list[str]) -> None:
+    """Formato e DVs, registro a registro."""
+    match = CNPJ_REGEX.match
+    for cnpj in cnpjs:
+        if match(cnpj):
+            is_valid_cnpj(cnpj)
+
+
+def vectorized(cnpjs: list[str]) -> None:
+    """DVs do lote inteiro com NumPy (inclui a checagem de formato)."""
+    check_digits_valid_many(cnpjs)
+
+
+def measure(body: Callable[[], object], repeat: int) -> float:
+    """Melhor tempo, em segundos, de ``repeat`` execuções."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Executa o benchmark e imprime CNPJs por segundo."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cnpjs = synthetic_cnpjs(args.records)
+    records = [
+        {"nome": "Posto", "email": "posto@example.com", "cnpj": cnpj} for cnpj in cnpjs
+    ]
+    plain, verifying = CustomerValidator(), CustomerValidator(verify_check_digits=True)
+    cases = (
+        ("regex (atual)", lambda: regex_only(cnpjs)),
+        ("regex + DV escalar", lambda: regex_and_digits(cnpjs)),
+        ("DV vetorizado", lambda: vectorized(cnpjs)),
+        ("validate_many", lambda: plain.validate_many(records)),
+        ("validate_many + DV", lambda: verifying.validate_many(records)),
+    )
+
+    print(f"{'verificacao':<22} {'segundos':>10} {'registros/s':>14}")
+    for name, body in cases:
+        seconds = measure(body, args.repeat)
+        print(f"{name:<22} {seconds:>10.3f} {args.records / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark da leitura de arquivos de clientes.
+
+Gera um ``clientes.txt`` sintético no formato de ``FileCustomerRepository``
+(com uma fração de nomes com apóstrofo, que o ``repr`` grava entre aspas
+duplas), migra-o para TSV e compara, em clientes por segundo, a leitura
+completa do arquivo:
+
+* ``literal_eval``: a leitura anterior, ``ast.literal_eval`` linha a linha;
+* ``repr``: ``iter_customers`` sobre o arquivo original;
+* ``tsv``: ``iter_customers`` sobre o arquivo migrado.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_customer_files.py --customers 500000
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.customer_files import (iter_customers,  # noqa: E402
+                                       migrate_to_tsv)
+from petrobahia.models import Customer  # noqa: E402
+
+
+def write_customers(path: Path, total: int, seed: int = 7) -> None:
+    """Grava ``total`` clientes no formato ``repr`` do repositório em arquivo."""
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as handle:
+        for number in range(total):
+            name = f"Cliente {number}" if rng.random() < 0.95 else f"D'Ávila {number}"
+            record = {
+                "nome": name,
+                "email": f"cliente{number}@example.com",
+                "cnpj": f"{number:014d}",
+            }
+            handle.write(f"{record}\n")
+
+
+def literal_eval_customers(path: Path) -> Iterator[Customer]:
+    """Leitura com ``ast.literal_eval``, como antes de ``customer_files``."""
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            record = ast.literal_eval(line.strip())
+            yield Customer(record["nome"], record["email"], record["cnpj"])
+
+
+def measure(read: Callable[[], Iterator[Customer]], repeat: int) -> tuple[float, int]:
+    """Melhor tempo, em segundos, de ``repeat`` leituras e clientes lidos."""
+    best, count = float("inf"), 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in read())
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main() -> None:
+    """Executa o benchmark e imprime clientes por segundo de cada leitura."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--customers", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "clientes.txt"
+        destination = Path(directory) / "clientes.tsv"
+        write_customers(source, args.customers)
+        start = time.perf_counter()
+        stats = migrate_to_tsv(source, destination)
+        migration = time.perf_counter() - start
+
+        cases = (
+            ("literal_eval", lambda: literal_eval_customers(source)),
+            ("repr", lambda: iter_customers(source)),
+            ("tsv", lambda: iter_customers(destination)),
+        )
+        print(f"{'leitura':<14} {'segundos':>10} {'clientes/s':>12}")
+        for name, read in cases:
+            seconds, count = measure(read, args.repeat)
+            assert count == args.customers, (name, count)
+            print(f"{name:<14} {seconds:>10.3f} {count / seconds:>12,.0f}")
+        print(
+            f"\nmigracao: {stats.migrated} clientes em {migration:.3f} s "
+            f"({stats.skipped} linhas ignoradas)"
+        )
+
+
+if __name__ == "__main__":
+    main()
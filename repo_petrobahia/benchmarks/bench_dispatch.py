@@ -0,0 +1,92 @@
+"""Benchmark da escolha de estratégias: varredura linear x índice por chave.
+
+Mede o tempo de ``DiscountEngine.apply`` e ``PriceCalculator.calculate`` para
+um pedido atendido pela última estratégia cadastrada, com 5 a 500 estratégias.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_dispatch.py
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.discounts import (DiscountEngine,  # noqa: E402
+                                  PercentageCouponDiscount)
+from petrobahia.models import Order  # noqa: E402
+from petrobahia.pricing import PriceCalculator  # noqa: E402
+
+SIZES = (5, 50, 500)
+REPEAT = 5
+NUMBER = 20_000
+
+
+@dataclass(slots=True)
+class _SyntheticProductStrategy:
+    """Estratégia de um produto sintético, sem mensagem de debug."""
+
+    product: str
+    unit_price: float = 1.0
+
+    @property
+    def dispatch_key(self) -> str:
+        """Produto atendido pela estratégia."""
+        return self.product
+
+    def supports(self, order: Order) -> bool:
+        """Verifica se o pedido é do produto sintético."""
+        return order.product == self.product
+
+    def calculate(self, order: Order) -> float:
+        """Preço linear por quantidade."""
+        return self.unit_price * order.quantity
+
+    def debug_message(self, _price: float) -> str:
+        """Sem mensagem, para medir apenas a escolha da estratégia."""
+        return ""
+
+
+def _best_ns(statement) -> float:
+    return min(timeit.repeat(statement, repeat=REPEAT, number=NUMBER)) / NUMBER * 1e9
+
+
+def bench_discounts(size: int, indexed: bool) -> float:
+    """Tempo por chamada (ns) de ``DiscountEngine.apply``."""
+    engine = DiscountEngine(
+        [PercentageCouponDiscount(f"REGIAO{i}", 0.05) for i in range(size)],
+        indexed=indexed,
+    )
+    order = Order("Cliente", "diesel", 100, coupon=f"REGIAO{size - 1}")
+    return _best_ns(lambda: engine.apply(100.0, order))
+
+
+def bench_pricing(size: int, indexed: bool) -> float:
+    """Tempo por chamada (ns) de ``PriceCalculator.calculate``."""
+    calculator = PriceCalculator(
+        [_SyntheticProductStrategy(f"produto{i}") for i in range(size)],
+        indexed=indexed,
+    )
+    order = Order("Cliente", f"produto{size - 1}", 100)
+    return _best_ns(lambda: calculator.calculate(order))
+
+
+def main() -> None:
+    """Executa o benchmark e imprime a tabela de resultados."""
+    print(f"{'motor':<10} {'estrategias':>11} {'linear (ns)':>12} {'indice (ns)':>12}")
+    print("-" * 48)
+    for name, bench in (("desconto", bench_discounts), ("preco", bench_pricing)):
+        for size in SIZES:
+            linear = bench(size, indexed=False)
+            indexed = bench(size, indexed=True)
+            print(f"{name:<10} {size:>11} {linear:>12.0f} {indexed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Benchmark da precificação em ponto fixo contra ``float`` e ``Decimal``.
+
+Precifica a mesma lista sintética de pedidos de duas formas:
+
+* ``regras``: só a aritmética, com as estratégias de preço e desconto já
+  escolhidas para cada pedido (``calculate``/``apply``/``apply_rounding`` em
+  ``float``, as versões ``*_fixed`` em inteiros) contra uma implementação de
+  referência das mesmas regras em ``Decimal``;
+* ``processador``: ``process_order`` completo, com e sem ``fixed_point``.
+
+A referência em ``Decimal`` também serve de gabarito: ao final é informado
+quantos preços de cada caminho diferem do valor exato.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_fixed_point.py --orders 200000
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import time
+from decimal import ROUND_DOWN, ROUND_HALF_EVEN, Decimal
+from pathlib import Path
+from typing import Callable
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.fixed_point import to_milliliters  # noqa: E402
+from petrobahia.models import Order  # noqa: E402
+from petrobahia.orders import (  # noqa: E402
+    OrderProcessor, build_default_order_processor)
+
+PRODUCTS = ("diesel", "gasolina", "etanol", "lubrificante")
+COUPONS = (None, "MEGA10", "NOVO5", "LUB2")
+
+_PRICES = {
+    "diesel": Decimal("3.99"),
+    "gasolina": Decimal("5.19"),
+    "etanol": Decimal("3.59"),
+    "lubrificante": Decimal("25"),
+}
+_COUPON_RATES = {"MEGA10": Decimal("0.10"), "NOVO5": Decimal("0.05")}
+
+
+def synthetic_orders(total: int, seed: int = 7) -> list[Order]:
+    """Pedidos com quantidades inteiras e fracionárias, com e sem cupom."""
+    rng = random.Random(seed)
+    orders = []
+    for _ in range(total):
+        quantity = rng.choice(
+            (rng.randint(1, 2000), round(rng.uniform(0.1, 2000), 3))
+        )
+        orders.append(
+            Order(
+                customer_name="bench",
+                product=rng.choice(PRODUCTS),
+                quantity=float(quantity),
+                coupon=rng.choice(COUPONS),
+            )
+        )
+    return orders
+
+
+def decimal_price(order: Order) -> float:
+    """Regras padrão de preço, desconto e arredondamento em ``Decimal``."""
+    quantity = Decimal(str(order.quantity))
+    price = _PRICES[order.product] * quantity
+    if order.product == "diesel":
+        if quantity > 1000:
+            price *= Decimal("0.9")
+        elif quantity > 500:
+            price *= Decimal("0.95")
+    elif order.product == "gasolina" and quantity > 200:
+        price -= 100
+    elif order.product == "etanol" and quantity > 80:
+        price *= Decimal("0.97")
+
+    if order.coupon in _COUPON_RATES:
+        price -= price * _COUPON_RATES[order.coupon]
+    elif order.coupon == "LUB2" and order.product == "lubrificante":
+        price -= 2
+
+    if order.product == "diesel":
+        return float(price.quantize(Decimal(1), ROUND_HALF_EVEN))
+    if order.product == "gasolina":
+        return float(price.quantize(Decimal("0.01"), ROUND_HALF_EVEN))
+    return float(price.quantize(Decimal("0.01"), ROUND_DOWN))
+
+
+def float_rules(
+    processor: OrderProcessor, orders: list[Order]
+) -> Callable[[], list[float]]:
+    """Aritmética em ``float`` com as estratégias escolhidas de antemão."""
+    binding = processor.price_calculator.pin()
+    # pylint: disable=protected-access
+    selected = [
+        (
+            order,
+            processor.price_calculator.select(order, binding),
+            processor.discount_engine._select(order),
+        )
+        for order in orders
+    ]
+    rounding = processor.apply_rounding
+
+    def run() -> list[float]:
+        prices = []
+        for order, strategy, discount in selected:
+            price = max(strategy.calculate(order), 0.0)
+            if discount is not None:
+                price = discount.apply(price, order)
+            prices.append(rounding(order, price))
+        return prices
+
+    return run
+
+
+def fixed_rules(
+    processor: OrderProcessor, orders: list[Order]
+) -> Callable[[], list[float]]:
+    """Aritmética em inteiros com as estratégias escolhidas de antemão."""
+    binding = processor.price_calculator.pin()
+    # pylint: disable=protected-access
+    selected = [
+        (
+            order,
+            processor.price_calculator.select(order, binding),
+            processor.discount_engine._select(order),
+        )
+        for order in orders
+    ]
+    rounding = processor._apply_rounding_fixed
+
+    def run() -> list[float]:
+        prices = []
+        for order, strategy, discount in selected:
+            amount = max(strategy.calculate_fixed(to_milliliters(order.quantity)), 0)
+            if discount is not None:
+                amount = discount.apply_fixed(amount, order)
+            prices.append(rounding(order, amount) / 100)
+        return prices
+
+    return run
+
+
+def measure(body: Callable[[], list[float]], repeat: int) -> tuple[float, list[float]]:
+    """Melhor tempo, em segundos, de ``repeat`` execuções e o último resultado."""
+    best, result = float("inf"), []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = body()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    """Executa o benchmark e imprime pedidos por segundo e divergências."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    orders = synthetic_orders(args.orders)
+    floating = build_default_order_processor()
+    fixed = build_default_order_processor(fixed_point=True)
+    cases = (
+        ("regras", "float", float_rules(floating, orders)),
+        ("regras", "ponto fixo", fixed_rules(fixed, orders)),
+        ("regras", "Decimal", lambda: [decimal_price(order) for order in orders]),
+        (
+            "processador",
+            "float",
+            lambda: [floating.process_order(order) for order in orders],
+        ),
+        (
+            "processador",
+            "ponto fixo",
+            lambda: [fixed.process_order(order) for order in orders],
+        ),
+    )
+
+    results = {}
+    print(f"{'nivel':<12} {'caminho':<12} {'segundos':>10} {'pedidos/s':>12}")
+    for level, name, body in cases:
+        seconds, results[level, name] = measure(body, args.repeat)
+        print(
+            f"{level:<12} {name:<12} {seconds:>10.3f} {args.orders / seconds:>12,.0f}"
+        )
+    print()
+    exact = results["regras", "Decimal"]
+    for level, name in results:
+        if name == "Decimal":
+            continue
+        diverging = sum(
+            price != value for price, value in zip(results[level, name], exact)
+        )
+        print(
+            f"{level} {name}: {diverging} de {args.orders} precos "
+            "diferem do valor exato"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark de memória: lista de ``Order`` x ``OrderBatch``.
+
+Mede com ``tracemalloc`` a memória alocada para manter ``N`` pedidos em uma
+lista de dataclasses e no lote compacto em colunas tipadas.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_memory.py --orders 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.batch import OrderBatchBuilder  # noqa: E402
+from petrobahia.models import Order  # noqa: E402
+
+PRODUCTS = ("diesel", "gasolina", "etanol", "lubrificante")
+COUPONS = (None, None, "MEGA10", "NOVO5", "LUB2")
+CUSTOMERS = tuple(f"Cliente {i}" for i in range(5000))
+
+
+def rows(total: int, seed: int = 7):
+    """Linhas sintéticas (cliente, produto, quantidade, cupom)."""
+    rng = random.Random(seed)
+    for _ in range(total):
+        yield (
+            rng.choice(CUSTOMERS),
+            rng.choice(PRODUCTS),
+            float(rng.randint(1, 2000)),
+            rng.choice(COUPONS),
+        )
+
+
+def build_orders(total: int) -> list[Order]:
+    """Lista de ``Order``, a representação atual."""
+    return [Order(*row) for row in rows(total)]
+
+
+def build_batch(total: int):
+    """``OrderBatch`` com colunas tipadas."""
+    builder = OrderBatchBuilder()
+    for row in rows(total):
+        builder.append(*row)
+    return builder.build()
+
+
+def measure(factory: Callable[[int], object], total: int) -> int:
+    """Bytes ainda alocados após construir e manter o resultado."""
+    gc.collect()
+    tracemalloc.start()
+    result = factory(total)
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main() -> None:
+    """Executa as medições e imprime o consumo de memória."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    orders = measure(build_orders, args.orders)
+    batch = measure(build_batch, args.orders)
+    print(f"{'representacao':<14} {'MiB':>10} {'bytes/pedido':>13}")
+    print("-" * 39)
+    for name, size in (("list[Order]", orders), ("OrderBatch", batch)):
+        print(f"{name:<14} {size / 2**20:>10.1f} {size / args.orders:>13.1f}")
+    print(f"reducao: {orders / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
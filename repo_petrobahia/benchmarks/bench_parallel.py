@@ -0,0 +1,84 @@
+"""Benchmark de escalabilidade da precificação em múltiplos processos.
+
+Compara a vazão de ``process_parallel`` com 1, 2, 4, ... processos (até o
+número de CPUs) contra o processamento sequencial em um único processo.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_parallel.py --orders 500000 --chunk-size 2000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.models import Order  # noqa: E402
+from petrobahia.orders import build_default_order_processor  # noqa: E402
+from petrobahia.parallel import process_parallel  # noqa: E402
+
+PRODUCTS = ("diesel", "gasolina", "etanol", "lubrificante")
+COUPONS = (None, None, "MEGA10", "NOVO5", "LUB2")
+
+
+def synthetic_orders(total: int, seed: int = 42) -> list[Order]:
+    """Pedidos sintéticos com mistura de produtos, quantidades e cupons."""
+    rng = random.Random(seed)
+    return [
+        Order(
+            customer_name=f"Cliente {rng.randrange(1000)}",
+            product=rng.choice(PRODUCTS),
+            quantity=float(rng.randint(1, 2000)),
+            coupon=rng.choice(COUPONS),
+        )
+        for _ in range(total)
+    ]
+
+
+def worker_counts(limit: int) -> list[int]:
+    """Potências de dois até ``limit``, incluindo o próprio limite."""
+    counts, workers = [], 1
+    while workers < limit:
+        counts.append(workers)
+        workers *= 2
+    return counts + [limit]
+
+
+def main() -> None:
+    """Executa o benchmark e imprime vazão e aceleração por processo."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    orders = synthetic_orders(args.orders)
+
+    processor = build_default_order_processor()
+    start = time.perf_counter()
+    expected = [processor.process_order(order) for order in orders]
+    sequential = time.perf_counter() - start
+    print(f"{'processos':>9} {'pedidos/s':>12} {'aceleracao':>11}")
+    print(f"{'seq':>9} {args.orders / sequential:>12,.0f} {1.0:>10.2f}x")
+
+    for workers in worker_counts(args.max_workers):
+        start = time.perf_counter()
+        prices = list(
+            process_parallel(orders, workers=workers, chunk_size=args.chunk_size)
+        )
+        elapsed = time.perf_counter() - start
+        assert prices == expected, "resultado paralelo difere do sequencial"
+        print(
+            f"{workers:>9} {args.orders / elapsed:>12,.0f} "
+            f"{sequential / elapsed:>10.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
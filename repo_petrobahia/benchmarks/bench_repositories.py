@@ -0,0 +1,139 @@
+"""Benchmark de repositórios de clientes: arquivo texto, SQLite e log binário.
+
+Mede inserções por segundo de cada repositório gravando ``N`` clientes
+sintéticos em um diretório temporário e, para os repositórios com consulta,
+buscas por CNPJ por segundo em ordem aleatória.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_repositories.py --customers 50000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, ContextManager
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.log_repository import LogCustomerRepository  # noqa: E402
+from petrobahia.models import Customer  # noqa: E402
+from petrobahia.repositories import (  # noqa: E402
+    BatchedFileCustomerRepository, FileCustomerRepository,
+    IndexedFileCustomerRepository)
+from petrobahia.sqlite_repository import SqliteCustomerRepository  # noqa: E402
+
+
+def synthetic_customers(total: int) -> list[Customer]:
+    """Clientes sintéticos com CNPJs distintos."""
+    return [
+        Customer(f"Cliente {i}", f"cliente{i}@example.com", f"{i:014d}")
+        for i in range(total)
+    ]
+
+
+def file_save(directory: Path, customers: list[Customer]) -> None:
+    """``FileCustomerRepository.save`` cliente a cliente."""
+    repository = FileCustomerRepository(directory / "clientes.txt")
+    for customer in customers:
+        repository.save(customer)
+
+
+def batched_save_many(directory: Path, customers: list[Customer]) -> None:
+    """``BatchedFileCustomerRepository.save_many``."""
+    with BatchedFileCustomerRepository(directory / "clientes.txt") as repository:
+        repository.save_many(customers)
+
+
+def sqlite_save(directory: Path, customers: list[Customer]) -> None:
+    """``SqliteCustomerRepository.save``, uma transação por cliente."""
+    with SqliteCustomerRepository(directory / "clientes.db") as repository:
+        for customer in customers:
+            repository.save(customer)
+
+
+def sqlite_save_many(directory: Path, customers: list[Customer]) -> None:
+    """``SqliteCustomerRepository.save_many``, uma única transação."""
+    with SqliteCustomerRepository(directory / "clientes.db") as repository:
+        repository.save_many(customers)
+
+
+def log_save(directory: Path, customers: list[Customer]) -> None:
+    """``LogCustomerRepository.save``, uma escrita por cliente."""
+    with LogCustomerRepository(directory / "clientes.log") as repository:
+        for customer in customers:
+            repository.save(customer)
+
+
+def log_save_many(directory: Path, customers: list[Customer]) -> None:
+    """``LogCustomerRepository.save_many``, uma única escrita."""
+    with LogCustomerRepository(directory / "clientes.log") as repository:
+        repository.save_many(customers)
+
+
+CASES: dict[str, Callable[[Path, list[Customer]], None]] = {
+    "arquivo save": file_save,
+    "arquivo em lote save_many": batched_save_many,
+    "sqlite save": sqlite_save,
+    "sqlite save_many": sqlite_save_many,
+    "log save": log_save,
+    "log save_many": log_save_many,
+}
+
+LOOKUPS: dict[str, Callable[[Path], ContextManager]] = {
+    "arquivo indexado": lambda directory: IndexedFileCustomerRepository(
+        directory / "clientes.txt"
+    ),
+    "sqlite": lambda directory: SqliteCustomerRepository(directory / "clientes.db"),
+    "log": lambda directory: LogCustomerRepository(directory / "clientes.log"),
+}
+
+
+def lookups_per_second(
+    open_repository: Callable[[Path], ContextManager], customers: list[Customer]
+) -> float:
+    """Consultas ``get_by_cnpj`` por segundo em um repositório já povoado."""
+    cnpjs = [customer.cnpj for customer in customers]
+    random.Random(7).shuffle(cnpjs)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with open_repository(Path(tmp_dir)) as repository:
+            for customer in customers:
+                repository.save(customer)
+            start = time.perf_counter()
+            for cnpj in cnpjs:
+                repository.get_by_cnpj(cnpj)
+            elapsed = time.perf_counter() - start
+    return len(cnpjs) / elapsed
+
+
+def main() -> None:
+    """Executa os cenários e imprime inserções por segundo."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--customers", type=int, default=20_000)
+    args = parser.parse_args()
+    customers = synthetic_customers(args.customers)
+
+    print(f"{'cenario':<28} {'insercoes/s':>14}")
+    print("-" * 43)
+    for name, case in CASES.items():
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            start = time.perf_counter()
+            case(Path(tmp_dir), customers)
+            elapsed = time.perf_counter() - start
+        print(f"{name:<28} {len(customers) / elapsed:>14,.0f}")
+
+    print()
+    print(f"{'repositorio':<28} {'consultas/s':>14}")
+    print("-" * 43)
+    for name, open_repository in LOOKUPS.items():
+        print(f"{name:<28} {lookups_per_second(open_repository, customers):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
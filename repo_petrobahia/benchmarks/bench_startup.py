@@ -0,0 +1,124 @@
+"""Benchmark do tempo de inicialização de ``main.py``.
+
+Mede, em processos novos, o tempo de parede do interpretador vazio
+(``python -c pass``), da importação de ``main`` (ajuste do ``sys.path`` e
+módulos do pacote, sem executar a demonstração) e da execução completa de
+``main.py`` em uma cópia temporária (para não alterar ``clientes.txt``). Com
+``-X importtime`` lista os módulos mais caros, pela mediana do tempo próprio
+entre as execuções. O custo de inicialização reportado é o tempo de
+importação de ``main`` descontado o do interpretador vazio.
+
+Antes das medições o pacote é compilado com ``compileall``: com
+``PYTHONDONTWRITEBYTECODE`` ligado, módulos alterados seriam recompilados a
+cada execução e o resultado não refletiria uma instalação real.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_startup.py --runs 30 --target-ms 30
+"""
+from __future__ import annotations
+
+import argparse
+import compileall
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+
+def wall_times(command: list[str], runs: int, cwd: Path) -> list[float]:
+    """Tempos de parede, em ms, de ``runs`` execuções de ``command``."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            command,
+            cwd=cwd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def import_times(command: list[str], runs: int, cwd: Path) -> dict[str, float]:
+    """Mediana do tempo próprio (ms) de cada módulo, via ``-X importtime``."""
+    samples: dict[str, list[float]] = defaultdict(list)
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", *command],
+            cwd=cwd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, _cumulative, module = line[len("import time:"):].split("|")
+            samples[module.strip()].append(int(self_us) / 1000)
+    return {module: statistics.median(values) for module, values in samples.items()}
+
+
+def main() -> None:
+    """Executa as medições e compara o custo de inicialização com a meta."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--target-ms", type=float, default=30.0)
+    parser.add_argument(
+        "--check", action="store_true", help="termina com código 1 acima da meta"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sandbox = Path(tmp)
+        shutil.copy(BASE_DIR / "main.py", sandbox / "main.py")
+        (sandbox / "src").symlink_to(BASE_DIR / "src", target_is_directory=True)
+
+        cases = (
+            ("interpretador vazio", [sys.executable, "-c", "pass"]),
+            ("import main", [sys.executable, "-c", "import main"]),
+            ("main.py completo", [sys.executable, "main.py"]),
+        )
+        compileall.compile_dir(BASE_DIR / "src", quiet=1)
+        compileall.compile_file(sandbox / "main.py", quiet=1)
+        # Uma execução de aquecimento aquece o cache de disco.
+        wall_times([sys.executable, "main.py"], 1, sandbox)
+        medians = {}
+        print(f"{'comando':<22} {'mediana ms':>11} {'p90 ms':>8}")
+        for name, command in cases:
+            times = sorted(wall_times(command, args.runs, sandbox))
+            medians[name] = statistics.median(times)
+            p90 = times[int(0.9 * (len(times) - 1))]
+            print(f"{name:<22} {medians[name]:>11.1f} {p90:>8.1f}")
+
+        baseline = import_times(["-c", "pass"], args.runs, sandbox)
+        modules = import_times(["-c", "import main"], args.runs, sandbox)
+
+    extra = {name: ms for name, ms in modules.items() if name not in baseline}
+    print(f"\n{'modulo (alem do interpretador)':<34} {'proprio ms':>11}")
+    for name, ms in sorted(extra.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{name:<34} {ms:>11.2f}")
+    print(f"{'soma de ' + str(len(extra)) + ' modulos':<34} {sum(extra.values()):>11.2f}")
+
+    startup = medians["import main"] - medians["interpretador vazio"]
+    status = "ok" if startup <= args.target_ms else "ACIMA DA META"
+    print(
+        f"\ninicializacao (import main - interpretador): {startup:.1f} ms "
+        f"(meta {args.target_ms:.0f} ms) {status}"
+    )
+    if args.check and startup > args.target_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark da busca de faixas de quantidade por número de faixas.
+
+Para tabelas com cada vez mais faixas, precifica a mesma lista de
+quantidades com ``TieredPricingStrategy`` (busca binária com ``bisect``),
+com uma varredura linear equivalente às cadeias ``if``/``elif`` das
+estratégias originais (limites do maior para o menor) e, em lote, com
+``calculate_array`` (``searchsorted``). Os três caminhos devem dar o mesmo
+resultado.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_tiers.py --quantities 200000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import numpy as np  # noqa: E402
+
+from petrobahia.models import Order  # noqa: E402
+from petrobahia.pricing import TieredPricingStrategy  # noqa: E402
+from petrobahia.tiers import QuantityTier, TierTable  # noqa: E402
+
+TIER_COUNTS = (2, 8, 32, 128, 512)
+MAX_QUANTITY = 3000
+
+
+def tier_table(count: int) -> TierTable:
+    """Faixas igualmente espaçadas com desconto crescente."""
+    step = MAX_QUANTITY / count
+    return TierTable(
+        tuple(
+            QuantityTier(round(step * i, 3), multiplier=1 - i / (4 * count))
+            for i in range(1, count + 1)
+        )
+    )
+
+
+def linear_calculate(table: TierTable, unit_price: float) -> Callable[[Order], float]:
+    """Mesma regra de ``TieredPricingStrategy`` com varredura linear."""
+    descending = sorted(table.tiers, key=lambda tier: tier.above, reverse=True)
+
+    def calculate(order: Order) -> float:
+        subtotal = unit_price * order.quantity
+        for tier in descending:
+            if order.quantity > tier.above:
+                return subtotal * tier.multiplier - tier.deduction
+        return subtotal
+
+    return calculate
+
+
+def measure(body: Callable[[], object], repeat: int) -> tuple[float, object]:
+    """Melhor tempo, em segundos, de ``repeat`` execuções e o último resultado."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = body()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    """Executa o benchmark e imprime nanossegundos por pedido."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quantities", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    orders = [
+        Order("bench", "diesel", round(rng.uniform(0, MAX_QUANTITY), 2))
+        for _ in range(args.quantities)
+    ]
+    quantities = np.array([order.quantity for order in orders])
+
+    print(f"{'faixas':>7} {'bisect ns':>10} {'linear ns':>10} {'lote ns':>9}")
+    for count in TIER_COUNTS:
+        table = tier_table(count)
+        strategy = TieredPricingStrategy("diesel", 3.99, table)
+        linear = linear_calculate(table, 3.99)
+        cases = (
+            lambda: [strategy.calculate(order) for order in orders],
+            lambda: [linear(order) for order in orders],
+            lambda: strategy.calculate_array(quantities).tolist(),
+        )
+        timings, results = zip(*(measure(case, args.repeat) for case in cases))
+        assert results[0] == results[1] == results[2], count
+        per_order = [seconds / args.quantities * 1e9 for seconds in timings]
+        print(
+            f"{count:>7} {per_order[0]:>10.0f} {per_order[1]:>10.0f} "
+            f"{per_order[2]:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark de validação de cadastros: registro a registro x em lote.
+
+Compara ``validate_registration`` + ``validate_email`` chamados para cada
+registro (como faz ``CustomerService.register``) com
+``CustomerValidator.validate_many`` sobre uma lista sintética de parceiros.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/bench_validation.py --records 500000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.validators import CustomerValidator  # noqa: E402
+
+
+def synthetic_records(total: int, invalid_ratio: float = 0.1) -> list[dict[str, str]]:
+    """Cadastros sintéticos com uma fração de registros inválidos."""
+    rng = random.Random(42)
+    records = []
+    for i in range(total):
+        record = {
+            "nome": f"Cliente {i}",
+            "email": f"cliente{i}@example.com",
+            "cnpj": f"{i:014d}",
+        }
+        if rng.random() < invalid_ratio:
+            field = rng.choice(("nome", "email", "cnpj"))
+            record[field] = {"nome": " ", "email": "sem-arroba", "cnpj": "123"}[field]
+        records.append(record)
+    return records
+
+
+def per_record(validator: CustomerValidator, records: list[dict[str, str]]) -> None:
+    """Validação registro a registro, como em ``CustomerService.register``."""
+    for record in records:
+        if validator.validate_registration(dict(record)).is_valid:
+            validator.validate_email(record["email"])
+
+
+def bulk(validator: CustomerValidator, records: list[dict[str, str]]) -> None:
+    """Validação em lote com máscaras de erro."""
+    validator.validate_many(records)
+
+
+def measure(
+    body: Callable[[CustomerValidator, list[dict[str, str]]], None],
+    records: list[dict[str, str]],
+    repeat: int,
+) -> float:
+    """Melhor tempo, em segundos, de ``repeat`` execuções."""
+    validator = CustomerValidator()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body(validator, records)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Executa o benchmark e imprime registros por segundo."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.records)
+    print(f"{'validacao':<22} {'segundos':>10} {'registros/s':>14}")
+    baseline = None
+    for name, body in (("registro a registro", per_record), ("validate_many", bulk)):
+        seconds = measure(body, records, args.repeat)
+        baseline = baseline or seconds
+        print(
+            f"{name:<22} {seconds:>10.3f} {args.records / seconds:>14,.0f}"
+            f"   ({baseline / seconds:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
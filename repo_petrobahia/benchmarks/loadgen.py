@@ -0,0 +1,160 @@
+"""Gerador de carga para o serviço asyncio de precificação.
+
+Abre ``--connections`` conexões e mantém até ``--pipeline`` pedidos em
+trânsito em cada uma, medindo a latência de cada pedido (envio até resposta).
+Ao final imprime vazão e latências p50/p99. Sem ``--port``/``--unix``, sobe um
+``OrderServer`` no próprio processo (com ``--batch-window``, usando o
+agrupamento em lotes e imprimindo as suas métricas).
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/loadgen.py --requests 100000 --connections 8
+    python benchmarks/loadgen.py --requests 100000 --batch-window 0.0005
+    python benchmarks/loadgen.py --port 8765 --requests 50000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.server import OrderServer  # noqa: E402
+
+PRODUCTS = ("diesel", "gasolina", "etanol", "lubrificante")
+COUPONS = (None, None, "MEGA10", "NOVO5", "LUB2")
+
+
+def synthetic_lines(total: int, seed: int = 42) -> list[bytes]:
+    """Pedidos sintéticos já serializados em JSON, um por linha."""
+    rng = random.Random(seed)
+    return [
+        json.dumps(
+            {
+                "id": index,
+                "cliente": f"Cliente {rng.randrange(1000)}",
+                "produto": rng.choice(PRODUCTS),
+                "qtd": rng.randint(1, 2000),
+                "cupom": rng.choice(COUPONS),
+            }
+        ).encode()
+        + b"\n"
+        for index in range(total)
+    ]
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Percentil por posição mais próxima de uma lista já ordenada."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def run_connection(
+    open_connection, lines: list[bytes], pipeline: int, latencies: list[float]
+) -> None:
+    """Envia ``lines`` por uma conexão com até ``pipeline`` pedidos em trânsito."""
+    reader, writer = await open_connection()
+    window = asyncio.Semaphore(pipeline)
+    sent_at: list[float] = []
+
+    async def send() -> None:
+        for line in lines:
+            await window.acquire()
+            sent_at.append(time.perf_counter())
+            writer.write(line)
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for index in range(len(lines)):
+        await reader.readline()
+        latencies.append(time.perf_counter() - sent_at[index])
+        window.release()
+    await sender
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load(args: argparse.Namespace) -> tuple[float, list[float]]:
+    """Executa a carga e retorna (duração, latências)."""
+    server = None
+    if args.unix:
+        def open_connection():
+            return asyncio.open_unix_connection(str(args.unix))
+    else:
+        port = args.port
+        if port is None:
+            server = OrderServer(
+                executor=args.executor,
+                workers=args.workers,
+                batch_window=args.batch_window,
+                max_batch=args.max_batch,
+            )
+            port = await server.start_tcp()
+
+        def open_connection():
+            return asyncio.open_connection(args.host, port)
+
+    lines = synthetic_lines(args.requests)
+    shares = [lines[index :: args.connections] for index in range(args.connections)]
+    latencies: list[float] = []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                run_connection(open_connection, share, args.pipeline, latencies)
+                for share in shares
+            )
+        )
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            await server.close()
+    if server is not None and server.coalescer is not None:
+        metrics = server.coalescer.metrics()
+        print(
+            f"lotes: {metrics.batches}, tamanho medio {metrics.mean_batch_size:.1f}, "
+            f"latencia adicionada media {metrics.mean_added_latency_us:.0f} us "
+            f"(p99 {metrics.p99_added_latency_us:.0f} us)"
+        )
+    return elapsed, latencies
+
+
+def main() -> None:
+    """Executa a carga e imprime vazão e latências."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--pipeline", type=int, default=32)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--unix", type=Path, default=None)
+    parser.add_argument(
+        "--executor", choices=("inline", "thread", "process"), default="inline"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-window", type=float, default=None)
+    parser.add_argument("--max-batch", type=int, default=256)
+    args = parser.parse_args()
+
+    elapsed, latencies = asyncio.run(run_load(args))
+    latencies.sort()
+    print(f"{'pedidos':>10} {'conexoes':>9} {'pedidos/s':>12} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    print(
+        f"{len(latencies):>10} {args.connections:>9} "
+        f"{len(latencies) / elapsed:>12.0f} "
+        f"{percentile(latencies, 0.50) * 1000:>10.3f} "
+        f"{percentile(latencies, 0.99) * 1000:>10.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""Suíte de benchmarks de precificação, pedidos e cadastro com barreira de regressão.
+
+Executa cada cenário sobre misturas sintéticas de pedidos (de 1k a 10M),
+mede a vazão (operações por segundo, melhor de ``--repeat`` execuções) e grava
+os resultados em JSON. Com ``--compare`` os resultados são confrontados com um
+arquivo de referência e o processo termina com código 1 se algum cenário
+perder mais do que ``--threshold`` de vazão.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    python benchmarks/suite.py --sizes 1k,100k --output base.json
+    python benchmarks/suite.py --sizes 1k,100k --compare base.json --threshold 0.1
+    python benchmarks/suite.py --only pricing --sizes 1M,10M
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from petrobahia.customers import CustomerService  # noqa: E402
+from petrobahia.models import Customer, Order  # noqa: E402
+from petrobahia.orders import build_default_order_processor  # noqa: E402
+from petrobahia.repositories import (  # noqa: E402
+    BatchedFileCustomerRepository, FileCustomerRepository)
+from petrobahia.sqlite_repository import SqliteCustomerRepository  # noqa: E402
+from petrobahia.validators import CustomerValidator  # noqa: E402
+
+PRODUCTS = ("diesel", "gasolina", "etanol", "lubrificante")
+COUPONS = (None, None, "MEGA10", "NOVO5", "LUB2")
+# Pedidos e clientes sintéticos são gerados uma vez e reutilizados em ciclo,
+# então 10M de operações não exigem 10M de objetos em memória.
+POOL_SIZE = 65_536
+SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """Cenário medido: ``run(n)`` executa ``n`` operações e retorna segundos."""
+
+    name: str
+    run: Callable[[int], float]
+    max_size: int = 10_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    """Melhor medição de um cenário para um tamanho de entrada."""
+
+    name: str
+    size: int
+    seconds: float
+    ops_per_sec: float
+
+
+def synthetic_orders(total: int = POOL_SIZE, seed: int = 42) -> list[Order]:
+    """Pedidos sintéticos com mistura de produtos, quantidades e cupons."""
+    rng = random.Random(seed)
+    return [
+        Order(
+            customer_name=f"Cliente {rng.randrange(1000)}",
+            product=rng.choice(PRODUCTS),
+            quantity=float(rng.randint(1, 2000)),
+            coupon=rng.choice(COUPONS),
+        )
+        for _ in range(total)
+    ]
+
+
+def synthetic_customers(total: int) -> Iterator[Customer]:
+    """Clientes sintéticos com CNPJs distintos, gerados sob demanda."""
+    for i in range(total):
+        yield Customer(f"Cliente {i}", f"cliente{i}@example.com", f"{i:014d}")
+
+
+def _consume(iterable: Iterable[object]) -> None:
+    # Percorre sem acumular resultados: 10M de floats não cabem em uma lista.
+    deque(iterable, maxlen=0)
+
+
+def _timed(body: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    body()
+    return time.perf_counter() - start
+
+
+def build_scenarios() -> list[Scenario]:
+    """Cenários da suíte, com os dados sintéticos já preparados."""
+    processor = build_default_order_processor()
+    calculator = processor.price_calculator
+    discounts = processor.discount_engine
+    orders = synthetic_orders()
+    payloads = [
+        {
+            "cliente": order.customer_name,
+            "produto": order.product,
+            "qtd": order.quantity,
+            "cupom": order.coupon,
+        }
+        for order in orders
+    ]
+    registrations = [
+        {
+            "nome": f"Cliente {i}",
+            "email": f"cliente{i}@example.com",
+            "cnpj": f"{i:014d}",
+        }
+        for i in range(POOL_SIZE)
+    ]
+
+    def pricing(product: str) -> Callable[[int], float]:
+        same_product = [order for order in orders if order.product == product]
+
+        def run(size: int) -> float:
+            calculate = calculator.calculate
+            return _timed(
+                lambda: _consume(map(calculate, islice(cycle(same_product), size)))
+            )
+
+        return run
+
+    def discount(size: int) -> float:
+        apply = discounts.apply
+        return _timed(
+            lambda: _consume(apply(100.0, o) for o in islice(cycle(orders), size))
+        )
+
+    def process(size: int) -> float:
+        run = processor.process
+        return _timed(lambda: _consume(map(run, islice(cycle(payloads), size))))
+
+    def price_many(size: int) -> float:
+        def body() -> None:
+            source, remaining = cycle(orders), size
+            while remaining > 0:
+                chunk = list(islice(source, min(remaining, 10_000)))
+                processor.price_many(chunk)
+                remaining -= len(chunk)
+
+        return _timed(body)
+
+    def register(size: int) -> float:
+        service = CustomerService(
+            repository=_MemoryRepository(), validator=CustomerValidator()
+        )
+        return _timed(
+            lambda: _consume(map(service.register, islice(cycle(registrations), size)))
+        )
+
+    def repository(write: Callable[[Path, int], None]) -> Callable[[int], float]:
+        def run(size: int) -> float:
+            with tempfile.TemporaryDirectory() as tmp:
+                return _timed(lambda: write(Path(tmp), size))
+
+        return run
+
+    def file_save(directory: Path, size: int) -> None:
+        repo = FileCustomerRepository(directory / "clientes.txt")
+        for customer in synthetic_customers(size):
+            repo.save(customer)
+
+    def batched_save_many(directory: Path, size: int) -> None:
+        with BatchedFileCustomerRepository(directory / "clientes.txt") as repo:
+            repo.save_many(synthetic_customers(size))
+
+    def sqlite_save_many(directory: Path, size: int) -> None:
+        with SqliteCustomerRepository(directory / "clientes.db") as repo:
+            repo.save_many(synthetic_customers(size))
+
+    return [
+        *(Scenario(f"pricing.{product}", pricing(product)) for product in PRODUCTS),
+        Scenario("discounts.apply", discount),
+        Scenario("orders.process", process),
+        Scenario("orders.price_many", price_many),
+        Scenario("customers.register", register, max_size=1_000_000),
+        Scenario("repositories.file_save", repository(file_save), max_size=100_000),
+        Scenario("repositories.batched_save_many", repository(batched_save_many)),
+        Scenario("repositories.sqlite_save_many", repository(sqlite_save_many)),
+    ]
+
+
+class _MemoryRepository:
+    """Repositório em memória: isola o custo do serviço do custo de E/S."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def save(self, _customer: Customer) -> None:
+        self.count += 1
+
+
+def parse_size(text: str) -> int:
+    """Converte ``"1k"``, ``"10M"`` ou ``"2500"`` em inteiro."""
+    text = text.strip().lower()
+    if text[-1:] in SUFFIXES:
+        return int(float(text[:-1]) * SUFFIXES[text[-1]])
+    return int(text)
+
+
+def run_suite(
+    scenarios: list[Scenario], sizes: list[int], repeat: int
+) -> list[Result]:
+    """Executa os cenários e retorna a melhor medição de cada tamanho."""
+    results = []
+    for scenario in scenarios:
+        for size in sizes:
+            if size > scenario.max_size:
+                print(f"{scenario.name:<34} {size:>10}  pulado (limite {scenario.max_size})")
+                continue
+            seconds = min(scenario.run(size) for _ in range(repeat))
+            result = Result(scenario.name, size, seconds, size / seconds)
+            results.append(result)
+            print(
+                f"{result.name:<34} {result.size:>10} {result.seconds:>10.4f}s "
+                f"{result.ops_per_sec:>14,.0f} op/s"
+            )
+    return results
+
+
+def compare(
+    results: list[Result], baseline: dict[str, object], threshold: float
+) -> list[str]:
+    """Lista os cenários cuja vazão caiu mais que ``threshold`` (fração)."""
+    reference = {
+        (item["name"], item["size"]): item["ops_per_sec"]
+        for item in baseline["results"]
+    }
+    regressions = []
+    print(f"\n{'cenario':<34} {'tamanho':>10} {'base op/s':>14} {'atual op/s':>14} {'var':>8}")
+    for result in results:
+        base = reference.get((result.name, result.size))
+        if base is None:
+            continue
+        change = result.ops_per_sec / base - 1
+        flag = ""
+        if change < -threshold:
+            flag = "  REGRESSAO"
+            regressions.append(f"{result.name} ({result.size}): {change:+.1%}")
+        print(
+            f"{result.name:<34} {result.size:>10} {base:>14,.0f} "
+            f"{result.ops_per_sec:>14,.0f} {change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def environment() -> dict[str, object]:
+    """Dados do ambiente gravados junto aos resultados."""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "numpy": numpy_version,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def main() -> None:
+    """Executa a suíte, grava o JSON e aplica a barreira de regressão."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1k,10k,100k", help="ex.: 1k,100k,1M,10M")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default="", help="roda só cenários com este prefixo")
+    parser.add_argument("--output", type=Path, help="grava os resultados em JSON")
+    parser.add_argument("--compare", type=Path, help="resultados de referência (JSON)")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="queda de vazão tolerada, em fração (padrão: 0.10)",
+    )
+    args = parser.parse_args()
+
+    # Mensagens por pedido só atrapalham a medição.
+    logging.getLogger("petrobahia").setLevel(logging.ERROR)
+    sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    scenarios = [s for s in build_scenarios() if s.name.startswith(args.only)]
+    results = run_suite(scenarios, sizes, args.repeat)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(
+                {
+                    "environment": environment(),
+                    "results": [asdict(result) for result in results],
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        print(f"\nresultados gravados em {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressao(oes) acima de {args.threshold:.0%}:")
+            for line in regressions:
+                print("  -", line)
+            sys.exit(1)
+        print("\nsem regressoes")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 from petrobahia.customers import CustomerService  # noqa: E402
+from petrobahia.logs import configure_console_logging  # noqa: E402
 from petrobahia.orders import build_default_order_processor  # noqa: E402
 from petrobahia.repositories import FileCustomerRepository  # noqa: E402
 from petrobahia.validators import CustomerValidator  # noqa: E402
@@ -57,6 +58,7 @@ CLIENTES = [
 
 def main() -> None:
     """Ponto de entrada principal do sistema PetroBahia."""
+    configure_console_logging()
     print("=" * 60)
     print("        SISTEMA INTERNO PETROBAHIA - DEMO")
     print("=" * 60)
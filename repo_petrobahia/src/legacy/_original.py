@@ -0,0 +1,87 @@
+"""Implementação original de ``preco_calculadora`` e ``pedido_service``.
+
+Cópia fiel do código legado anterior às fachadas sobre ``OrderProcessor``,
+mantida apenas como gabarito de ``legacy.differential``. Não deve ser usada
+fora da comparação nem corrigida: o laço O(qtd) do lubrificante e as demais
+peculiaridades fazem parte do contrato verificado.
+"""
+# pylint: skip-file
+
+BASES = {
+    "diesel": 3.99,
+    "gasolina": 5.19,
+    "etanol": 3.59,
+    "lubrificante": 25.0,
+}
+
+def calcular_preco(tipo, qtd):
+    if tipo == "diesel":
+        if qtd > 1000:
+            preco = (BASES["diesel"] * qtd) * 0.9
+        else:
+            if qtd > 500:
+                preco = (BASES["diesel"] * qtd) * 0.95
+            else:
+                preco = BASES["diesel"] * qtd
+        print("calc diesel", preco)
+        return preco
+    else:
+        if tipo == "gasolina":
+            if qtd > 200:
+                preco = (BASES["gasolina"] * qtd) - 100
+            else:
+                preco = BASES["gasolina"] * qtd
+            print("calc gas", preco)
+            return preco
+        else:
+            if tipo == "etanol":
+                preco = BASES["etanol"] * qtd
+                if qtd > 80:
+                    preco = preco * 0.97
+                print("calc eta", preco)
+                return preco
+            else:
+                if tipo == "lubrificante":
+                    x = 0
+                    for i in range(qtd):
+                        x = x + BASES["lubrificante"]
+                    return x
+                else:
+                    print("tipo desconhecido, devolvendo 0")
+                    return 0
+
+def processar_pedido(p):
+    prod = p.get("produto")
+    qtd = p.get("qtd")
+    cupom = p.get("cupom")
+
+    if qtd == 0:
+        print("qtd zero, retornando 0")
+        return 0
+
+    preco = calcular_preco(prod, qtd)
+    if preco < 0:
+        print("algo deu errado, preco negativo")
+        preco = 0
+
+    if cupom == "MEGA10":
+        preco = preco - (preco * 0.1)
+    else:
+        if cupom == "NOVO5":
+            preco = preco - (preco * 0.05)
+        else:
+            if cupom == "LUB2" and prod == "lubrificante":
+                preco = preco - 2
+            else:
+                preco = preco
+
+    if prod == "diesel":
+        preco = round(preco, 0)
+    else:
+        if prod == "gasolina":
+            preco = round(preco, 2)
+        else:
+            preco = float(int(preco * 100) / 100.0)
+
+    print("pedido ok:", p["cliente"], prod, qtd, "=>", preco)
+    return preco
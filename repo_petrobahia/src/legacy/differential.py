@@ -0,0 +1,200 @@
+"""Comparação diferencial entre o legado original e as fachadas atuais.
+
+Gera pedidos sintéticos (produtos conhecidos e desconhecidos, cupons válidos,
+vazios e inexistentes, quantidades nas fronteiras dos descontos, negativas,
+fracionárias e ``None``) e chama ``calcular_preco`` e ``processar_pedido`` na
+implementação original (``legacy._original``) e nas fachadas. Para cada
+chamada são comparados o texto impresso, o tipo e o ``repr`` do retorno e,
+quando há exceção, o seu tipo.
+
+Os pedidos são processados em blocos: cada implementação roda o bloco
+inteiro com a saída redirecionada para um buffer e, só quando os blocos
+diferem, os pedidos são refeitos um a um para apontar o primeiro divergente.
+
+Uso (a partir da pasta ``repo_petrobahia``)::
+
+    PYTHONPATH=src python -m legacy.differential --orders 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from legacy import _original, pedido_service, preco_calculadora
+
+PRODUCTS = ("diesel", "gasolina", "etanol", "lubrificante", "querosene", None)
+COUPONS = (None, None, "", "MEGA10", "NOVO5", "LUB2", "XPTO")
+# Fronteiras das faixas de desconto de cada produto.
+EDGE_QUANTITIES = (0, 1, 80, 81, 200, 201, 500, 501, 1000, 1001, -1, -250)
+# O gabarito ainda soma o lubrificante unidade a unidade.
+MAX_LUBRICANT_UNITS = 500
+
+ENTRY_POINTS = ("calcular_preco", "processar_pedido")
+ORIGINAL = (_original.calcular_preco, _original.processar_pedido)
+FACADE = (preco_calculadora.calcular_preco, pedido_service.processar_pedido)
+
+Outcome = tuple[str, str]
+Implementation = tuple[Callable[..., object], Callable[..., object]]
+Run = tuple[str, list[Outcome]]
+
+
+@dataclass(frozen=True, slots=True)
+class Mismatch:
+    """Pedido cujo resultado difere entre o legado original e a fachada."""
+
+    order: dict
+    entry_point: str
+    original: tuple[str, Outcome]
+    facade: tuple[str, Outcome]
+
+
+@dataclass(slots=True)
+class DifferentialReport:
+    """Resumo de uma comparação."""
+
+    orders: int = 0
+    mismatches: int = 0
+    examples: list[Mismatch] = field(default_factory=list)
+
+    @property
+    def identical(self) -> bool:
+        """Indica se nenhum pedido divergiu."""
+        return self.mismatches == 0
+
+
+def generate_orders(count: int, seed: int = 0) -> Iterator[dict]:
+    """Pedidos sintéticos no formato de dicionário do legado."""
+    rng = random.Random(seed)
+    for number in range(count):
+        product = rng.choice(PRODUCTS)
+        draw = rng.random()
+        if draw < 0.15:
+            quantity = rng.choice(EDGE_QUANTITIES)
+        elif product == "lubrificante":
+            quantity = rng.randint(1, MAX_LUBRICANT_UNITS) if draw < 0.95 else 12.0
+        elif draw < 0.6:
+            quantity = rng.randint(1, 3000)
+        elif draw < 0.99:
+            quantity = round(rng.uniform(0, 3000), rng.randint(0, 3))
+        else:
+            quantity = None
+        yield {
+            "cliente": f"cliente{number}",
+            "produto": product,
+            "qtd": quantity,
+            "cupom": rng.choice(COUPONS),
+        }
+
+
+def _outcome(call: Callable[[], object]) -> Outcome:
+    try:
+        result = call()
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return ("raise", type(exc).__name__)
+    return (type(result).__name__, repr(result))
+
+
+def _captured(call: Callable[[], object]) -> tuple[str, Outcome]:
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        outcome = _outcome(call)
+    return buffer.getvalue(), outcome
+
+
+def _calls(order: dict, implementation: Implementation) -> list[Callable[[], object]]:
+    calcular_preco, processar_pedido = implementation
+    return [
+        lambda: calcular_preco(order["produto"], order["qtd"]),
+        lambda: processar_pedido(order),
+    ]
+
+
+def _run(orders: list[dict], implementation: Implementation) -> Run:
+    """Saída impressa do bloco e resultado de cada chamada."""
+    outcomes = []
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        for order in orders:
+            outcomes.extend(_outcome(call) for call in _calls(order, implementation))
+    return buffer.getvalue(), outcomes
+
+
+def _mismatch(order: dict) -> Mismatch | None:
+    """Primeira função que diverge para o pedido, ou ``None``."""
+    calls = zip(ENTRY_POINTS, _calls(order, ORIGINAL), _calls(order, FACADE))
+    for entry_point, original, facade in calls:
+        original, facade = _captured(original), _captured(facade)
+        if original != facade:
+            return Mismatch(order, entry_point, original, facade)
+    return None
+
+
+def compare(
+    orders: Iterable[dict],
+    *,
+    chunk_size: int = 10_000,
+    max_examples: int = 5,
+    progress: Callable[[DifferentialReport], None] | None = None,
+) -> DifferentialReport:
+    """Compara o legado original com as fachadas para todos os ``orders``."""
+    report = DifferentialReport()
+    iterator = iter(orders)
+    while chunk := list(islice(iterator, chunk_size)):
+        report.orders += len(chunk)
+        if _run(chunk, ORIGINAL) != _run(chunk, FACADE):
+            for mismatch in filter(None, map(_mismatch, chunk)):
+                report.mismatches += 1
+                if len(report.examples) < max_examples:
+                    report.examples.append(mismatch)
+        if progress is not None:
+            progress(report)
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Executa a comparação e retorna 1 se houver divergência."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+
+    def progress(report: DifferentialReport) -> None:
+        elapsed = time.perf_counter() - start
+        print(
+            f"\r{report.orders:,} pedidos, {report.mismatches} divergentes, "
+            f"{report.orders / elapsed:,.0f} pedidos/s",
+            end="",
+            file=sys.stderr,
+        )
+
+    report = compare(
+        generate_orders(args.orders, args.seed),
+        chunk_size=args.chunk_size,
+        progress=progress,
+    )
+    print(file=sys.stderr)
+    for mismatch in report.examples:
+        print(f"pedido {mismatch.order} ({mismatch.entry_point})")
+        print(f"  original: {mismatch.original!r}")
+        print(f"  fachada:  {mismatch.facade!r}")
+    status = "identicos" if report.identical else "DIVERGENTES"
+    print(
+        f"{report.orders} pedidos comparados, {report.mismatches} divergentes: "
+        f"{status}"
+    )
+    return 0 if report.identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
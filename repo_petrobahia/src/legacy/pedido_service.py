@@ -1,6 +1,20 @@
-from legacy.preco_calculadora import calcular_preco
+"""Fachada de compatibilidade para o processamento de pedidos do legado.
+
+``processar_pedido`` mantém a assinatura, as mensagens impressas e os tipos de
+retorno do código antigo (``0`` inteiro para quantidade zero, preço negativo
+zerado como inteiro), mas o preço, o cupom e o arredondamento vêm do
+``OrderProcessor`` padrão. ``python -m legacy.differential`` compara esta
+fachada com a implementação original.
+"""
+
+from __future__ import annotations
+
+from legacy.preco_calculadora import calcular_preco, default_processor
+from petrobahia.models import Order
+
 
 def processar_pedido(p):
+    """Processa o pedido ``p`` (dicionário do legado) e retorna o preço final."""
     prod = p.get("produto")
     qtd = p.get("qtd")
     cupom = p.get("cupom")
@@ -14,24 +28,12 @@ def processar_pedido(p):
         print("algo deu errado, preco negativo")
         preco = 0
 
-    if cupom == "MEGA10":
-        preco = preco - (preco * 0.1)
-    else:
-        if cupom == "NOVO5":
-            preco = preco - (preco * 0.05)
-        else:
-            if cupom == "LUB2" and prod == "lubrificante":
-                preco = preco - 2
-            else:
-                preco = preco
-
-    if prod == "diesel":
-        preco = round(preco, 0)
-    else:
-        if prod == "gasolina":
-            preco = round(preco, 2)
-        else:
-            preco = float(int(preco * 100) / 100.0)
+    processor = default_processor()
+    order = Order(
+        customer_name=p.get("cliente", ""), product=prod, quantity=qtd, coupon=cupom
+    )
+    preco = processor.discount_engine.apply(preco, order)
+    preco = processor.apply_rounding(order, preco)
 
     print("pedido ok:", p["cliente"], prod, qtd, "=>", preco)
     return preco
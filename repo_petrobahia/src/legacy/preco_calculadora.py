@@ -1,3 +1,23 @@
+"""Fachada de compatibilidade para o cálculo de preços do legado.
+
+``calcular_preco`` mantém a assinatura, as mensagens impressas e os tipos de
+retorno do código antigo, mas delega o cálculo às estratégias do
+``OrderProcessor`` padrão (``petrobahia.orders``). Peculiaridades
+preservadas: produto desconhecido devolve o inteiro ``0``; lubrificante não
+imprime nada e segue a semântica de ``range(qtd)`` do antigo laço (exige
+quantidade inteira e devolve ``0`` para quantidades não positivas), agora
+sem custo proporcional à quantidade.
+"""
+
+from __future__ import annotations
+
+import operator
+
+from petrobahia.models import Order
+from petrobahia.orders import OrderProcessor, build_default_order_processor
+from petrobahia.pricing import UnknownProductStrategy
+
+# Preços base do legado, mantidos para quem ainda os importa daqui.
 BASES = {
     "diesel": 3.99,
     "gasolina": 5.19,
@@ -5,38 +25,31 @@ BASES = {
     "lubrificante": 25.0,
 }
 
+_processor: OrderProcessor | None = None
+
+
+def default_processor() -> OrderProcessor:
+    """Processador compartilhado pelas fachadas, criado na primeira chamada."""
+    global _processor  # pylint: disable=global-statement
+    if _processor is None:
+        _processor = build_default_order_processor()
+    return _processor
+
+
 def calcular_preco(tipo, qtd):
-    if tipo == "diesel":
-        if qtd > 1000:
-            preco = (BASES["diesel"] * qtd) * 0.9
-        else:
-            if qtd > 500:
-                preco = (BASES["diesel"] * qtd) * 0.95
-            else:
-                preco = BASES["diesel"] * qtd
-        print("calc diesel", preco)
-        return preco
-    else:
-        if tipo == "gasolina":
-            if qtd > 200:
-                preco = (BASES["gasolina"] * qtd) - 100
-            else:
-                preco = BASES["gasolina"] * qtd
-            print("calc gas", preco)
-            return preco
-        else:
-            if tipo == "etanol":
-                preco = BASES["etanol"] * qtd
-                if qtd > 80:
-                    preco = preco * 0.97
-                print("calc eta", preco)
-                return preco
-            else:
-                if tipo == "lubrificante":
-                    x = 0
-                    for i in range(qtd):
-                        x = x + BASES["lubrificante"]
-                    return x
-                else:
-                    print("tipo desconhecido, devolvendo 0")
-                    return 0
+    """Preço do pedido antes de cupom e arredondamento, como no legado."""
+    if tipo == "lubrificante":
+        qtd = operator.index(qtd)
+        if qtd <= 0:
+            return 0
+
+    order = Order(customer_name="", product=tipo, quantity=qtd)
+    strategy = default_processor().price_calculator.select(order)
+    if isinstance(strategy, UnknownProductStrategy):
+        print(strategy.message)
+        return 0
+
+    preco = strategy.calculate(order)
+    if tipo != "lubrificante":
+        print(strategy.debug_message(preco))
+    return preco
@@ -3,6 +3,29 @@
 Os módulos deste pacote substituem o código contido em ``legacy`` e
 organizam as responsabilidades em torno de clientes, pedidos,
 precificação e descontos seguindo PEP8, Clean Code e princípios SOLID.
+
+Importar o pacote não importa os submódulos: ``Customer`` e ``Order`` são
+carregados no primeiro acesso (PEP 562), e cada script paga apenas pelos
+módulos que usa.
 """
 
-from .models import Customer, Order  # noqa: F401
+import logging
+
+__all__ = ["Customer", "Order"]
+
+# Sem configuração explícita (ver ``petrobahia.logs``) o pacote não emite logs.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import models  # pylint: disable=import-outside-toplevel
+
+    value = getattr(models, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,49 @@
+"""Utilitários para as APIs colunares (em lote) baseadas em NumPy."""
+
+from __future__ import annotations
+
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from numpy import ndarray
+
+
+def require_numpy() -> ModuleType:
+    """Importa o NumPy sob demanda.
+
+    O NumPy só é necessário para as APIs em lote; o fluxo escalar continua
+    funcionando sem ele instalado.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:  # pragma: no cover - depende do ambiente
+        raise ImportError(
+            "As APIs em lote exigem o pacote numpy (pip install numpy)."
+        ) from exc
+    return numpy
+
+
+def group_rows(*columns: ndarray) -> Iterator[tuple[tuple[str, ...] | str, ndarray]]:
+    """Agrupa as linhas de um lote pelos valores das colunas informadas.
+
+    Produz pares ``(chave, indices)``, em que a chave é o valor da coluna (ou
+    uma tupla de valores quando há mais de uma coluna) e ``indices`` são as
+    posições das linhas do grupo, em ordem crescente.
+    """
+    np = require_numpy()
+    if len(columns[0]) == 0:
+        return
+    group_ids = np.zeros(len(columns[0]), dtype=np.int64)
+    for column in columns:
+        values, inverse = np.unique(column, return_inverse=True)
+        group_ids = group_ids * len(values) + inverse.reshape(-1)
+    order = np.argsort(group_ids, kind="stable")
+    sorted_ids = group_ids[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    for start, end in zip(starts, ends):
+        rows = order[start:end]
+        first = rows[0]
+        key = tuple(str(column[first]) for column in columns)
+        yield (key[0] if len(key) == 1 else key), rows
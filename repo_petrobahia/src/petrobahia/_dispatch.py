@@ -0,0 +1,48 @@
+"""Índice de estratégias por chave, usado pelos motores de preço e desconto."""
+
+from __future__ import annotations
+
+from typing import Generic, Protocol, Sequence, TypeVar
+
+from .models import Order
+
+
+class SupportsOrder(Protocol):
+    """Estratégias que sabem dizer se atendem um pedido."""
+
+    def supports(self, order: Order) -> bool:
+        """Indica se a estratégia pode ser usada para o pedido informado."""
+
+
+StrategyT = TypeVar("StrategyT", bound=SupportsOrder)
+
+
+class StrategyIndex(Generic[StrategyT]):
+    """Localiza em O(1) a primeira estratégia compatível com uma chave.
+
+    Estratégias que declaram ``dispatch_key`` (produto ou cupom) entram em um
+    dicionário; as demais são consultadas por ``supports``. A posição original
+    de cada estratégia é preservada, de modo que o resultado é sempre o mesmo
+    da varredura linear: vence a primeira estratégia compatível da lista.
+    Uma estratégia com chave deve atender exatamente os pedidos com essa chave.
+    """
+
+    def __init__(self, strategies: Sequence[StrategyT]) -> None:
+        self._by_key: dict[str, tuple[int, StrategyT]] = {}
+        self._predicates: list[tuple[int, StrategyT]] = []
+        for position, strategy in enumerate(strategies):
+            key = getattr(strategy, "dispatch_key", None)
+            if isinstance(key, str):
+                self._by_key.setdefault(key, (position, strategy))
+            else:
+                self._predicates.append((position, strategy))
+
+    def find(self, key: str | None, order: Order) -> StrategyT | None:
+        """Retorna a estratégia para a chave do pedido ou ``None``."""
+        indexed = self._by_key.get(key) if key is not None else None
+        for position, strategy in self._predicates:
+            if indexed is not None and position > indexed[0]:
+                break
+            if strategy.supports(order):
+                return strategy
+        return indexed[1] if indexed is not None else None
@@ -0,0 +1,135 @@
+"""Destino de logs em JSON lines, gravado em segundo plano.
+
+Separado de ``petrobahia.logs`` para que o console não pague pela importação
+de ``json``, ``queue`` e ``logging.handlers``; use pelos nomes reexportados
+em ``petrobahia.logs``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import TextIO
+
+from .logs import PACKAGE_LOGGER, _attach
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formata registros como um objeto JSON por linha.
+
+    Além da mensagem final, preserva o modelo (``msg``) e os argumentos,
+    permitindo agrupar eventos sem interpretar texto livre.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serializa o registro informado em uma linha JSON."""
+        payload = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": str(record.msg),
+            "args": list(record.args) if isinstance(record.args, tuple) else [],
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enfileira o registro sem formatá-lo na thread que gerou o log."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BufferedFileHandler(logging.StreamHandler):
+    """Grava em arquivo bufferizado, descarregando a cada ``flush_every`` linhas."""
+
+    def __init__(self, stream: TextIO, flush_every: int) -> None:
+        super().__init__(stream)
+        self._flush_every = flush_every
+        self._pending = 0
+
+    def flush(self) -> None:
+        """Descarrega o buffer do arquivo."""
+        self._pending = 0
+        super().flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Escreve o registro sem forçar o descarregamento a cada linha."""
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+            return
+        self._pending += 1
+        if self._pending >= self._flush_every:
+            self.flush()
+
+
+class JsonLinesSink:
+    """Destino opcional de logs em JSON lines, gravado de forma assíncrona.
+
+    Os registros são enfileirados pelo código de negócio e escritos por uma
+    thread dedicada em um arquivo com buffer, de modo que um lote grande não
+    fica bloqueado em escrita. Use como gerenciador de contexto ou chame
+    ``start``/``stop`` explicitamente; ``stop`` esvazia a fila antes de fechar.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        level: int = logging.DEBUG,
+        buffer_size: int = 64 * 1024,
+        flush_every: int = 1000,
+    ) -> None:
+        self._path = Path(path)
+        self._level = level
+        self._buffer_size = buffer_size
+        self._flush_every = flush_every
+        self._queue_handler: QueueHandler | None = None
+        self._listener: QueueListener | None = None
+        self._file_handler: logging.Handler | None = None
+
+    def start(self) -> "JsonLinesSink":
+        """Abre o arquivo e passa a receber os logs do pacote."""
+        if self._listener is not None:
+            return self
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        stream = self._path.open(
+            "a", encoding="utf-8", buffering=self._buffer_size
+        )
+        self._file_handler = _BufferedFileHandler(stream, self._flush_every)
+        self._file_handler.setFormatter(JsonLinesFormatter())
+
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._queue_handler = _DeferredQueueHandler(records)
+        self._queue_handler.setLevel(self._level)
+        self._listener = QueueListener(records, self._file_handler)
+        self._listener.start()
+        _attach(self._queue_handler, self._level)
+        return self
+
+    def stop(self) -> None:
+        """Remove o destino, grava os registros pendentes e fecha o arquivo."""
+        if self._listener is None:
+            return
+        logging.getLogger(PACKAGE_LOGGER).removeHandler(self._queue_handler)
+        self._listener.stop()
+        self._file_handler.flush()
+        self._file_handler.stream.close()
+        self._file_handler.close()
+        self._listener = None
+        self._queue_handler = None
+        self._file_handler = None
+
+    def __enter__(self) -> "JsonLinesSink":
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
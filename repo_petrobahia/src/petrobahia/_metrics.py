@@ -0,0 +1,51 @@
+"""Estruturas de métricas compartilhadas pelos módulos do pacote."""
+
+from __future__ import annotations
+
+import math
+
+
+class Log2Histogram:
+    """Histograma com faixas em potências de dois e memória constante.
+
+    Cada valor é contado na menor faixa ``2**k`` que o contém (valores até 1
+    ficam na faixa 1). Percentis são aproximados pelo limite superior da faixa.
+    """
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Contabiliza um valor não negativo."""
+        bucket = 1 if value <= 1 else 1 << math.ceil(math.log2(value))
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        """Média dos valores registrados (0 sem registros)."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Limite superior da faixa que contém o percentil ``fraction``."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return float(min(bucket, self.max))
+        return self.max
+
+    def snapshot(self) -> dict[int, int]:
+        """Cópia das contagens por faixa, em ordem crescente."""
+        return dict(sorted(self.buckets.items()))
@@ -0,0 +1,23 @@
+"""Utilitários comuns às conexões SQLite dos repositórios e filas."""
+
+from __future__ import annotations
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+def synchronous_mode(value: str | int) -> str:
+    """Valida o nível do ``PRAGMA synchronous`` e devolve o seu nome.
+
+    Aceita os nomes do SQLite (sem diferenciar maiúsculas) ou os números de
+    0 a 3. O valor entra no texto do ``PRAGMA``, que não aceita parâmetros,
+    então qualquer outro valor lança ``ValueError``.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        if 0 <= value < len(SYNCHRONOUS_MODES):
+            return SYNCHRONOUS_MODES[value]
+    elif isinstance(value, str) and value.upper() in SYNCHRONOUS_MODES:
+        return value.upper()
+    raise ValueError(
+        f"PRAGMA synchronous inválido: {value!r} "
+        f"(use {', '.join(SYNCHRONOUS_MODES)} ou 0 a 3)"
+    )
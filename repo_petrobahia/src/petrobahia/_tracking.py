@@ -0,0 +1,86 @@
+"""Versão global da configuração de precificação.
+
+Estratégias de preço e desconto e a tabela ``BASE_PRICES`` incrementam esta
+versão sempre que um de seus parâmetros muda, permitindo que caches de
+resultados se invalidem sem comparar a configuração a cada consulta.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any
+
+_counter = itertools.count(1)
+_current = 0
+
+
+def current_version() -> int:
+    """Versão atual da configuração de precificação."""
+    return _current
+
+
+def bump_version() -> None:
+    """Registra que algum parâmetro de precificação mudou."""
+    global _current  # pylint: disable=global-statement
+    _current = next(_counter)
+
+
+class TrackedConfig:
+    """Mixin que incrementa a versão quando um atributo muda após a criação.
+
+    As atribuições do ``__init__`` da dataclass (inclusive via
+    ``dataclasses.replace``) não contam: criar uma estratégia não invalida os
+    caches. Subclasses que definirem ``__post_init__`` devem chamar o da base
+    ao final.
+    """
+
+    __slots__ = ("_initialized",)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_initialized", True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        initialized = getattr(self, "_initialized", False)
+        object.__setattr__(self, name, value)
+        if initialized:
+            bump_version()
+
+
+class TrackedDict(dict):
+    """Dicionário que incrementa a versão a cada alteração."""
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        bump_version()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        bump_version()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Atualiza o dicionário e incrementa a versão."""
+        super().update(*args, **kwargs)
+        bump_version()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """Insere a chave se ausente e incrementa a versão."""
+        value = super().setdefault(key, default)
+        bump_version()
+        return value
+
+    def pop(self, *args: Any) -> Any:
+        """Remove a chave e incrementa a versão."""
+        value = super().pop(*args)
+        bump_version()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        """Remove o último item e incrementa a versão."""
+        item = super().popitem()
+        bump_version()
+        return item
+
+    def clear(self) -> None:
+        """Esvazia o dicionário e incrementa a versão."""
+        super().clear()
+        bump_version()
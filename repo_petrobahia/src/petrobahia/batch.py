@@ -0,0 +1,219 @@
+"""Representação compacta de lotes de pedidos em arrays tipados.
+
+Cada ``Order`` é um objeto Python próprio; milhões de pedidos custam
+gigabytes. ``OrderBatch`` guarda as mesmas informações em colunas (``array``)
+com clientes, produtos e cupons internados em tabelas, oferece fatias sem
+cópia e expõe as colunas como arrays NumPy para ``process_batch``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, overload
+
+from ._arrays import require_numpy
+from .models import Order
+from .orders import map_order
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from numpy import ndarray
+
+NO_COUPON = -1
+
+
+class OrderView:
+    """Visão leve de uma linha do lote, compatível com ``Order``.
+
+    Expõe os mesmos atributos lidos pelas estratégias de preço e desconto,
+    buscando os valores nas colunas do lote sob demanda.
+    """
+
+    __slots__ = ("_batch", "_row")
+
+    def __init__(self, batch: OrderBatch, row: int) -> None:
+        self._batch = batch
+        self._row = row
+
+    @property
+    def customer_name(self) -> str:
+        """Nome do cliente do pedido."""
+        batch = self._batch
+        return batch.customer_table[batch.customer_ids[self._row]]
+
+    @property
+    def product(self) -> str:
+        """Código do produto do pedido."""
+        batch = self._batch
+        return batch.product_table[batch.product_ids[self._row]]
+
+    @property
+    def quantity(self) -> float:
+        """Quantidade pedida."""
+        return self._batch.quantities[self._row]
+
+    @property
+    def coupon(self) -> str | None:
+        """Cupom do pedido ou ``None``."""
+        batch = self._batch
+        coupon_id = batch.coupon_ids[self._row]
+        return None if coupon_id == NO_COUPON else batch.coupon_table[coupon_id]
+
+    def to_order(self) -> Order:
+        """Materializa a linha como ``Order``."""
+        return Order(
+            customer_name=self.customer_name,
+            product=self.product,
+            quantity=self.quantity,
+            coupon=self.coupon,
+        )
+
+    def __repr__(self) -> str:
+        return f"OrderView({self.to_order()!r})"
+
+
+class OrderBatch:
+    """Lote imutável de pedidos armazenado em colunas tipadas.
+
+    As colunas são ``memoryview`` somente leitura sobre ``array``: fatiar o
+    lote (``batch[10:20]``) cria apenas novas visões, sem copiar dados. As
+    tabelas de clientes, produtos e cupons são compartilhadas entre fatias.
+    """
+
+    __slots__ = (
+        "customer_table",
+        "product_table",
+        "coupon_table",
+        "customer_ids",
+        "product_ids",
+        "quantities",
+        "coupon_ids",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        customer_table: list[str],
+        product_table: list[str],
+        coupon_table: list[str],
+        customer_ids: memoryview,
+        product_ids: memoryview,
+        quantities: memoryview,
+        coupon_ids: memoryview,
+    ) -> None:
+        self.customer_table = customer_table
+        self.product_table = product_table
+        self.coupon_table = coupon_table
+        self.customer_ids = customer_ids
+        self.product_ids = product_ids
+        self.quantities = quantities
+        self.coupon_ids = coupon_ids
+
+    @classmethod
+    def from_orders(cls, orders: Iterable[Order]) -> OrderBatch:
+        """Constrói o lote a partir de objetos com a interface de ``Order``."""
+        builder = OrderBatchBuilder()
+        for order in orders:
+            builder.append(
+                order.customer_name, order.product, order.quantity, order.coupon
+            )
+        return builder.build()
+
+    @classmethod
+    def from_payloads(cls, payloads: Iterable[Mapping[str, object]]) -> OrderBatch:
+        """Constrói o lote a partir de dicionários no formato de ``PEDIDOS``."""
+        builder = OrderBatchBuilder()
+        for payload in payloads:
+            order = map_order(payload)
+            builder.append(
+                order.customer_name, order.product, order.quantity, order.coupon
+            )
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.quantities)
+
+    @overload
+    def __getitem__(self, index: int) -> OrderView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> OrderBatch: ...
+
+    def __getitem__(self, index: int | slice) -> OrderView | OrderBatch:
+        if isinstance(index, slice):
+            return OrderBatch(
+                customer_table=self.customer_table,
+                product_table=self.product_table,
+                coupon_table=self.coupon_table,
+                customer_ids=self.customer_ids[index],
+                product_ids=self.product_ids[index],
+                quantities=self.quantities[index],
+                coupon_ids=self.coupon_ids[index],
+            )
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("índice fora do lote")
+        return OrderView(self, index)
+
+    def __iter__(self) -> Iterator[OrderView]:
+        for row in range(len(self)):
+            yield OrderView(self, row)
+
+    def columns(self) -> tuple[ndarray, ndarray, ndarray]:
+        """Colunas (produtos, quantidades, cupons) para ``process_batch``.
+
+        As quantidades são uma visão NumPy sem cópia; produtos e cupons são
+        decodificados das tabelas com uma única indexação vetorizada.
+        """
+        np = require_numpy()
+        products = np.asarray(self.product_table, dtype=str)[
+            np.asarray(self.product_ids)
+        ]
+        # O índice -1 (sem cupom) aponta para o texto vazio acrescentado ao fim.
+        coupons = np.asarray(self.coupon_table + [""], dtype=str)[
+            np.asarray(self.coupon_ids)
+        ]
+        quantities = np.asarray(self.quantities)
+        return products, quantities, coupons
+
+
+class OrderBatchBuilder:
+    """Acumula pedidos em colunas tipadas, internando textos repetidos."""
+
+    def __init__(self) -> None:
+        self._customers: dict[str, int] = {}
+        self._products: dict[str, int] = {}
+        self._coupons: dict[str, int] = {}
+        self._customer_ids = array("I")
+        self._product_ids = array("I")
+        self._quantities = array("d")
+        self._coupon_ids = array("i")
+
+    def append(
+        self,
+        customer_name: str,
+        product: str,
+        quantity: float,
+        coupon: str | None = None,
+    ) -> None:
+        """Acrescenta um pedido ao lote em construção."""
+        customers, products, coupons = self._customers, self._products, self._coupons
+        self._customer_ids.append(customers.setdefault(customer_name, len(customers)))
+        self._product_ids.append(products.setdefault(product, len(products)))
+        self._quantities.append(quantity)
+        self._coupon_ids.append(
+            NO_COUPON if coupon is None else coupons.setdefault(coupon, len(coupons))
+        )
+
+    def build(self) -> OrderBatch:
+        """Congela as colunas acumuladas em um ``OrderBatch``."""
+        return OrderBatch(
+            customer_table=list(self._customers),
+            product_table=list(self._products),
+            coupon_table=list(self._coupons),
+            customer_ids=memoryview(self._customer_ids).toreadonly(),
+            product_ids=memoryview(self._product_ids).toreadonly(),
+            quantities=memoryview(self._quantities).toreadonly(),
+            coupon_ids=memoryview(self._coupon_ids).toreadonly(),
+        )
@@ -0,0 +1,97 @@
+"""Cache de preços para pedidos repetidos (produto, quantidade, cupom)."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Hashable, TypeVar
+
+from ._tracking import current_version
+
+ValueT = TypeVar("ValueT")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Contadores de uso do cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração das consultas atendidas pelo cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PricingCache:
+    """Cache LRU limitado e seguro para uso concorrente.
+
+    É invalidado automaticamente quando qualquer parâmetro de precificação
+    muda (``unit_price`` de uma estratégia, percentual de um cupom,
+    ``BASE_PRICES`` etc.), comparando a versão global da configuração. Um
+    valor calculado durante uma mudança de configuração não é armazenado.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize <= 0:
+            raise ValueError("O cache precisa comportar ao menos um item.")
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._version = current_version()
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], ValueT]
+    ) -> ValueT:
+        """Retorna o valor em cache ou calcula, armazena e retorna."""
+        with self._lock:
+            self._check_version()
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._stats.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self._stats.hits += 1
+                return value
+            version = self._version
+
+        # O cálculo roda fora do lock para não bloquear outros leitores.
+        value = compute()
+
+        with self._lock:
+            self._check_version()
+            if version == self._version:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                if len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+                    self._stats.evictions += 1
+        return value
+
+    def stats(self) -> CacheStats:
+        """Cópia dos contadores atuais."""
+        with self._lock:
+            return replace(self._stats)
+
+    def clear(self) -> None:
+        """Remove todos os itens, mantendo os contadores."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _check_version(self) -> None:
+        version = current_version()
+        if version != self._version:
+            if self._data:
+                self._data.clear()
+                self._stats.invalidations += 1
+            self._version = version
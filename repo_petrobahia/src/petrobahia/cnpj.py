@@ -0,0 +1,95 @@
+"""Verificação dos dígitos verificadores do CNPJ.
+
+O cálculo opera diretamente sobre os bytes ASCII do CNPJ: como o dígito
+``d`` é o byte ``b - 48``, a soma ponderada ``sum(w * d)`` é obtida como
+``sum(w * b) - 48 * sum(w)``, com os pesos e o deslocamento calculados uma
+única vez. Os pesos dos dois dígitos são empacotados em um único inteiro
+(``w1 + w2 << 16``), então as duas somas saem de uma só passada. A versão em
+lote monta um único buffer com todos os CNPJs e faz as duas somas ponderadas
+com um produto de matrizes do NumPy.
+"""
+
+from __future__ import annotations
+
+from operator import mul
+from typing import TYPE_CHECKING, Sequence
+
+from ._arrays import require_numpy
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from numpy import ndarray
+
+CNPJ_LENGTH = 14
+
+FIRST_WEIGHTS = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+SECOND_WEIGHTS = (6,) + FIRST_WEIGHTS
+# Cada soma ponderada cabe em 16 bits (no máximo 9 * 14 * 9 * 48).
+_PACKED_WEIGHTS = tuple(
+    first + (second << 16) for first, second in zip(FIRST_WEIGHTS + (0,), SECOND_WEIGHTS)
+)
+_PACKED_OFFSET = ord("0") * sum(_PACKED_WEIGHTS)
+
+
+def _check_digit(weighted_sum: int) -> int:
+    remainder = weighted_sum % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+# Dígito verificador (como byte ASCII) para cada resto possível da soma.
+_CHECK_BYTE = tuple(ord("0") + _check_digit(remainder) for remainder in range(11))
+
+
+def check_digits_valid(raw: bytes) -> bool:
+    """Indica se os 14 bytes ASCII de ``raw`` formam um CNPJ com DVs corretos.
+
+    Não valida o formato: espera exatamente 14 dígitos ASCII (o chamador já
+    aplicou a regra de formato). CNPJs com todos os dígitos iguais, que
+    passariam no cálculo, são recusados.
+    """
+    if raw.count(raw[0]) == CNPJ_LENGTH:
+        return False
+    sums = sum(map(mul, raw, _PACKED_WEIGHTS)) - _PACKED_OFFSET
+    return (
+        _CHECK_BYTE[(sums & 0xFFFF) % 11] == raw[12]
+        and _CHECK_BYTE[(sums >> 16) % 11] == raw[13]
+    )
+
+
+def is_valid_cnpj(value: str) -> bool:
+    """Formato (14 dígitos ASCII) e dígitos verificadores de um CNPJ."""
+    if len(value) != CNPJ_LENGTH or not value.isascii() or not value.isdigit():
+        return False
+    return check_digits_valid(value.encode("ascii"))
+
+
+def check_digits_valid_many(values: Sequence[str]) -> ndarray:
+    """Versão vetorizada de ``is_valid_cnpj`` para um lote de CNPJs.
+
+    Retorna um array booleano, uma posição por CNPJ. Valores fora do formato
+    são ``False``; a checagem de dígitos também é feita no NumPy.
+    """
+    np = require_numpy()
+    result = np.zeros(len(values), dtype=bool)
+    rows = [row for row, value in enumerate(values) if len(value) == CNPJ_LENGTH]
+    if not rows:
+        return result
+    joined = "".join([values[row] for row in rows])
+    if not joined.isascii():
+        rows = [row for row in rows if values[row].isascii()]
+        joined = "".join([values[row] for row in rows])
+
+    zero = np.uint8(ord("0"))
+    digits = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+    digits = digits.reshape(-1, CNPJ_LENGTH) - zero
+    # Somas pequenas: o produto em float64 é exato e usa o BLAS.
+    weights = np.array(
+        [FIRST_WEIGHTS + (0, 0), SECOND_WEIGHTS + (0,)], dtype=np.float64
+    ).T
+    remainders = (digits @ weights).astype(np.intp) % 11
+    expected = np.array(_CHECK_BYTE, dtype=np.uint8)[remainders] - zero
+
+    valid = (digits < 10).all(axis=1)
+    valid &= (expected == digits[:, 12:]).all(axis=1)
+    valid &= ~(digits == digits[:, :1]).all(axis=1)
+    result[rows] = valid
+    return result
@@ -0,0 +1,160 @@
+"""Agrupamento de pedidos individuais em lotes (micro-batching) com asyncio.
+
+Com o serviço ocupado chegam muitos pedidos isolados por milissegundo, e cada
+chamada a ``OrderProcessor`` paga seu próprio custo fixo. ``OrderCoalescer``
+junta os pedidos recebidos dentro de uma janela curta (ou até ``max_batch``
+pedidos), precifica-os em uma única chamada e devolve cada resultado ao
+``Future`` de quem o pediu.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Sequence
+
+from ._metrics import Log2Histogram
+from .models import Order, PricedOrder
+
+PriceMany = Callable[[Sequence[Order]], Sequence[PricedOrder]]
+
+_Pending = tuple[Order, "asyncio.Future[PricedOrder]", float]
+
+
+@dataclass(frozen=True, slots=True)
+class CoalescerMetrics:
+    """Retrato das métricas do agrupador.
+
+    ``batch_sizes`` e ``added_latency_us`` são histogramas em faixas de
+    potências de dois; a latência adicionada é o tempo, em microssegundos,
+    entre a chegada do pedido e o envio do seu lote para precificação.
+    """
+
+    batches: int
+    orders: int
+    mean_batch_size: float
+    batch_sizes: dict[int, int]
+    mean_added_latency_us: float
+    p99_added_latency_us: float
+    max_added_latency_us: float
+    added_latency_us: dict[int, int]
+
+
+class OrderCoalescer:
+    """Junta pedidos concorrentes em lotes para ``price_many``.
+
+    Um lote é enviado quando atinge ``max_batch`` pedidos ou quando se passam
+    ``window`` segundos desde a chegada do primeiro pedido do lote. Sem
+    ``executor`` a precificação roda no próprio laço de eventos; com ele, o
+    lote é enviado ao executor e o laço continua aceitando pedidos.
+    """
+
+    def __init__(
+        self,
+        price_many: PriceMany,
+        *,
+        window: float = 0.0005,
+        max_batch: int = 256,
+        executor: Executor | None = None,
+    ) -> None:
+        if window < 0 or max_batch < 1:
+            raise ValueError("Janela deve ser >= 0 e max_batch positivo")
+        self._price_many = price_many
+        self._window = window
+        self._max_batch = max_batch
+        self._executor = executor
+        self._pending: list[_Pending] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batch_sizes = Log2Histogram()
+        self._added_latency = Log2Histogram()
+
+    async def price(self, order: Order) -> PricedOrder:
+        """Enfileira o pedido no lote corrente e aguarda o seu resultado."""
+        return await self.submit(order)
+
+    def submit(self, order: Order) -> asyncio.Future[PricedOrder]:
+        """Enfileira o pedido e retorna o ``Future`` do seu resultado.
+
+        Evita criar uma tarefa por pedido; precisa ser chamado de dentro do
+        laço de eventos.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[PricedOrder] = loop.create_future()
+        self._pending.append((order, future, time.perf_counter()))
+        if len(self._pending) >= self._max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._dispatch)
+        return future
+
+    def flush(self) -> None:
+        """Envia imediatamente o lote corrente, sem esperar a janela."""
+        self._dispatch()
+
+    def metrics(self) -> CoalescerMetrics:
+        """Retrato das métricas acumuladas."""
+        sizes, latency = self._batch_sizes, self._added_latency
+        return CoalescerMetrics(
+            batches=sizes.count,
+            orders=int(sizes.total),
+            mean_batch_size=sizes.mean,
+            batch_sizes=sizes.snapshot(),
+            mean_added_latency_us=latency.mean,
+            p99_added_latency_us=latency.percentile(0.99),
+            max_added_latency_us=latency.max,
+            added_latency_us=latency.snapshot(),
+        )
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        now = time.perf_counter()
+        self._batch_sizes.record(len(batch))
+        for _order, _future, arrived in batch:
+            self._added_latency.record((now - arrived) * 1_000_000)
+
+        orders = [order for order, _future, _arrived in batch]
+        if self._executor is None:
+            try:
+                results = self._price_many(orders)
+            except Exception as exc:  # pylint: disable=broad-except
+                _fail(batch, exc)
+            else:
+                _deliver(batch, results)
+            return
+
+        loop = asyncio.get_running_loop()
+        priced = loop.run_in_executor(self._executor, self._price_many, orders)
+        priced.add_done_callback(partial(_deliver_future, batch))
+
+
+def _deliver(batch: list[_Pending], results: Sequence[PricedOrder]) -> None:
+    for (_order, future, _arrived), result in zip(batch, results):
+        if not future.done():
+            future.set_result(result)
+
+
+def _fail(batch: list[_Pending], exc: BaseException) -> None:
+    for _order, future, _arrived in batch:
+        if not future.done():
+            future.set_exception(exc)
+
+
+def _deliver_future(
+    batch: list[_Pending], priced: asyncio.Future[Sequence[PricedOrder]]
+) -> None:
+    if priced.cancelled():
+        for _order, future, _arrived in batch:
+            future.cancel()
+    elif priced.exception() is not None:
+        _fail(batch, priced.exception())
+    else:
+        _deliver(batch, priced.result())
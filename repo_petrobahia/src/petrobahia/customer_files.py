@@ -0,0 +1,285 @@
+"""Leitura em fluxo de arquivos de clientes e migração para TSV.
+
+``FileCustomerRepository`` grava cada cliente como o ``repr`` de um
+dicionário (``{'nome': ..., 'email': ..., 'cnpj': ...}``). Em vez de
+``ast.literal_eval``, as linhas são lidas por expressões regulares
+pré-compiladas: o formato exato gravado pelo repositório, sem escapes, é
+reconhecido por uma única expressão; as demais linhas (outra ordem de
+chaves, aspas duplas, escapes, valores numéricos, ``None``/``True``/``False``)
+passam por um tokenizador do subconjunto de literais que um dicionário
+plano de cliente usa.
+
+``migrate_to_tsv`` converte o arquivo para TSV com cabeçalho ``nome``,
+``email``, ``cnpj``, um cliente por linha, com ``\\``, tabulação e quebras de
+linha escapadas por barra invertida: a leitura de uma linha passa a ser um
+``split``. ``iter_customers`` reconhece os dois formatos pelo cabeçalho e
+produz ``Customer`` sob demanda. Em ambos, uma última linha sem ``\\n``
+(gravação interrompida) é descartada.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Sequence
+
+from .models import Customer
+
+TSV_HEADER = "nome\temail\tcnpj\n"
+_TSV_HEADER_BYTES = TSV_HEADER.encode("ascii")
+
+_STRING = r"""'[^'\\\n]*(?:\\.[^'\\\n]*)*'|"[^"\\\n]*(?:\\.[^"\\\n]*)*\""""
+_PLAIN_STRING = r"'([^'\\\n]*)'"
+# Linha exatamente como ``FileCustomerRepository`` grava: sem escapes ou com
+# qualquer aspa e escape nos valores.
+_PLAIN_LINE = re.compile(
+    rf"\{{'nome': {_PLAIN_STRING}, 'email': {_PLAIN_STRING}, "
+    rf"'cnpj': {_PLAIN_STRING}\}}\s*"
+)
+_QUOTED_LINE = re.compile(
+    rf"\{{'nome': ({_STRING}), 'email': ({_STRING}), 'cnpj': ({_STRING})\}}\s*"
+)
+_TOKEN = re.compile(
+    rf"""(?:
+        (?P<string>{_STRING})
+      | (?P<number>[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<constant>None|True|False)
+      | (?P<punct>[{{}}:,])
+      | (?P<space>\s+)
+      | (?P<error>.)
+    )""",
+    re.VERBOSE | re.DOTALL,
+)
+_ESCAPE = re.compile(
+    r"\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|[0-7]{1,3}|.)"
+)
+_SIMPLE_ESCAPES = {
+    "\\": "\\",
+    "'": "'",
+    '"': '"',
+    "a": "\a",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+_CONSTANTS = {"None": None, "True": True, "False": False}
+
+_TSV_ESCAPE = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_TSV_UNESCAPE = re.compile(r"\\(.)")
+_TSV_ESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+
+@dataclass(slots=True)
+class MigrationStats:
+    """Resultado de uma migração."""
+
+    migrated: int = 0
+    skipped: int = 0
+
+
+def parse_record(line: str) -> dict[str, object]:
+    """Converte uma linha no formato de ``clientes.txt`` em dicionário.
+
+    Aceita dicionários planos com chaves texto e valores texto, numéricos,
+    ``None``, ``True`` ou ``False``, como ``ast.literal_eval`` os leria.
+    Lança ``ValueError`` para qualquer outra coisa.
+    """
+    tokens = _tokenize(line)
+    if len(tokens) < 2 or tokens[0] != ("punct", "{") or tokens[-1] != ("punct", "}"):
+        raise ValueError(f"Linha de cliente inválida: {line!r}")
+    record: dict[str, object] = {}
+    position, last = 1, len(tokens) - 1
+    while position < last:
+        entry = tokens[position : position + 3]
+        if (
+            len(entry) < 3
+            or entry[0][0] != "string"
+            or entry[1] != ("punct", ":")
+            or entry[2][0] == "punct"
+        ):
+            raise ValueError(f"Linha de cliente inválida: {line!r}")
+        record[_unquote(entry[0][1])] = _value(*entry[2])
+        position += 3
+        if position < last:
+            if tokens[position] != ("punct", ","):
+                raise ValueError(f"Linha de cliente inválida: {line!r}")
+            position += 1
+    return record
+
+
+def parse_customer_line(line: str) -> Customer:
+    """Converte uma linha de ``clientes.txt`` em ``Customer``.
+
+    Lança ``ValueError`` quando a linha não está no formato esperado.
+    """
+    match = _PLAIN_LINE.fullmatch(line)
+    if match is not None:
+        return Customer(*match.groups())
+    match = _QUOTED_LINE.fullmatch(line)
+    if match is not None:
+        return Customer(*map(_unquote, match.groups()))
+    record = parse_record(line)
+    try:
+        customer = Customer(
+            name=record["nome"], email=record["email"], cnpj=record["cnpj"]
+        )
+    except KeyError as exc:
+        raise ValueError(f"Linha de cliente inválida: {line!r}") from exc
+    if not all(isinstance(field, str) for field in _fields(customer)):
+        raise ValueError(f"Linha de cliente inválida: {line!r}")
+    return customer
+
+
+def format_tsv_line(customer: Customer) -> str:
+    """Linha TSV de um cliente, com os caracteres especiais escapados."""
+    return (
+        f"{customer.name.translate(_TSV_ESCAPE)}\t"
+        f"{customer.email.translate(_TSV_ESCAPE)}\t"
+        f"{customer.cnpj.translate(_TSV_ESCAPE)}\n"
+    )
+
+
+def parse_tsv_line(line: str) -> Customer:
+    """Converte uma linha TSV (sem o cabeçalho) em ``Customer``."""
+    fields = line.removesuffix("\n").split("\t")
+    if len(fields) != 3:
+        raise ValueError(f"Linha de cliente inválida: {line!r}")
+    if "\\" in line:
+        try:
+            fields = [_TSV_UNESCAPE.sub(_tsv_unescape, field) for field in fields]
+        except KeyError as exc:
+            raise ValueError(f"Linha de cliente inválida: {line!r}") from exc
+    return Customer(*fields)
+
+
+def iter_customers(path: Path, *, strict: bool = False) -> Iterator[Customer]:
+    """Percorre um arquivo de clientes (``repr`` ou TSV) sem carregá-lo inteiro.
+
+    O formato é reconhecido pelo cabeçalho TSV. Linhas inválidas são
+    ignoradas, ou lançam ``ValueError`` com ``strict=True``; uma última linha
+    sem ``\\n`` é sempre descartada.
+    """
+    with Path(path).open("rb") as handle:
+        for number, customer, line in _scan(handle):
+            if customer is not None:
+                yield customer
+            elif strict and line.endswith(b"\n"):
+                raise ValueError(f"{path}:{number}: linha inválida {line!r}")
+
+
+def migrate_to_tsv(source: Path, destination: Path) -> MigrationStats:
+    """Converte ``source`` (``repr`` ou TSV) em TSV em ``destination``.
+
+    A escrita vai para um arquivo temporário ao lado do destino, que só o
+    substitui ao final, após ``fsync``. Linhas inválidas e a última linha
+    incompleta são contadas em ``skipped``.
+    """
+    destination = Path(destination)
+    temporary = destination.with_name(f"{destination.name}.tmp")
+    stats = MigrationStats()
+    with Path(source).open("rb") as reader, temporary.open(
+        "w", encoding="utf-8", newline="\n"
+    ) as writer:
+        writer.write(TSV_HEADER)
+        for _number, customer, _line in _scan(reader):
+            if customer is None:
+                stats.skipped += 1
+                continue
+            writer.write(format_tsv_line(customer))
+            stats.migrated += 1
+        writer.flush()
+        os.fsync(writer.fileno())
+    os.replace(temporary, destination)
+    return stats
+
+
+def _scan(handle: BinaryIO) -> Iterator[tuple[int, Customer | None, bytes]]:
+    """Número, cliente (``None`` se inválida) e conteúdo de cada linha.
+
+    A última linha, se incompleta, é produzida como inválida e encerra a leitura.
+    """
+    first = handle.readline()
+    parse: Callable[[str], Customer]
+    if first == _TSV_HEADER_BYTES:
+        parse, lines, start = parse_tsv_line, handle, 2
+    else:
+        parse, lines, start = parse_customer_line, chain([first], handle), 1
+    for number, raw in enumerate(lines, start):
+        if not raw.endswith(b"\n"):
+            if raw:
+                yield number, None, raw
+            return
+        try:
+            yield number, parse(raw.decode("utf-8")), raw
+        except ValueError:
+            yield number, None, raw
+
+
+def _fields(customer: Customer) -> tuple[object, object, object]:
+    return (customer.name, customer.email, customer.cnpj)
+
+
+def _tokenize(line: str) -> list[tuple[str, str]]:
+    tokens = []
+    for match in _TOKEN.finditer(line):
+        kind = match.lastgroup
+        if kind == "error":
+            raise ValueError(f"Linha de cliente inválida: {line!r}")
+        if kind != "space":
+            tokens.append((kind, match.group()))
+    return tokens
+
+
+def _value(kind: str, text: str) -> object:
+    if kind == "string":
+        return _unquote(text)
+    if kind == "constant":
+        return _CONSTANTS[text]
+    if "." in text or "e" in text or "E" in text:
+        return float(text)
+    return int(text)
+
+
+def _unquote(token: str) -> str:
+    body = token[1:-1]
+    if "\\" not in body:
+        return body
+    return _ESCAPE.sub(_unescape, body)
+
+
+def _unescape(match: re.Match[str]) -> str:
+    code = match.group(1)
+    if len(code) > 1 and code[0] in "xuU":
+        return chr(int(code[1:], 16))
+    if code[0] in "01234567":
+        return chr(int(code, 8))
+    return _SIMPLE_ESCAPES.get(code, "\\" + code)
+
+
+def _tsv_unescape(match: re.Match[str]) -> str:
+    return _TSV_ESCAPES[match.group(1)]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Linha de comando da migração: ``origem.txt destino.tsv``."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(
+        description="Converte um clientes.txt para TSV (um cliente por linha)."
+    )
+    parser.add_argument("source", type=Path, help="arquivo clientes.txt de origem")
+    parser.add_argument("destination", type=Path, help="arquivo TSV de destino")
+    args = parser.parse_args(argv)
+
+    stats = migrate_to_tsv(args.source, args.destination)
+    print(f"{stats.migrated} clientes migrados, {stats.skipped} linhas ignoradas")
+
+
+if __name__ == "__main__":
+    main()
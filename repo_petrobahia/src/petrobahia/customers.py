@@ -2,45 +2,82 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from typing import Mapping
+from typing import TYPE_CHECKING, Mapping
 
+from . import instrumentation
 from .models import Customer
-from .repositories import CustomerRepository
+from .repositories import CustomerRepository, DuplicateCustomerError
 from .validators import CustomerValidator, ValidationResult
 
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from .notifications import NotificationOutbox
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class CustomerService:
-    """Cadastro e validacao de clientes."""
+    """Cadastro e validacao de clientes.
+
+    Com ``outbox``, a mensagem de boas vindas vira um evento na caixa de
+    saida e e enviada depois por um ``NotificationDispatcher``; sem ela, a
+    mensagem e emitida no proprio cadastro, como no legado.
+    """
 
     repository: CustomerRepository
     validator: CustomerValidator
+    outbox: NotificationOutbox | None = None
 
     def register(self, payload: Mapping[str, str]) -> bool:
         """Valida os dados do cliente, salva no repositorio
         e retorna True quando o cadastro e realizado."""
+        recorder = instrumentation.active
+        start = recorder.clock() if recorder is not None else 0
+        customer = self._validated_customer(payload)
+        if recorder is not None:
+            start = recorder.lap("customers.validate", start)
+        if customer is None:
+            if recorder is not None:
+                recorder.count("customers.rejeitados")
+            return False
+
+        try:
+            self.repository.save(customer)
+        except DuplicateCustomerError:
+            logger.warning("cnpj ja cadastrado")
+            return False
+        finally:
+            if recorder is not None:
+                recorder.lap("customers.save", start)
+        if self.outbox is not None:
+            self.outbox.enqueue_welcome(customer)
+        else:
+            logger.info("enviando mensagem de boas vindas para %s", customer.name)
+        if recorder is not None:
+            recorder.count("customers.cadastrados")
+        return True
+
+    def _validated_customer(self, payload: Mapping[str, str]) -> Customer | None:
         registration_result = self.validator.validate_registration(dict(payload))
         self._emit_messages(registration_result)
         if not registration_result.is_valid:
-            return False
+            return None
 
         email_result = self.validator.validate_email(payload["email"])
         self._emit_messages(email_result)
         if not email_result.is_valid:
-            return False
+            return None
 
-        customer = Customer(
+        return Customer(
             name=payload["nome"],
             email=payload["email"],
             cnpj=payload["cnpj"],
         )
-        self.repository.save(customer)
-        print("enviando mensagem de boas vindas para", customer.name)
-        return True
 
     @staticmethod
     def _emit_messages(result: ValidationResult) -> None:
         for message in result.messages:
-            print(message)
+            logger.warning("%s", message)
 
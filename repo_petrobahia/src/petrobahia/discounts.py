@@ -3,10 +3,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Protocol
-
+from typing import TYPE_CHECKING, Iterable, Protocol
+
+from . import instrumentation
+from ._arrays import group_rows, require_numpy
+from ._dispatch import StrategyIndex
+from ._tracking import TrackedConfig
+from .fixed_point import (
+    BASIS_POINTS,
+    from_float,
+    parameter_amount,
+    parameter_basis_points,
+    to_float,
+)
 from .models import Order
 
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from numpy import ndarray
+
 
 class DiscountStrategy(Protocol):
     """Contrato para estratégias de desconto."""
@@ -19,12 +33,17 @@ class DiscountStrategy(Protocol):
 
 
 @dataclass(slots=True)
-class PercentageCouponDiscount:
+class PercentageCouponDiscount(TrackedConfig):
     """Desconto percentual aplicado via cupom."""
 
     coupon_code: str
     percentage: float  # 0.1 = 10%
 
+    @property
+    def dispatch_key(self) -> str:
+        """Cupom atendido, usado pelo índice do ``DiscountEngine``."""
+        return self.coupon_code
+
     def supports(self, order: Order) -> bool:
         """Retorna True se o cupom do pedido for o mesmo desta estratégia."""
         return order.coupon == self.coupon_code
@@ -33,15 +52,31 @@ class PercentageCouponDiscount:
         """Aplica a porcentagem configurada ao preço informado."""
         return price - (price * self.percentage)
 
+    def apply_array(self, prices: ndarray) -> ndarray:
+        """Versão vetorizada de ``apply`` para um lote de preços."""
+        return prices - (prices * self.percentage)
+
+    def apply_fixed(self, amount: int, _order: Order) -> int:
+        """Versão em ponto fixo de ``apply``, com a taxa em pontos-base."""
+        discount = amount * parameter_basis_points(self.percentage) // BASIS_POINTS
+        return amount - discount
+
 
 @dataclass(slots=True)
-class FlatCouponDiscount:
+class FlatCouponDiscount(TrackedConfig):
     """Desconto fixo aplicado via cupom."""
 
     coupon_code: str
     value: float
     required_product: str | None = None
 
+    @property
+    def dispatch_key(self) -> str | None:
+        """Cupom atendido; ``None`` quando depende também do produto."""
+        if self.required_product:
+            return None
+        return self.coupon_code
+
     def supports(self, order: Order) -> bool:
         """Verifica se o desconto é aplicável ao pedido."""
         if order.coupon != self.coupon_code:
@@ -54,18 +89,120 @@ class FlatCouponDiscount:
         """Aplica o desconto ao preço."""
         return price - self.value
 
+    def apply_array(self, prices: ndarray) -> ndarray:
+        """Versão vetorizada de ``apply`` para um lote de preços."""
+        return prices - self.value
+
+    def apply_fixed(self, amount: int, _order: Order) -> int:
+        """Versão em ponto fixo de ``apply``, com o valor em centavos."""
+        return amount - parameter_amount(self.value)
+
 
 # pylint: disable=R0903  # motor tem apenas a operação de aplicar descontos
 class DiscountEngine:
     """Aplica a primeira estratégia compatível com o pedido."""
 
-    def __init__(self, strategies: Iterable[DiscountStrategy]) -> None:
-        """Inicializa o motor de descontos com as estratégias fornecidas."""
+    def __init__(
+        self, strategies: Iterable[DiscountStrategy], *, indexed: bool = True
+    ) -> None:
+        """Inicializa o motor de descontos com as estratégias fornecidas.
+
+        Com ``indexed=True`` as estratégias que declaram ``dispatch_key`` são
+        indexadas por cupom; com ``False`` a escolha é uma varredura linear.
+        """
         self._strategies = list(strategies)
+        self._index = StrategyIndex(self._strategies) if indexed else None
 
     def apply(self, price: float, order: Order) -> float:
         """Aplica o desconto ao preço do pedido, se aplicável."""
+        recorder = instrumentation.active
+        if recorder is None:
+            strategy = self._select(order)
+            if strategy is None:
+                return price
+            return strategy.apply(price, order)
+
+        start = recorder.clock()
+        strategy = self._select(order)
+        start = recorder.lap("discounts.select", start)
+        if strategy is None:
+            recorder.count("discounts.sem_desconto")
+            return price
+        price = strategy.apply(price, order)
+        recorder.lap("discounts.apply", start)
+        recorder.count(f"discounts.{type(strategy).__name__}")
+        return price
+
+    def apply_fixed(self, amount: int, order: Order) -> int:
+        """Versão em ponto fixo de ``apply``, em subcentavos inteiros.
+
+        Estratégias sem ``apply_fixed`` recebem o valor em ``float`` e o
+        resultado volta com precisão de centavo.
+        """
+        recorder = instrumentation.active
+        if recorder is None:
+            strategy = self._select(order)
+            if strategy is None:
+                return amount
+            return self._apply_fixed(strategy, amount, order)
+
+        start = recorder.clock()
+        strategy = self._select(order)
+        start = recorder.lap("discounts.select", start)
+        if strategy is None:
+            recorder.count("discounts.sem_desconto")
+            return amount
+        amount = self._apply_fixed(strategy, amount, order)
+        recorder.lap("discounts.apply", start)
+        recorder.count(f"discounts.{type(strategy).__name__}")
+        return amount
+
+    def apply_batch(
+        self, prices: ndarray, products: ndarray, coupons: ndarray
+    ) -> ndarray:
+        """Aplica os descontos a um lote colunar de preços.
+
+        As linhas são agrupadas por par (cupom, produto) e cada grupo recebe a
+        estratégia que ``apply`` escolheria. Cupom vazio equivale a ``None``.
+        """
+        np = require_numpy()
+        result = np.array(prices, dtype=float)
+        products = np.asarray(products, dtype=str)
+        coupons = normalize_coupons(coupons)
+        for (coupon, product), rows in group_rows(coupons, products):
+            if not coupon:
+                continue
+            order = Order(
+                customer_name="", product=product, quantity=0, coupon=coupon
+            )
+            strategy = self._select(order)
+            if strategy is None:
+                continue
+            apply_array = getattr(strategy, "apply_array", None)
+            if apply_array is not None:
+                result[rows] = apply_array(result[rows])
+            else:
+                result[rows] = [strategy.apply(price, order) for price in result[rows]]
+        return result
+
+    @staticmethod
+    def _apply_fixed(strategy: DiscountStrategy, amount: int, order: Order) -> int:
+        apply_fixed = getattr(strategy, "apply_fixed", None)
+        if apply_fixed is None:
+            return from_float(strategy.apply(to_float(amount), order))
+        return apply_fixed(amount, order)
+
+    def _select(self, order: Order) -> DiscountStrategy | None:
+        if self._index is not None:
+            return self._index.find(order.coupon, order)
         for strategy in self._strategies:
             if strategy.supports(order):
-                return strategy.apply(price, order)
-        return price
+                return strategy
+        return None
+
+
+def normalize_coupons(coupons: object) -> ndarray:
+    """Converte uma coluna de cupons em texto, trocando ``None`` por vazio."""
+    np = require_numpy()
+    values = np.asarray(coupons, dtype=object)
+    return np.where(values == None, "", values).astype(str)  # noqa: E711
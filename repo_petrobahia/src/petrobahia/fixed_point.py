@@ -0,0 +1,117 @@
+"""Aritmética de ponto fixo para o modo inteiro de precificação.
+
+No modo ``fixed_point`` do ``OrderProcessor`` os valores não passam por
+``float``: quantidades viram mililitros inteiros, preços unitários e
+descontos fixos viram centavos inteiros e percentuais viram pontos-base
+(1/10000). Durante o cálculo o valor é carregado em subcentavos
+(``SUBUNITS`` por centavo), escala em que preço × mililitros e até duas
+taxas sucessivas (desconto por volume e cupom percentual) continuam inteiros
+exatos. O arredondamento final para centavos é uma operação inteira
+explícita, sem a deriva de ``float(int(price * 100) / 100.0)``.
+
+Os parâmetros das estratégias continuam em ``float`` (``unit_price``,
+``percentage``...); a conversão para inteiros é memorizada por valor
+(``unit_factor``, ``parameter_amount``, ``parameter_basis_points``), pois um
+``round`` por pedido custaria mais que o próprio cálculo.
+"""
+
+from __future__ import annotations
+
+CENTAVOS_PER_REAL = 100
+ML_PER_LITER = 1000
+BASIS_POINTS = 10_000
+
+# Subcentavos por centavo: mililitros e duas taxas em pontos-base.
+SUBUNITS = ML_PER_LITER * BASIS_POINTS * BASIS_POINTS
+# Preço em centavos/litro × quantidade em mL resulta em milésimos de centavo.
+_SUBUNITS_PER_ML_CENTAVO = SUBUNITS // ML_PER_LITER
+# Limite de valores distintos memorizados por conversão.
+_MEMO_LIMIT = 4096
+
+_unit_factors: dict[float, int] = {}
+_amounts: dict[float, int] = {}
+_basis_points: dict[float, int] = {}
+
+
+def to_milliliters(quantity: float) -> int:
+    """Quantidade em litros para mililitros inteiros (arredondada)."""
+    return round(quantity * ML_PER_LITER)
+
+
+def to_centavos(value: float) -> int:
+    """Valor em reais para centavos inteiros (arredondado)."""
+    return round(value * CENTAVOS_PER_REAL)
+
+
+def to_basis_points(rate: float) -> int:
+    """Taxa (``0.1`` = 10%) em pontos-base inteiros."""
+    return round(rate * BASIS_POINTS)
+
+
+def subtotal(unit_centavos: int, quantity_ml: int) -> int:
+    """Preço unitário (centavos por litro) × quantidade, em subcentavos."""
+    return unit_centavos * quantity_ml * _SUBUNITS_PER_ML_CENTAVO
+
+
+def _memoized(cache: dict[float, int], value: float, converted: int) -> int:
+    if len(cache) >= _MEMO_LIMIT:
+        cache.clear()
+    cache[value] = converted
+    return converted
+
+
+def unit_factor(unit_price: float) -> int:
+    """Subcentavos por mililitro de um preço em reais por litro."""
+    factor = _unit_factors.get(unit_price)
+    if factor is None:
+        factor = _memoized(
+            _unit_factors, unit_price, subtotal(to_centavos(unit_price), 1)
+        )
+    return factor
+
+
+def parameter_amount(value: float) -> int:
+    """Valor em reais de um parâmetro (bônus, desconto fixo) em subcentavos."""
+    amount = _amounts.get(value)
+    if amount is None:
+        amount = _memoized(_amounts, value, from_centavos(to_centavos(value)))
+    return amount
+
+
+def parameter_basis_points(rate: float) -> int:
+    """Taxa de um parâmetro (percentual de cupom) em pontos-base."""
+    basis_points = _basis_points.get(rate)
+    if basis_points is None:
+        basis_points = _memoized(_basis_points, rate, to_basis_points(rate))
+    return basis_points
+
+
+def from_centavos(centavos: int) -> int:
+    """Centavos inteiros em subcentavos."""
+    return centavos * SUBUNITS
+
+
+def from_float(value: float) -> int:
+    """Valor em reais calculado em ``float`` para subcentavos (via centavos)."""
+    return to_centavos(value) * SUBUNITS
+
+
+def truncate(amount: int, unit: int) -> int:
+    """Quantos ``unit`` cabem em ``amount``, truncando em direção a zero."""
+    if amount < 0:
+        return -(-amount // unit)
+    return amount // unit
+
+
+def round_half_even(amount: int, unit: int) -> int:
+    """Quantos ``unit`` há em ``amount``, com empate para o par (como ``round``)."""
+    quotient, remainder = divmod(amount, unit)
+    doubled = 2 * remainder
+    if doubled > unit or (doubled == unit and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def to_float(amount: int) -> float:
+    """Subcentavos em reais, para mensagens e para estratégias sem ponto fixo."""
+    return amount / (SUBUNITS * CENTAVOS_PER_REAL)
@@ -0,0 +1,145 @@
+"""Índices persistentes em disco para arquivos de registros por linha."""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterator
+
+_MAGIC = b"PBIX"
+_HEADER = struct.Struct("<4sIQQQ")  # magic, versao, capacidade, itens, bytes indexados
+_SLOT = struct.Struct("<QQ")  # hash da chave (0 = vazio), offset do registro
+_VERSION = 1
+_MIN_CAPACITY = 1024
+_MAX_LOAD = 0.7
+
+
+def key_hash(key: str) -> int:
+    """Hash estável (independe de ``PYTHONHASHSEED``) e nunca zero."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") | 1
+
+
+class HashIndex:
+    """Tabela hash de endereçamento aberto mapeada em memória.
+
+    Cada posição guarda o hash da chave e o offset do registro no arquivo de
+    dados; a chave em si não é armazenada. Na busca, o registro candidato é
+    lido pelo offset e comparado com a chave procurada, de modo que colisões
+    de hash nunca produzem falsos positivos. A consulta é O(1) e abrir o
+    índice não exige ler o arquivo de dados.
+
+    O cabeçalho registra até que byte do arquivo de dados o índice está
+    atualizado (``indexed_size``), o que permite indexar apenas o trecho
+    acrescentado por outros escritores.
+    """
+
+    def __init__(self, path: Path, capacity: int = _MIN_CAPACITY) -> None:
+        self._path = Path(path)
+        if not self._path.exists():
+            self._create(self._path, capacity)
+        self._open()
+
+    def _open(self) -> None:
+        self._file = self._path.open("r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, version, self._capacity, self._count, self._indexed_size = (
+            _HEADER.unpack_from(self._map, 0)
+        )
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"Arquivo de índice inválido: {self._path}")
+
+    @property
+    def indexed_size(self) -> int:
+        """Quantidade de bytes do arquivo de dados já indexada."""
+        return self._indexed_size
+
+    @indexed_size.setter
+    def indexed_size(self, value: int) -> None:
+        self._indexed_size = value
+        self._write_header()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def candidates(self, key: str) -> Iterator[int]:
+        """Offsets dos registros cujo hash coincide com o da chave."""
+        wanted = key_hash(key)
+        for slot in self._probe(wanted):
+            stored, offset = _SLOT.unpack_from(self._map, slot)
+            if stored == 0:
+                return
+            if stored == wanted:
+                yield offset
+
+    def add(self, key: str, offset: int) -> None:
+        """Insere a chave apontando para o offset informado."""
+        if (self._count + 1) > self._capacity * _MAX_LOAD:
+            self._grow()
+        self._insert(key_hash(key), offset)
+        self._count += 1
+        self._write_header()
+
+    def flush(self) -> None:
+        """Força a gravação das páginas alteradas em disco."""
+        self._map.flush()
+
+    def close(self) -> None:
+        """Grava o índice e libera o mapeamento."""
+        if self._map.closed:
+            return
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+    def _probe(self, hashed: int) -> Iterator[int]:
+        mask = self._capacity - 1
+        position = hashed & mask
+        for _ in range(self._capacity):
+            yield _HEADER.size + position * _SLOT.size
+            position = (position + 1) & mask
+
+    def _insert(self, hashed: int, offset: int) -> None:
+        for slot in self._probe(hashed):
+            if _SLOT.unpack_from(self._map, slot)[0] == 0:
+                _SLOT.pack_into(self._map, slot, hashed, offset)
+                return
+        raise RuntimeError("Índice cheio.")  # pragma: no cover - evitado por _grow
+
+    def _grow(self) -> None:
+        entries = [
+            _SLOT.unpack_from(self._map, _HEADER.size + i * _SLOT.size)
+            for i in range(self._capacity)
+        ]
+        temporary = self._path.with_name(self._path.name + ".tmp")
+        self._create(temporary, self._capacity * 2, self._count, self._indexed_size)
+        self.close()
+        os.replace(temporary, self._path)
+        self._open()
+        for hashed, offset in entries:
+            if hashed:
+                self._insert(hashed, offset)
+
+    def _write_header(self) -> None:
+        _HEADER.pack_into(
+            self._map,
+            0,
+            _MAGIC,
+            _VERSION,
+            self._capacity,
+            self._count,
+            self._indexed_size,
+        )
+
+    @staticmethod
+    def _create(
+        path: Path, capacity: int, count: int = 0, indexed_size: int = 0
+    ) -> None:
+        capacity = max(_MIN_CAPACITY, 1 << (capacity - 1).bit_length())
+        with path.open("wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, _VERSION, capacity, count, indexed_size))
+            handle.truncate(_HEADER.size + capacity * _SLOT.size)
@@ -0,0 +1,168 @@
+"""Instrumentação opcional: tempos por etapa, contadores e perfil de execução.
+
+Desligada por padrão. Os pontos instrumentados (``OrderProcessor``,
+``PriceCalculator``, ``DiscountEngine``, ``CustomerService`` e o pipeline)
+leem ``instrumentation.active`` uma vez por chamada; com ``None`` o custo é
+apenas essa leitura e alguns testes de ``if``. Com um ``Recorder`` ativo,
+cada etapa é medida com ``time.perf_counter_ns`` e agregada em histogramas.
+
+Uso típico::
+
+    with instrumentation.recording() as recorder:
+        run_pipeline(origem, destino)
+    print(recorder.format_summary())
+"""
+
+from __future__ import annotations
+
+import io
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+from ._metrics import Log2Histogram
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    import cProfile
+    import pstats
+
+# Recorder em uso; ``None`` desliga a instrumentação.
+active: Recorder | None = None
+
+
+class Recorder:
+    """Acumula tempos por etapa (em nanossegundos) e contadores nomeados.
+
+    Não usa locks: com várias threads as contagens são aproximadas.
+    """
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def __init__(self) -> None:
+        self.stages: dict[str, Log2Histogram] = {}
+        self.counters: Counter[str] = Counter()
+
+    def lap(self, stage: str, start: int) -> int:
+        """Registra o tempo desde ``start`` na etapa e retorna o instante atual."""
+        now = time.perf_counter_ns()
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = Log2Histogram()
+        histogram.record(now - start)
+        return now
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Incrementa o contador ``name``."""
+        self.counters[name] += amount
+
+    def reset(self) -> None:
+        """Descarta as medições acumuladas."""
+        self.stages.clear()
+        self.counters.clear()
+
+    def summary(self) -> dict[str, dict[str, object]]:
+        """Resumo com chamadas, tempo total e percentis (µs) por etapa."""
+        stages = {
+            name: {
+                "calls": histogram.count,
+                "total_ms": histogram.total / 1e6,
+                "mean_us": histogram.mean / 1e3,
+                "p50_us": histogram.percentile(0.50) / 1e3,
+                "p99_us": histogram.percentile(0.99) / 1e3,
+                "max_us": histogram.max / 1e3,
+            }
+            for name, histogram in sorted(self.stages.items())
+        }
+        return {"stages": stages, "counters": dict(sorted(self.counters.items()))}
+
+    def format_summary(self) -> str:
+        """Resumo em texto, com as etapas ordenadas pelo tempo total."""
+        summary = self.summary()
+        lines = [
+            f"{'etapa':<28} {'chamadas':>10} {'total ms':>10} {'media us':>9} "
+            f"{'p50 us':>8} {'p99 us':>8} {'max us':>9}"
+        ]
+        stages = sorted(
+            summary["stages"].items(), key=lambda item: -item[1]["total_ms"]
+        )
+        for name, stage in stages:
+            lines.append(
+                f"{name:<28} {stage['calls']:>10} {stage['total_ms']:>10.2f} "
+                f"{stage['mean_us']:>9.2f} {stage['p50_us']:>8.2f} "
+                f"{stage['p99_us']:>8.2f} {stage['max_us']:>9.2f}"
+            )
+        if summary["counters"]:
+            lines.append("")
+            lines.append(f"{'contador':<40} {'total':>10}")
+            for name, value in summary["counters"].items():
+                lines.append(f"{name:<40} {value:>10}")
+        return "\n".join(lines)
+
+
+def enable(recorder: Recorder | None = None) -> Recorder:
+    """Liga a instrumentação com ``recorder`` (ou um novo) e o retorna."""
+    global active  # pylint: disable=global-statement
+    active = recorder or Recorder()
+    return active
+
+
+def disable() -> None:
+    """Desliga a instrumentação."""
+    global active  # pylint: disable=global-statement
+    active = None
+
+
+@contextmanager
+def recording(recorder: Recorder | None = None) -> Iterator[Recorder]:
+    """Liga a instrumentação durante o bloco, restaurando o estado anterior."""
+    global active  # pylint: disable=global-statement
+    previous = active
+    current = enable(recorder)
+    try:
+        yield current
+    finally:
+        active = previous
+
+
+class ProfileCapture:
+    """Resultado de ``profiled``: estatísticas do ``cProfile`` do bloco."""
+
+    def __init__(self, profile: cProfile.Profile) -> None:
+        self.profile = profile
+
+    @property
+    def stats(self) -> pstats.Stats:
+        """Estatísticas no formato ``pstats``."""
+        import pstats  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        return pstats.Stats(self.profile)
+
+    def report(self, limit: int = 25, sort: str = "cumulative") -> str:
+        """Relatório em texto das ``limit`` funções mais custosas."""
+        import pstats  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        buffer = io.StringIO()
+        pstats.Stats(self.profile, stream=buffer).sort_stats(sort).print_stats(limit)
+        return buffer.getvalue()
+
+    def dump(self, path: Path) -> None:
+        """Grava as estatísticas para ``python -m pstats`` ou snakeviz."""
+        self.profile.dump_stats(str(path))
+
+
+@contextmanager
+def profiled(path: Path | None = None) -> Iterator[ProfileCapture]:
+    """Executa o bloco sob ``cProfile``; com ``path``, grava o ``.pstats``."""
+    import cProfile  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    profile = cProfile.Profile()
+    capture = ProfileCapture(profile)
+    profile.enable()
+    try:
+        yield capture
+    finally:
+        profile.disable()
+        if path is not None:
+            capture.dump(path)
@@ -0,0 +1,393 @@
+"""Repositório de clientes em um log binário somente-acréscimo.
+
+Cada operação vira um quadro acrescentado ao fim do arquivo: tamanho e CRC32
+do corpo, seguidos do corpo, que começa pelo tipo (cadastro ou lápide de
+exclusão) e traz os campos em UTF-8 prefixados pelo tamanho. Alterar um
+cliente grava um cadastro novo e excluir grava uma lápide; o quadro anterior
+deixa de ser referenciado e vira lixo.
+
+O índice CNPJ → (offset, tamanho) fica em memória e é reconstruído na
+abertura percorrendo os quadros; as leituras vão direto ao offset por um
+``mmap`` do arquivo e conferem o CRC. Na abertura, um quadro incompleto ou
+com CRC inválido (gravação interrompida) encerra a recuperação e é descartado
+junto com o que vier depois dele.
+
+Quando o lixo passa de ``compaction_ratio`` do arquivo, uma thread copia os
+quadros vivos para um arquivo novo sem bloquear as gravações; no fim, sob o
+lock, os quadros gravados durante a cópia são transferidos e o arquivo novo
+substitui o atual com ``os.replace``.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .models import Customer
+from .repositories import DuplicateCustomerError, QueryableCustomerRepository
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"PBLG"
+_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sI")  # magic, versao
+_FRAME = struct.Struct("<II")  # tamanho do corpo, crc32 do corpo
+_PUT = struct.Struct("<BHHH")  # tipo, tamanhos de nome, email e cnpj
+_DELETE = struct.Struct("<BH")  # tipo, tamanho do cnpj
+_PUT_KIND = 1
+_DELETE_KIND = 2
+
+# Entrada do índice: offset do quadro, tamanho do quadro e nome do cliente.
+_Entry = tuple[int, int, str]
+
+
+class LogCustomerRepository(QueryableCustomerRepository):
+    """Persiste clientes em um log binário com índice em memória.
+
+    ``save`` lança ``DuplicateCustomerError`` se o CNPJ já estiver
+    cadastrado; ``update`` e ``delete`` alteram ou removem clientes
+    existentes. Cada operação é uma única escrita no arquivo; com
+    ``fsync=True`` ela também é forçada para o disco. A compactação em
+    segundo plano é desligada com ``compaction_ratio=None`` e pode ser
+    executada a qualquer momento com ``compact``.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        file_path: Path,
+        *,
+        fsync: bool = False,
+        compaction_ratio: float | None = 0.5,
+        min_compaction_bytes: int = 1024 * 1024,
+    ) -> None:
+        """Abre (ou cria) o log e reconstrói o índice."""
+        self._path = Path(file_path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+        self._compaction_ratio = compaction_ratio
+        self._min_compaction_bytes = min_compaction_bytes
+        self._lock = threading.Lock()
+        self._compaction_lock = threading.Lock()
+        self._compaction: threading.Thread | None = None
+        self._entries: dict[str, _Entry] = {}
+        self._by_name: dict[str, dict[str, None]] = {}
+        self._live_bytes = 0
+        if not self._path.exists() or self._path.stat().st_size == 0:
+            self._path.write_bytes(_FILE_HEADER.pack(_MAGIC, _VERSION))
+        self._size = self._recover()
+        self._open_files()
+
+    def save(self, customer: Customer) -> None:
+        """Acrescenta o cadastro de um cliente novo."""
+        frame = _encode_put(customer)
+        with self._lock:
+            if customer.cnpj in self._entries:
+                raise DuplicateCustomerError(f"CNPJ ja cadastrado: {customer.cnpj}")
+            self._append([frame], [customer])
+
+    def save_many(
+        self, customers: Iterable[Customer], *, skip_duplicates: bool = False
+    ) -> int:
+        """Acrescenta vários clientes em uma única escrita.
+
+        Por padrão um CNPJ repetido, no repositório ou no próprio lote, faz
+        o lote inteiro ser descartado com ``DuplicateCustomerError``; com
+        ``skip_duplicates=True`` os repetidos são ignorados. Retorna a
+        quantidade de clientes gravados.
+        """
+        customers = list(customers)
+        with self._lock:
+            accepted: dict[str, Customer] = {}
+            for customer in customers:
+                if customer.cnpj in self._entries or customer.cnpj in accepted:
+                    if skip_duplicates:
+                        continue
+                    raise DuplicateCustomerError("CNPJ ja cadastrado no lote")
+                accepted[customer.cnpj] = customer
+            batch = list(accepted.values())
+            if batch:
+                self._append([_encode_put(customer) for customer in batch], batch)
+        return len(batch)
+
+    def update(self, customer: Customer) -> bool:
+        """Substitui os dados do cliente com o mesmo CNPJ.
+
+        Retorna ``False``, sem gravar nada, se o CNPJ não estiver cadastrado.
+        """
+        frame = _encode_put(customer)
+        with self._lock:
+            if customer.cnpj not in self._entries:
+                return False
+            self._append([frame], [customer])
+        return True
+
+    def delete(self, cnpj: str) -> bool:
+        """Grava uma lápide para o CNPJ; ``False`` se ele não estiver cadastrado."""
+        frame = _encode_delete(cnpj)
+        with self._lock:
+            if cnpj not in self._entries:
+                return False
+            self._append([frame], [cnpj])
+        return True
+
+    def get_by_cnpj(self, cnpj: str) -> Customer | None:
+        """Retorna o cliente com o CNPJ informado, se existir."""
+        with self._lock:
+            entry = self._entries.get(cnpj)
+            return None if entry is None else self._read(entry[0], entry[1])
+
+    def get_by_name(self, name: str) -> Customer | None:
+        """Retorna o primeiro cliente cadastrado com o nome informado."""
+        with self._lock:
+            cnpjs = self._by_name.get(name)
+            if not cnpjs:
+                return None
+            entry = self._entries[next(iter(cnpjs))]
+            return self._read(entry[0], entry[1])
+
+    def exists(self, cnpj: str) -> bool:
+        """Indica se há cliente cadastrado com o CNPJ informado."""
+        return cnpj in self._entries
+
+    def iter_all(self) -> Iterator[Customer]:
+        """Percorre os clientes na ordem de cadastro, lendo um por vez."""
+        with self._lock:
+            cnpjs = list(self._entries)
+        for cnpj in cnpjs:
+            customer = self.get_by_cnpj(cnpj)
+            if customer is not None:
+                yield customer
+
+    def count(self) -> int:
+        """Quantidade de clientes cadastrados."""
+        return len(self._entries)
+
+    @property
+    def garbage_bytes(self) -> int:
+        """Bytes do arquivo ocupados por quadros substituídos e lápides."""
+        return self._size - _FILE_HEADER.size - self._live_bytes
+
+    def compact(self) -> None:
+        """Reescreve o log apenas com os quadros vivos."""
+        with self._compaction_lock:
+            with self._lock:
+                if self._writer.closed:
+                    return
+                snapshot = [entry[:2] for entry in self._entries.values()]
+                end = self._size
+            temporary = self._path.with_name(f"{self._path.name}.compact")
+            relocated: dict[int, int] = {}
+            with self._path.open("rb") as source, temporary.open("wb") as target:
+                offset = target.write(_FILE_HEADER.pack(_MAGIC, _VERSION))
+                for old, size in snapshot:
+                    source.seek(old)
+                    relocated[old] = offset
+                    offset += target.write(source.read(size))
+                with self._lock:
+                    if self._writer.closed:
+                        temporary.unlink()
+                        return
+                    source.seek(end)
+                    tail = source.read(self._size - end)
+                    target.write(tail)
+                    target.flush()
+                    os.fsync(target.fileno())
+                    self._swap(temporary, relocated, end, offset - end)
+                    self._size = offset + len(tail)
+
+    def compact_in_background(self) -> threading.Thread:
+        """Inicia ``compact`` em uma thread, se nenhuma estiver em andamento."""
+        with self._lock:
+            return self._start_compaction()
+
+    def close(self) -> None:
+        """Aguarda a compactação em andamento e fecha o arquivo."""
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self._lock:
+            if self._writer.closed:
+                return
+            self._map.close()
+            self._reader.close()
+            self._writer.close()
+
+    def __enter__(self) -> "LogCustomerRepository":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _append(self, frames: list[bytes], records: list[Customer] | list[str]) -> None:
+        if self._writer.closed:
+            raise ValueError("Repositório já foi fechado.")
+        self._writer.write(b"".join(frames))
+        if self._fsync:
+            os.fsync(self._writer.fileno())
+        offset = self._size
+        for record, frame in zip(records, frames):
+            offset = self._apply(record, offset, len(frame))
+        self._size = offset
+        if self._should_compact():
+            self._start_compaction()
+
+    def _apply(self, record: Customer | str, offset: int, size: int) -> int:
+        """Aplica um quadro ao índice e retorna o offset do próximo."""
+        if isinstance(record, str):
+            self._forget(record)
+            return offset + size
+        previous = self._entries.get(record.cnpj)
+        if previous is None:
+            self._by_name.setdefault(record.name, {})[record.cnpj] = None
+        else:
+            self._live_bytes -= previous[1]
+            if previous[2] != record.name:
+                self._unlink_name(previous[2], record.cnpj)
+                self._by_name.setdefault(record.name, {})[record.cnpj] = None
+        self._entries[record.cnpj] = (offset, size, record.name)
+        self._live_bytes += size
+        return offset + size
+
+    def _forget(self, cnpj: str) -> None:
+        _offset, size, name = self._entries.pop(cnpj)
+        self._live_bytes -= size
+        self._unlink_name(name, cnpj)
+
+    def _unlink_name(self, name: str, cnpj: str) -> None:
+        cnpjs = self._by_name[name]
+        del cnpjs[cnpj]
+        if not cnpjs:
+            del self._by_name[name]
+
+    def _read(self, offset: int, size: int) -> Customer:
+        if offset + size > len(self._map):
+            # Quadro gravado depois do último mapeamento.
+            self._map.close()
+            self._map = mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ)
+        length, crc = _FRAME.unpack_from(self._map, offset)
+        body = self._map[offset + _FRAME.size : offset + _FRAME.size + length]
+        if zlib.crc32(body) != crc:
+            raise ValueError(f"Registro corrompido em {self._path}:{offset}")
+        record = _decode(body)
+        if isinstance(record, str):
+            raise ValueError(f"Registro corrompido em {self._path}:{offset}")
+        return record
+
+    def _recover(self) -> int:
+        """Reconstrói o índice e retorna o tamanho válido do log."""
+        with self._path.open("rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as view:
+            if view[: _FILE_HEADER.size] != _FILE_HEADER.pack(_MAGIC, _VERSION):
+                raise ValueError(f"Arquivo de log inválido: {self._path}")
+            offset, end = _FILE_HEADER.size, len(view)
+            while offset + _FRAME.size <= end:
+                length, crc = _FRAME.unpack_from(view, offset)
+                stop = offset + _FRAME.size + length
+                body = view[offset + _FRAME.size : stop]
+                if stop > end or zlib.crc32(body) != crc:
+                    break
+                try:
+                    offset = self._apply(_decode(body), offset, stop - offset)
+                except (ValueError, IndexError, struct.error):
+                    break
+        if offset < end:
+            logger.warning(
+                "descartando %d bytes invalidos no fim de %s", end - offset, self._path
+            )
+            os.truncate(self._path, offset)
+        return offset
+
+    def _open_files(self) -> None:
+        self._writer = self._path.open("ab", buffering=0)
+        self._reader = self._path.open("rb")
+        self._map = mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _swap(
+        self, temporary: Path, relocated: dict[int, int], end: int, shift: int
+    ) -> None:
+        """Troca o log pelo compactado e corrige os offsets do índice."""
+        self._map.close()
+        self._reader.close()
+        self._writer.close()
+        os.replace(temporary, self._path)
+        self._open_files()
+        for cnpj, (offset, size, name) in self._entries.items():
+            offset = offset + shift if offset >= end else relocated[offset]
+            self._entries[cnpj] = (offset, size, name)
+
+    def _should_compact(self) -> bool:
+        if self._compaction_ratio is None:
+            return False
+        garbage = self.garbage_bytes
+        return (
+            garbage >= self._min_compaction_bytes
+            and garbage >= self._size * self._compaction_ratio
+        )
+
+    def _start_compaction(self) -> threading.Thread:
+        if self._compaction is None or not self._compaction.is_alive():
+            self._compaction = threading.Thread(
+                target=self._compact_logging_errors,
+                name="petrobahia-log-compaction",
+                daemon=True,
+            )
+            self._compaction.start()
+        return self._compaction
+
+    def _compact_logging_errors(self) -> None:
+        try:
+            self.compact()
+        except OSError:
+            logger.exception("falha na compactacao de %s", self._path)
+
+
+def _encode_put(customer: Customer) -> bytes:
+    name = customer.name.encode("utf-8")
+    email = customer.email.encode("utf-8")
+    cnpj = customer.cnpj.encode("utf-8")
+    try:
+        header = _PUT.pack(_PUT_KIND, len(name), len(email), len(cnpj))
+    except struct.error as exc:
+        raise ValueError("Campo de cliente longo demais para o log.") from exc
+    body = b"".join((header, name, email, cnpj))
+    return _FRAME.pack(len(body), zlib.crc32(body)) + body
+
+
+def _encode_delete(cnpj: str) -> bytes:
+    encoded = cnpj.encode("utf-8")
+    try:
+        body = _DELETE.pack(_DELETE_KIND, len(encoded)) + encoded
+    except struct.error as exc:
+        raise ValueError("CNPJ longo demais para o log.") from exc
+    return _FRAME.pack(len(body), zlib.crc32(body)) + body
+
+
+def _decode(body: bytes) -> Customer | str:
+    """``Customer`` de um cadastro ou o CNPJ de uma lápide."""
+    if body[0] == _PUT_KIND:
+        _kind, name_size, email_size, cnpj_size = _PUT.unpack_from(body)
+        start = _PUT.size
+        if start + name_size + email_size + cnpj_size != len(body):
+            raise ValueError("Cadastro com tamanho inconsistente.")
+        email_start = start + name_size
+        cnpj_start = email_start + email_size
+        return Customer(
+            body[start:email_start].decode("utf-8"),
+            body[email_start:cnpj_start].decode("utf-8"),
+            body[cnpj_start:].decode("utf-8"),
+        )
+    if body[0] == _DELETE_KIND:
+        _kind, cnpj_size = _DELETE.unpack_from(body)
+        if _DELETE.size + cnpj_size != len(body):
+            raise ValueError("Lápide com tamanho inconsistente.")
+        return body[_DELETE.size :].decode("utf-8")
+    raise ValueError(f"Tipo de registro desconhecido: {body[0]}")
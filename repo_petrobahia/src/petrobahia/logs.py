@@ -0,0 +1,51 @@
+"""Configuração de logging do pacote PetroBahia.
+
+As mensagens de precificação, pedidos e clientes são emitidas pelos loggers
+``petrobahia.*`` com formatação preguiçosa. Este módulo oferece o console no
+formato do legado e um destino opcional em JSON lines, gravado em segundo plano.
+
+``JsonLinesSink`` e ``JsonLinesFormatter`` ficam em ``petrobahia._json_logs``
+e são carregados no primeiro acesso: quem só usa o console não importa
+``json`` nem ``logging.handlers``.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from typing import TextIO
+
+PACKAGE_LOGGER = "petrobahia"
+
+_LAZY_ATTRIBUTES = ("JsonLinesFormatter", "JsonLinesSink")
+
+
+def configure_console_logging(
+    level: int = logging.DEBUG, stream: TextIO | None = None
+) -> logging.Handler:
+    """Envia as mensagens do pacote ao console, apenas com o texto da mensagem.
+
+    Reproduz a saída dos antigos ``print``. Retorna o handler instalado.
+    """
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.setLevel(level)
+    _attach(handler, level)
+    return handler
+
+
+def _attach(handler: logging.Handler, level: int) -> None:
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    logger.addHandler(handler)
+    if logger.getEffectiveLevel() > level:
+        logger.setLevel(level)
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import _json_logs  # pylint: disable=import-outside-toplevel
+
+    value = getattr(_json_logs, name)
+    globals()[name] = value
+    return value
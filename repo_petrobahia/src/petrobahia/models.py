@@ -23,3 +23,12 @@ class Order:
     product: str
     quantity: float
     coupon: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class PricedOrder:
+    """Pedido precificado, com a versão da tabela de preços usada."""
+
+    order: Order
+    price: float
+    price_version: Optional[int] = None
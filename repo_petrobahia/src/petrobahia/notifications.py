@@ -0,0 +1,320 @@
+"""Caixa de saída durável para notificações de clientes.
+
+O cadastro não envia mais a mensagem de boas-vindas no próprio fluxo: o
+evento é gravado em uma fila local em SQLite (``NotificationOutbox``) e um
+``NotificationDispatcher`` com algumas threads retira os eventos em lotes e
+os entrega a um ``Notifier`` (o relay de email, ou um substituto local).
+
+Cada lote é reservado por ``lease`` segundos; se o processo cair no meio do
+envio, os eventos voltam a ficar disponíveis quando a reserva expira (entrega
+pelo menos uma vez). Falhas são tentadas de novo com espera exponencial e,
+depois de ``max_attempts`` tentativas, ficam marcadas como ``failed`` no banco.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Mapping, Protocol
+
+from ._sqlite import synchronous_mode
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from .models import Customer
+
+logger = logging.getLogger(__name__)
+
+WELCOME = "boas_vindas"
+PENDING = "pending"
+FAILED = "failed"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS outbox (
+        id INTEGER PRIMARY KEY,
+        kind TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        available_at REAL NOT NULL,
+        last_error TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS outbox_available ON outbox (status, available_at)",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Notification:
+    """Evento retirado da caixa de saída."""
+
+    id: int
+    kind: str
+    payload: Mapping[str, object]
+    attempts: int = 0
+
+
+class Notifier(Protocol):
+    """Contrato do relay que efetivamente entrega as notificações."""
+
+    # pylint: disable=too-few-public-methods, unnecessary-pass
+
+    def send(self, notification: Notification) -> None:
+        """Entrega a notificação; lança exceção se a entrega falhar."""
+        pass
+
+
+class LoggingNotifier:
+    """Substituto local do relay: registra a mensagem de boas-vindas no log."""
+
+    # pylint: disable=too-few-public-methods
+
+    def send(self, notification: Notification) -> None:
+        """Emite a mesma mensagem que o cadastro emitia no fluxo síncrono."""
+        logger.info(
+            "enviando mensagem de boas vindas para %s", notification.payload.get("nome")
+        )
+
+
+class NotificationOutbox:
+    """Fila durável de notificações em um banco SQLite em modo WAL.
+
+    Uma única conexão é compartilhada entre as threads, protegida por um
+    lock. ``enqueue`` é uma inserção em uma transação curta, então o custo
+    para quem cadastra não depende do relay.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        synchronous: str | int = "NORMAL",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Abre (ou cria) a caixa de saída em ``db_path``.
+
+        ``synchronous`` é validado como em ``SqliteCustomerRepository``.
+        """
+        synchronous = synchronous_mode(synchronous)
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(f"PRAGMA synchronous={synchronous}")
+        with self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+
+    def enqueue(self, kind: str, payload: Mapping[str, object]) -> int:
+        """Grava um evento para envio imediato e retorna o seu id."""
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO outbox (kind, payload, available_at) VALUES (?, ?, ?)",
+                (kind, json.dumps(payload, ensure_ascii=False), self._clock()),
+            )
+        return cursor.lastrowid
+
+    def enqueue_welcome(self, customer: Customer) -> int:
+        """Grava a mensagem de boas vindas de um cliente recém-cadastrado."""
+        return self.enqueue(
+            WELCOME,
+            {"nome": customer.name, "email": customer.email, "cnpj": customer.cnpj},
+        )
+
+    def claim(self, limit: int, lease: float) -> list[Notification]:
+        """Reserva até ``limit`` eventos disponíveis por ``lease`` segundos."""
+        now = self._clock()
+        with self._lock, self._connection:
+            rows = self._connection.execute(
+                "SELECT id, kind, payload, attempts FROM outbox "
+                "WHERE status = ? AND available_at <= ? ORDER BY id LIMIT ?",
+                (PENDING, now, limit),
+            ).fetchall()
+            self._connection.executemany(
+                "UPDATE outbox SET available_at = ? WHERE id = ?",
+                [(now + lease, row[0]) for row in rows],
+            )
+        return [
+            Notification(
+                id=row[0], kind=row[1], payload=json.loads(row[2]), attempts=row[3]
+            )
+            for row in rows
+        ]
+
+    def complete(self, ids: list[int]) -> None:
+        """Remove os eventos entregues."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM outbox WHERE id = ?", [(id_,) for id_ in ids]
+            )
+
+    def retry(self, notification: Notification, delay: float, error: str) -> None:
+        """Devolve o evento à fila, disponível daqui a ``delay`` segundos."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE outbox SET attempts = ?, available_at = ?, last_error = ? "
+                "WHERE id = ?",
+                (
+                    notification.attempts + 1,
+                    self._clock() + delay,
+                    error,
+                    notification.id,
+                ),
+            )
+
+    def fail(self, notification: Notification, error: str) -> None:
+        """Desiste do evento, mantendo-o no banco com status ``failed``."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, last_error = ? "
+                "WHERE id = ?",
+                (FAILED, notification.attempts + 1, error, notification.id),
+            )
+
+    def count(self, status: str = PENDING) -> int:
+        """Quantidade de eventos com o status informado."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status = ?", (status,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "NotificationOutbox":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+@dataclass(slots=True)
+class DispatcherStats:
+    """Contadores do despachante."""
+
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+class NotificationDispatcher:
+    """Esvazia a caixa de saída em lotes, com ``workers`` threads.
+
+    Uma entrega que falha volta à fila após ``base_delay * 2 ** (n - 1)``
+    segundos na ``n``-ésima falha (limitado a ``max_delay``); na
+    ``max_attempts``-ésima o evento é marcado como ``failed``. ``run_once``
+    processa um lote na thread atual, útil em testes e em tarefas agendadas.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        outbox: NotificationOutbox,
+        notifier: Notifier | None = None,
+        *,
+        workers: int = 2,
+        batch_size: int = 100,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 60.0,
+        lease: float = 30.0,
+        poll_interval: float = 0.2,
+    ) -> None:
+        """Configura o despachante; as threads só começam em ``start``."""
+        self.outbox = outbox
+        self.notifier = notifier or LoggingNotifier()
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.stats = DispatcherStats()
+        self._stats_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def backoff(self, attempts: int) -> float:
+        """Espera antes da próxima tentativa, após ``attempts`` falhas."""
+        return min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+
+    def run_once(self) -> int:
+        """Processa um lote disponível e retorna quantos eventos foram tratados."""
+        batch = self.outbox.claim(self.batch_size, self.lease)
+        delivered: list[int] = []
+        sent = retried = failed = 0
+        for notification in batch:
+            try:
+                self.notifier.send(notification)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                error = f"{type(exc).__name__}: {exc}"
+                attempts = notification.attempts + 1
+                if attempts >= self.max_attempts:
+                    logger.error(
+                        "notificacao %s descartada apos %s tentativas: %s",
+                        notification.id,
+                        attempts,
+                        error,
+                    )
+                    self.outbox.fail(notification, error)
+                    failed += 1
+                else:
+                    self.outbox.retry(notification, self.backoff(attempts), error)
+                    retried += 1
+            else:
+                delivered.append(notification.id)
+                sent += 1
+        if delivered:
+            self.outbox.complete(delivered)
+        with self._stats_lock:
+            self.stats.sent += sent
+            self.stats.retried += retried
+            self.stats.failed += failed
+        return len(batch)
+
+    def start(self) -> None:
+        """Inicia as threads de envio."""
+        if self._threads:
+            raise RuntimeError("Despachante já iniciado.")
+        self._stopped.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"petrobahia-notificacoes-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Sinaliza as threads e aguarda o término do lote em andamento."""
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def __enter__(self) -> "NotificationDispatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                handled = self.run_once()
+            except sqlite3.Error:
+                logger.exception("falha ao ler a caixa de saida de notificacoes")
+                handled = 0
+            if not handled:
+                self._stopped.wait(self.poll_interval)
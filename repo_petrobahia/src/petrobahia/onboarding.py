@@ -0,0 +1,386 @@
+"""Cadastro de clientes em massa a partir de um arquivo, com retomada.
+
+O arquivo de origem (formato de ``clientes.txt`` ou JSON lines) é lido em
+blocos de linhas. Cada bloco é convertido e validado com
+``CustomerValidator.validate_many`` em processos separados; o processo
+principal consome os blocos na ordem de entrada, descarta CNPJs repetidos
+(inclusive os que já estão no arquivo de destino), grava os clientes válidos
+por um único ``BatchedFileCustomerRepository`` e os recusados, com os
+motivos, em um arquivo JSON lines à parte.
+
+Depois de cada bloco gravado, um checkpoint em JSON registra a posição na
+origem e o tamanho dos arquivos de saída. Uma execução interrompida é
+retomada desse ponto: as saídas são truncadas para o tamanho registrado e a
+leitura continua do byte seguinte ao último bloco concluído.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Mapping, Sequence
+
+from .customer_files import iter_customers, parse_record
+from .logs import PACKAGE_LOGGER
+from .models import Customer
+from .repositories import BatchedFileCustomerRepository
+from .validators import CustomerValidator, decode_errors
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+DUPLICATE_MESSAGE = "cnpj duplicado"
+INVALID_LINE_MESSAGE = "linha invalida"
+
+# (posição no bloco, nome, email, cnpj) e (posição no bloco, linha, motivos).
+AcceptedRow = tuple[int, str, str, str]
+RejectedRow = tuple[int, str, list[str]]
+ChunkResult = tuple[list[AcceptedRow], list[RejectedRow]]
+
+_worker_validator: CustomerValidator | None = None
+
+
+@dataclass(slots=True)
+class OnboardingStats:
+    """Contadores de uma importação, incluindo o que veio do checkpoint."""
+
+    read: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    duplicates: int = 0
+    resumed_from: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Linhas lidas por segundo nesta execução."""
+        if self.elapsed <= 0:
+            return 0.0
+        return (self.read - self.resumed_from) / self.elapsed
+
+
+@dataclass(slots=True)
+class _Checkpoint:
+    source: str
+    offset: int
+    destination_size: int
+    rejects_size: int
+    read: int
+    accepted: int
+    rejected: int
+    duplicates: int
+
+
+def onboard_customers(
+    source: Path,
+    destination: Path,
+    rejects: Path,
+    *,
+    workers: int | None = None,
+    chunk_size: int = 10_000,
+    verify_check_digits: bool = False,
+    checkpoint: Path | None = None,
+    resume: bool = True,
+    progress: Callable[[OnboardingStats], None] | None = None,
+    max_pending_chunks: int | None = None,
+) -> OnboardingStats:
+    """Importa os clientes de ``source`` para ``destination``.
+
+    Linhas recusadas vão para ``rejects`` como ``{"linha", "registro",
+    "motivos"}``. Com ``workers=1`` tudo roda no processo atual; caso
+    contrário a validação usa ``workers`` processos (padrão: um por CPU), com
+    no máximo ``max_pending_chunks`` blocos em trânsito. ``progress`` é
+    chamado após cada bloco gravado. O checkpoint (padrão:
+    ``<destination>.checkpoint``) é apagado ao final; com ``resume=False``
+    um checkpoint existente é ignorado e ``rejects`` é recriado.
+    """
+    source, destination, rejects = Path(source), Path(destination), Path(rejects)
+    checkpoint = checkpoint or destination.with_name(
+        destination.name + CHECKPOINT_SUFFIX
+    )
+    state = _load_checkpoint(checkpoint, source) if resume else None
+    stats = OnboardingStats()
+    offset = 0
+    if state is not None:
+        _truncate(destination, state.destination_size)
+        _truncate(rejects, state.rejects_size)
+        offset = state.offset
+        stats = OnboardingStats(
+            read=state.read,
+            accepted=state.accepted,
+            rejected=state.rejected,
+            duplicates=state.duplicates,
+            resumed_from=state.read,
+        )
+    elif rejects.exists():
+        rejects.unlink()
+
+    seen = _existing_cnpjs(destination)
+    rejects.parent.mkdir(parents=True, exist_ok=True)
+    json_lines = source.suffix.lower() in (".jsonl", ".ndjson")
+    started = time.perf_counter()
+    chunks = _read_chunks(source, offset, chunk_size)
+
+    with BatchedFileCustomerRepository(
+        destination, max_records=chunk_size, flush_interval=None
+    ) as repository, rejects.open("ab") as rejects_handle:
+        results = _validated_chunks(
+            chunks, json_lines, verify_check_digits, workers, max_pending_chunks
+        )
+        for lines, end_offset, (accepted, rejected) in results:
+            first_line = stats.read + 1
+            customers = []
+            for index, name, email, cnpj in accepted:
+                if cnpj in seen:
+                    rejected.append((index, lines[index], [DUPLICATE_MESSAGE]))
+                    stats.duplicates += 1
+                    continue
+                seen.add(cnpj)
+                customers.append(Customer(name=name, email=email, cnpj=cnpj))
+
+            repository.save_many(customers)
+            repository.flush()
+            rejected.sort(key=lambda row: row[0])
+            _write_rejects(rejects_handle, rejected, first_line)
+            rejects_handle.flush()
+
+            stats.read += len(lines)
+            stats.accepted += len(customers)
+            stats.rejected += len(rejected)
+            stats.elapsed = time.perf_counter() - started
+            _save_checkpoint(
+                checkpoint,
+                _Checkpoint(
+                    source=str(source.resolve()),
+                    offset=end_offset,
+                    destination_size=destination.stat().st_size,
+                    rejects_size=rejects_handle.tell(),
+                    read=stats.read,
+                    accepted=stats.accepted,
+                    rejected=stats.rejected,
+                    duplicates=stats.duplicates,
+                ),
+            )
+            if progress is not None:
+                progress(stats)
+
+    stats.elapsed = time.perf_counter() - started
+    checkpoint.unlink(missing_ok=True)
+    return stats
+
+
+def _read_chunks(
+    source: Path, offset: int, chunk_size: int
+) -> Iterator[tuple[list[str], int]]:
+    """Blocos de linhas de ``source`` a partir de ``offset``, com o offset final."""
+    with source.open("rb") as handle:
+        handle.seek(offset)
+        lines: list[str] = []
+        for raw in handle:
+            offset += len(raw)
+            lines.append(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+            if len(lines) >= chunk_size:
+                yield lines, offset
+                lines = []
+        if lines:
+            yield lines, offset
+
+
+def _validated_chunks(
+    chunks: Iterator[tuple[list[str], int]],
+    json_lines: bool,
+    verify_check_digits: bool,
+    workers: int | None,
+    max_pending_chunks: int | None,
+) -> Iterator[tuple[list[str], int, ChunkResult]]:
+    """Valida os blocos, no processo atual ou em um pool, na ordem de entrada."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        validator = CustomerValidator(verify_check_digits=verify_check_digits)
+        for lines, end_offset in chunks:
+            yield lines, end_offset, _validate_chunk(validator, lines, json_lines)
+        return
+
+    max_pending_chunks = max_pending_chunks or 2 * workers
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(verify_check_digits, logging.WARNING),
+    )
+    pending: deque[tuple[list[str], int, Future[ChunkResult]]] = deque()
+    try:
+        for lines, end_offset in chunks:
+            future = executor.submit(_worker_validate_chunk, lines, json_lines)
+            pending.append((lines, end_offset, future))
+            if len(pending) >= max_pending_chunks:
+                lines, end_offset, future = pending.popleft()
+                yield lines, end_offset, future.result()
+        while pending:
+            lines, end_offset, future = pending.popleft()
+            yield lines, end_offset, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _init_worker(verify_check_digits: bool, log_level: int) -> None:
+    global _worker_validator  # pylint: disable=global-statement
+    logging.getLogger(PACKAGE_LOGGER).setLevel(log_level)
+    _worker_validator = CustomerValidator(verify_check_digits=verify_check_digits)
+
+
+def _worker_validate_chunk(lines: list[str], json_lines: bool) -> ChunkResult:
+    return _validate_chunk(_worker_validator, lines, json_lines)
+
+
+def _validate_chunk(
+    validator: CustomerValidator, lines: list[str], json_lines: bool
+) -> ChunkResult:
+    """Converte e valida um bloco de linhas."""
+    rejected: list[RejectedRow] = []
+    positions: list[int] = []
+    records: list[Mapping[str, object]] = []
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        record = _parse_record(line, json_lines)
+        if record is None:
+            rejected.append((index, line, [INVALID_LINE_MESSAGE]))
+            continue
+        positions.append(index)
+        records.append(record)
+
+    accepted: list[AcceptedRow] = []
+    masks = validator.validate_many(records)
+    for index, record, mask in zip(positions, records, masks):
+        if mask:
+            rejected.append((index, lines[index], decode_errors(mask)))
+        else:
+            accepted.append(
+                (
+                    index,
+                    str(record["nome"]).strip(),
+                    str(record["email"]).strip(),
+                    str(record["cnpj"]).strip(),
+                )
+            )
+    return accepted, rejected
+
+
+def _parse_record(line: str, json_lines: bool) -> Mapping[str, object] | None:
+    try:
+        record = json.loads(line) if json_lines else parse_record(line)
+    except (ValueError, RecursionError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _write_rejects(
+    handle: BinaryIO, rejected: list[RejectedRow], first_line: int
+) -> None:
+    handle.write(
+        "".join(
+            json.dumps(
+                {"linha": first_line + index, "registro": line, "motivos": reasons},
+                ensure_ascii=False,
+            )
+            + "\n"
+            for index, line, reasons in rejected
+        ).encode("utf-8")
+    )
+
+
+def _existing_cnpjs(destination: Path) -> set[str]:
+    """CNPJs já gravados no destino, sem espaços nas pontas, para a deduplicação."""
+    if not destination.exists():
+        return set()
+    return {customer.cnpj.strip() for customer in iter_customers(destination)}
+
+
+def _truncate(path: Path, size: int) -> None:
+    # Descarta o que foi gravado depois do último checkpoint.
+    if path.exists() and path.stat().st_size > size:
+        os.truncate(path, size)
+
+
+def _load_checkpoint(path: Path, source: Path) -> _Checkpoint | None:
+    if not path.exists():
+        return None
+    state = _Checkpoint(**json.loads(path.read_text(encoding="utf-8")))
+    if state.source != str(source.resolve()) or state.offset > source.stat().st_size:
+        raise ValueError(
+            f"Checkpoint {path} não corresponde ao arquivo de origem {source}."
+        )
+    return state
+
+
+def _save_checkpoint(path: Path, state: _Checkpoint) -> None:
+    # Grava em um arquivo temporário e troca de uma vez: nunca fica pela metade.
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(json.dumps(asdict(state)), encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def _print_progress(stats: OnboardingStats) -> None:
+    print(
+        f"\r{stats.read:>12,} lidos {stats.accepted:>12,} aceitos "
+        f"{stats.rejected:>10,} recusados {stats.rate:>10,.0f} linhas/s",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Linha de comando: ``origem destino --rejects recusados.jsonl``."""
+    parser = argparse.ArgumentParser(
+        description="Cadastra em massa os clientes de um arquivo."
+    )
+    parser.add_argument(
+        "source", type=Path, help="clientes de origem (formato clientes.txt ou .jsonl)"
+    )
+    parser.add_argument("destination", type=Path, help="arquivo de clientes de destino")
+    parser.add_argument(
+        "--rejects",
+        type=Path,
+        default=Path("rejeitados.jsonl"),
+        help="arquivo JSON lines com os cadastros recusados",
+    )
+    parser.add_argument("--workers", type=int, help="processos de validação")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument(
+        "--check-digits",
+        action="store_true",
+        help="confere os dígitos verificadores do CNPJ",
+    )
+    parser.add_argument(
+        "--no-resume", action="store_true", help="ignora um checkpoint existente"
+    )
+    args = parser.parse_args(argv)
+
+    stats = onboard_customers(
+        args.source,
+        args.destination,
+        args.rejects,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        verify_check_digits=args.check_digits,
+        resume=not args.no_resume,
+        progress=_print_progress,
+    )
+    print(file=sys.stderr)
+    if stats.resumed_from:
+        print(f"retomado a partir da linha {stats.resumed_from + 1}")
+    print(f"linhas lidas       : {stats.read}")
+    print(f"clientes aceitos   : {stats.accepted}")
+    print(f"cadastros recusados: {stats.rejected} ({stats.duplicates} duplicados)")
+    print(f"tempo              : {stats.elapsed:.2f}s ({stats.rate:,.0f} linhas/s)")
+
+
+if __name__ == "__main__":
+    main()
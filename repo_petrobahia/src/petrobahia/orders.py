@@ -2,61 +2,218 @@
 
 from __future__ import annotations
 
+import logging
+import math
 from dataclasses import dataclass
-from typing import Mapping
+from typing import TYPE_CHECKING, Mapping, Sequence
 
-from .discounts import (DiscountEngine, FlatCouponDiscount,
-                        PercentageCouponDiscount)
-from .models import Order
-from .pricing import (DieselPricingStrategy, EthanolPricingStrategy,
-                      GasolinePricingStrategy, LubricantPricingStrategy,
-                      PriceCalculator, UnknownProductStrategy)
+from . import instrumentation
+from ._arrays import require_numpy
+from .models import Order, PricedOrder
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from numpy import ndarray
+
+    from .cache import PricingCache
+    from .discounts import DiscountEngine
+    from .price_table import PriceTable
+    from .pricing import PriceCalculator, PricingBinding
+    from .tiers import TierTable
+
+logger = logging.getLogger(__name__)
+
+# Tamanho a partir do qual ``price_many`` usa o cálculo vetorizado.
+VECTORIZE_MIN_BATCH = 128
+
+
+def map_order(payload: Mapping[str, object]) -> Order:
+    """Converte um pedido em dicionário (``PEDIDOS``, JSON ou CSV) em ``Order``.
+
+    Quantidades em texto (CSV) são convertidas e quantidade ausente ou vazia
+    vale zero; um cupom vazio equivale a pedido sem cupom. Lança
+    ``ValueError`` se a quantidade não for numérica ou não for finita
+    (``nan``, ``inf``).
+    """
+    quantity = float(payload.get("qtd") or 0)
+    if not math.isfinite(quantity):
+        raise ValueError(f"Quantidade inválida: {payload.get('qtd')!r}")
+    coupon = payload.get("cupom")
+    return Order(
+        customer_name=str(payload.get("cliente", "")),
+        product=str(payload.get("produto", "")),
+        quantity=quantity,
+        coupon=str(coupon) if coupon else None,
+    )
 
 
 @dataclass(slots=True)
 class OrderProcessor:
-    """Serviço que coordena precificação, descontos e arredondamentos."""
+    """Serviço que coordena precificação, descontos e arredondamentos.
+
+    Com ``fixed_point=True`` o pedido é precificado em inteiros (mililitros e
+    subcentavos, ver ``petrobahia.fixed_point``) e o arredondamento final é
+    feito em centavos; o preço devolvido é ``centavos / 100``.
+    """
 
     price_calculator: PriceCalculator
     discount_engine: DiscountEngine
+    cache: PricingCache | None = None
+    fixed_point: bool = False
 
     def process(self, payload: Mapping[str, object]) -> float:
         """Processa o pedido e retorna o preço final."""
+        recorder = instrumentation.active
+        if recorder is None:
+            return self.process_order(self._map_payload(payload))
+        start = recorder.clock()
         order = self._map_payload(payload)
+        recorder.lap("orders.map_payload", start)
+        return self.process_order(order)
+
+    def process_order(self, order: Order) -> float:
+        """Processa um pedido já convertido em ``Order``."""
+        return self.price_order(order).price
+
+    def price_order(self, order: Order) -> PricedOrder:
+        """Processa o pedido e informa a versão da tabela de preços usada.
+
+        Com ``cache`` configurado, pedidos com o mesmo produto, quantidade e
+        cupom reutilizam o preço já calculado (sem repetir os logs das
+        estratégias).
+        """
+        recorder = instrumentation.active
+        start = recorder.clock() if recorder is not None else 0
         if order.quantity == 0:
-            print("qtd zero, retornando 0")
-            return 0.0
+            logger.info("qtd zero, retornando 0")
+            return PricedOrder(order, 0.0, self.price_calculator.price_version)
+
+        if self.cache is None:
+            price, version = self._price(order)
+        else:
+            price, version = self.cache.get_or_compute(
+                (order.product, float(order.quantity), order.coupon),
+                lambda: self._price(order),
+            )
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "pedido ok: %s %s %s => %s",
+                order.customer_name,
+                order.product,
+                self._format_quantity(order.quantity),
+                price,
+            )
+        if recorder is not None:
+            recorder.lap("orders.price_order", start)
+        return PricedOrder(order, price, version)
+
+    def price_many(self, orders: Sequence[Order]) -> list[PricedOrder]:
+        """Precifica vários pedidos em uma única chamada.
 
-        price = self.price_calculator.calculate(order)
+        Todo o lote usa o mesmo snapshot da tabela de preços. Lotes com pelo
+        menos ``VECTORIZE_MIN_BATCH`` pedidos são calculados por
+        ``process_batch`` quando o NumPy está instalado; abaixo disso o custo
+        fixo da versão vetorizada supera o ganho e os pedidos são precificados
+        um a um. Não emite as mensagens por pedido nem consulta o cache. No
+        modo ``fixed_point`` os pedidos são sempre precificados um a um.
+        """
+        binding = self.price_calculator.pin()
+        if not self.fixed_point and len(orders) >= VECTORIZE_MIN_BATCH:
+            try:
+                np = require_numpy()
+            except ImportError:
+                pass
+            else:
+                prices = self.process_batch(
+                    np.array([order.product for order in orders], dtype=str),
+                    np.array([order.quantity for order in orders], dtype=float),
+                    np.array([order.coupon or "" for order in orders], dtype=str),
+                    binding=binding,
+                )
+                return [
+                    PricedOrder(order, price, binding.version)
+                    for order, price in zip(orders, prices.tolist())
+                ]
+        return [
+            PricedOrder(order, self._price(order, binding)[0], binding.version)
+            if order.quantity != 0
+            else PricedOrder(order, 0.0, binding.version)
+            for order in orders
+        ]
+
+    def _price(
+        self, order: Order, binding: PricingBinding | None = None
+    ) -> tuple[float, int | None]:
+        binding = binding or self.price_calculator.pin()
+        if self.fixed_point:
+            return self._price_fixed(order, binding), binding.version
+        price = self.price_calculator.calculate(order, binding)
         if price < 0:
-            print("algo deu errado, preco negativo")
+            logger.warning("algo deu errado, preco negativo")
             price = 0.0
 
         price = self.discount_engine.apply(price, order)
-        price = self._apply_rounding(order, price)
-        quantity_to_display = self._format_quantity(order.quantity)
-
-        print(
-            "pedido ok:",
-            order.customer_name,
-            order.product,
-            quantity_to_display,
-            "=>",
-            price,
-        )
-        return price
+        recorder = instrumentation.active
+        if recorder is None:
+            return self.apply_rounding(order, price), binding.version
+        start = recorder.clock()
+        price = self.apply_rounding(order, price)
+        recorder.lap("orders.rounding", start)
+        return price, binding.version
+
+    def _price_fixed(self, order: Order, binding: PricingBinding) -> float:
+        from . import fixed_point as fixed  # pylint: disable=import-outside-toplevel
+
+        amount = self.price_calculator.calculate_fixed(order, binding)
+        if amount < 0:
+            logger.warning("algo deu errado, preco negativo")
+            amount = 0
+
+        amount = self.discount_engine.apply_fixed(amount, order)
+        recorder = instrumentation.active
+        if recorder is None:
+            return self._apply_rounding_fixed(order, amount) / fixed.CENTAVOS_PER_REAL
+        start = recorder.clock()
+        centavos = self._apply_rounding_fixed(order, amount)
+        recorder.lap("orders.rounding", start)
+        return centavos / fixed.CENTAVOS_PER_REAL
+
+    def process_batch(
+        self,
+        products: ndarray,
+        quantities: ndarray,
+        coupons: ndarray | None = None,
+        *,
+        binding: PricingBinding | None = None,
+    ) -> ndarray:
+        """Processa um lote colunar de pedidos e retorna os preços finais.
+
+        Recebe as colunas de produto, quantidade e cupom (``None`` ou vazio
+        para pedidos sem cupom) e devolve os mesmos valores que ``process``
+        devolveria linha a linha, sem as mensagens por pedido. ``binding``
+        (obtido com ``PriceCalculator.pin``) fixa o snapshot de preços usado.
+        O lote é sempre calculado em ``float``, mesmo no modo ``fixed_point``.
+        """
+        np = require_numpy()
+        products = np.asarray(products, dtype=str)
+        quantities = np.asarray(quantities, dtype=float)
+        if coupons is None:
+            coupons = np.full(len(products), "")
+
+        prices = self.price_calculator.calculate_batch(products, quantities, binding)
+        prices = np.where(prices < 0, 0.0, prices)
+        prices = self.discount_engine.apply_batch(prices, products, coupons)
+        prices = self._apply_rounding_batch(products, prices)
+        prices[quantities == 0] = 0.0
+        return prices
 
     @staticmethod
     def _map_payload(payload: Mapping[str, object]) -> Order:
-        return Order(
-            customer_name=str(payload.get("cliente", "")),
-            product=str(payload.get("produto", "")),
-            quantity=float(payload.get("qtd", 0)),
-            coupon=payload.get("cupom") if payload.get("cupom") else None,
-        )
+        return map_order(payload)
 
     @staticmethod
-    def _apply_rounding(order: Order, price: float) -> float:
+    def apply_rounding(order: Order, price: float) -> float:
+        """Arredonda o preço final conforme as regras do produto."""
         if order.product == "diesel":
             return round(price, 0)
         if order.product == "gasolina":
@@ -64,6 +221,41 @@ class OrderProcessor:
 
         return float(int(price * 100) / 100.0)
 
+    @staticmethod
+    def _apply_rounding_fixed(order: Order, amount: int) -> int:
+        """Arredonda subcentavos para centavos com as regras de ``apply_rounding``.
+
+        Diesel vai ao real inteiro e gasolina ao centavo, ambos com empate para
+        o par (como ``round``); os demais produtos são truncados no centavo.
+        """
+        from . import fixed_point as fixed  # pylint: disable=import-outside-toplevel
+
+        if order.product == "diesel":
+            unit = fixed.SUBUNITS * fixed.CENTAVOS_PER_REAL
+            return fixed.round_half_even(amount, unit) * fixed.CENTAVOS_PER_REAL
+        if order.product == "gasolina":
+            return fixed.round_half_even(amount, fixed.SUBUNITS)
+        return fixed.truncate(amount, fixed.SUBUNITS)
+
+    @staticmethod
+    def _apply_rounding_batch(products: ndarray, prices: ndarray) -> ndarray:
+        np = require_numpy()
+        rounded = np.trunc(prices * 100) / 100.0
+
+        diesel = products == "diesel"
+        rounded[diesel] = np.round(prices[diesel], 0)
+
+        gasoline = np.flatnonzero(products == "gasolina")
+        scaled = prices[gasoline] * 100
+        rounded[gasoline] = np.round(scaled, 0) / 100
+        # ``round(x, 2)`` arredonda o valor decimal exato de ``x``; o produto
+        # ``x * 100`` pode cruzar a fronteira de .5, então os casos próximos
+        # do empate são refeitos com o arredondamento escalar.
+        near_tie = np.abs(scaled - np.floor(scaled) - 0.5) <= 2 * np.abs(np.spacing(scaled))
+        for row in gasoline[near_tie]:
+            rounded[row] = round(float(prices[row]), 2)
+        return rounded
+
     @staticmethod
     def _format_quantity(quantity: float) -> float | int:
         if float(quantity).is_integer():
@@ -71,16 +263,47 @@ class OrderProcessor:
         return quantity
 
 
-def build_default_order_processor() -> OrderProcessor:
-    """Constrói o processador com as estratégias padrão do domínio."""
-    price_calculator = PriceCalculator(
-        strategies=[
-            DieselPricingStrategy(),
-            GasolinePricingStrategy(),
-            EthanolPricingStrategy(),
-            LubricantPricingStrategy(),
-            UnknownProductStrategy(),
+def build_default_order_processor(
+    cache: PricingCache | None = None,
+    price_table: PriceTable | None = None,
+    *,
+    fixed_point: bool = False,
+    tiers: Mapping[str, TierTable] | None = None,
+) -> OrderProcessor:
+    """Constrói o processador com as estratégias padrão do domínio.
+
+    ``cache`` opcional memoriza preços de pedidos repetidos; ``price_table``
+    opcional substitui os preços base pelos do snapshot vigente da tabela;
+    ``fixed_point`` liga a precificação em inteiros. ``tiers`` (por exemplo,
+    de ``load_tier_tables``) troca a estratégia de cada produto da tabela
+    por uma ``TieredPricingStrategy``; os demais mantêm a estratégia padrão.
+    Os módulos de estratégias só são importados aqui, na primeira construção,
+    e não ao importar ``petrobahia.orders``.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .discounts import (DiscountEngine, FlatCouponDiscount,
+                            PercentageCouponDiscount)
+    from .pricing import (BASE_PRICES, DieselPricingStrategy,
+                          EthanolPricingStrategy, GasolinePricingStrategy,
+                          LubricantPricingStrategy, PriceCalculator,
+                          UnknownProductStrategy, build_tiered_strategies)
+
+    strategies = [
+        DieselPricingStrategy(),
+        GasolinePricingStrategy(),
+        EthanolPricingStrategy(),
+        LubricantPricingStrategy(),
+    ]
+    if tiers is not None:
+        prices = dict(BASE_PRICES)
+        if price_table is not None:
+            prices.update(price_table.current.prices)
+        strategies = build_tiered_strategies(tiers, prices) + [
+            strategy for strategy in strategies if strategy.dispatch_key not in tiers
         ]
+    price_calculator = PriceCalculator(
+        strategies=[*strategies, UnknownProductStrategy()],
+        price_table=price_table,
     )
     discount_engine = DiscountEngine(
         strategies=[
@@ -90,5 +313,8 @@ def build_default_order_processor() -> OrderProcessor:
         ]
     )
     return OrderProcessor(
-        price_calculator=price_calculator, discount_engine=discount_engine
+        price_calculator=price_calculator,
+        discount_engine=discount_engine,
+        cache=cache,
+        fixed_point=fixed_point,
     )
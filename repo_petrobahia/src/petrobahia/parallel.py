@@ -0,0 +1,101 @@
+"""Precificação de pedidos em paralelo com múltiplos processos.
+
+A precificação é CPU pura e independente por pedido. Os pedidos são enviados
+aos processos em lotes (``chunk_size``) para diluir o custo de comunicação, e
+cada processo constrói o seu próprio ``OrderProcessor`` uma única vez, no
+inicializador, em vez de receber as estratégias serializadas a cada tarefa.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from .logs import PACKAGE_LOGGER
+from .models import Order, PricedOrder
+from .orders import OrderProcessor, build_default_order_processor
+
+OrderRow = tuple[str, str, float, "str | None"]
+
+_worker_processor: OrderProcessor | None = None
+
+
+def process_parallel(
+    orders: Iterable[Order],
+    *,
+    workers: int | None = None,
+    chunk_size: int = 2000,
+    processor_factory: Callable[[], OrderProcessor] = build_default_order_processor,
+    max_pending_chunks: int | None = None,
+    worker_log_level: int = logging.WARNING,
+) -> Iterator[float]:
+    """Precifica os pedidos em ``workers`` processos, na ordem de entrada.
+
+    A entrada é consumida aos poucos: no máximo ``max_pending_chunks`` lotes
+    (padrão: dois por processo) ficam em trânsito, então fluxos arbitrariamente
+    longos usam memória constante. ``processor_factory`` precisa ser uma função
+    de módulo (serializável) e é chamada uma vez em cada processo.
+    ``worker_log_level`` limita os logs do pacote dentro dos processos.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending_chunks = max_pending_chunks or 2 * workers
+    rows = (_to_row(order) for order in orders)
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(processor_factory, worker_log_level),
+    )
+    pending: deque[Future[list[float]]] = deque()
+    try:
+        while chunk := list(islice(rows, chunk_size)):
+            pending.append(executor.submit(_price_chunk, chunk))
+            if len(pending) >= max_pending_chunks:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def init_worker(
+    processor_factory: Callable[[], OrderProcessor], log_level: int
+) -> None:
+    """Inicializador de ``ProcessPoolExecutor``: cria o processador do processo.
+
+    ``processor_factory`` é chamada uma vez por processo e ``log_level``
+    limita os logs do pacote; ``price_order`` e ``price_orders`` usam o
+    processador criado aqui.
+    """
+    global _worker_processor  # pylint: disable=global-statement
+    logging.getLogger(PACKAGE_LOGGER).setLevel(log_level)
+    _worker_processor = processor_factory()
+
+
+def price_order(order: Order) -> PricedOrder:
+    """Precifica um pedido no processo inicializado por ``init_worker``."""
+    return _worker_processor.price_order(order)
+
+
+def price_orders(orders: list[Order]) -> list[PricedOrder]:
+    """Precifica um lote com ``price_many`` no processo de ``init_worker``."""
+    return _worker_processor.price_many(orders)
+
+
+def _to_row(order: Order) -> OrderRow:
+    # Tuplas são bem mais baratas de serializar do que instâncias de Order.
+    return (order.customer_name, order.product, order.quantity, order.coupon)
+
+
+def _price_chunk(rows: list[OrderRow]) -> list[float]:
+    process_order = _worker_processor.process_order
+    return [
+        process_order(
+            Order(customer_name=name, product=product, quantity=quantity, coupon=coupon)
+        )
+        for name, product, quantity, coupon in rows
+    ]
@@ -0,0 +1,226 @@
+"""Pipeline de processamento de pedidos em fluxo, a partir de arquivos.
+
+Lê pedidos de arquivos JSONL ou CSV com geradores, precifica cada pedido com
+o ``OrderProcessor`` e grava os resultados à medida que são calculados. O uso
+de memória não depende do tamanho do arquivo de entrada.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping, Sequence, TextIO
+
+from . import instrumentation
+from .orders import OrderProcessor, build_default_order_processor, map_order
+
+logger = logging.getLogger(__name__)
+
+ORDER_FIELDS = ("cliente", "produto", "qtd", "cupom")
+RESULT_FIELDS = ORDER_FIELDS + ("valor", "versao_preco")
+
+
+@dataclass(slots=True)
+class RunningTotals:
+    """Totais acumulados durante o processamento, sem guardar os valores."""
+
+    processed: int = 0
+    rejected: int = 0
+    invalid: int = 0
+    total: float = 0.0
+
+    def add(self, price: float) -> None:
+        """Contabiliza um pedido processado com o preço final informado."""
+        self.processed += 1
+        self.total += price
+
+
+@dataclass(frozen=True, slots=True)
+class OrderResult:
+    """Pedido processado, seu preço final e a versão da tabela de preços."""
+
+    payload: Mapping[str, object]
+    price: float
+    price_version: int | None = None
+
+
+def read_orders(path: Path) -> Iterator[object]:
+    """Lê pedidos de um arquivo ``.jsonl`` ou ``.csv``, um de cada vez.
+
+    Linhas JSONL que não são JSON válido são repassadas como texto, e as que
+    não são objetos, como foram decodificadas; ``price_orders`` as contabiliza
+    como inválidas sem interromper a leitura.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return _read_jsonl(path)
+    if suffix == ".csv":
+        return _read_csv(path)
+    raise ValueError(f"Formato de pedidos não suportado: {path.name}")
+
+
+def price_orders(
+    rows: Iterable[object],
+    processor: OrderProcessor,
+    totals: RunningTotals,
+    *,
+    is_known_customer: Callable[[str], bool] | None = None,
+) -> Iterator[OrderResult]:
+    """Precifica os pedidos em fluxo, atualizando ``totals`` a cada pedido.
+
+    Pedidos de clientes recusados por ``is_known_customer`` e linhas com
+    dados inválidos (inclusive as que não são objetos) são contabilizados em
+    ``totals`` e não geram resultado.
+    Com a instrumentação ligada, o tempo de leitura da próxima linha e o de
+    gravação do resultado (quem consome o gerador) são medidos à parte.
+    """
+    recorder = instrumentation.active
+    start = recorder.clock() if recorder is not None else 0
+    for row in rows:
+        if recorder is not None:
+            recorder.lap("pipeline.read", start)
+        try:
+            if not isinstance(row, Mapping):
+                raise TypeError(f"pedido nao e um objeto: {row!r}")
+            order = map_order(row)
+        except (TypeError, ValueError):
+            logger.warning("pedido invalido ignorado: %s", row)
+            totals.invalid += 1
+            if recorder is not None:
+                start = recorder.clock()
+            continue
+        if is_known_customer is not None and not is_known_customer(
+            order.customer_name
+        ):
+            logger.info(
+                "pedido rejeitado: %s - cliente nao cadastrado ou invalido",
+                order.customer_name,
+            )
+            totals.rejected += 1
+            if recorder is not None:
+                start = recorder.clock()
+            continue
+        priced = processor.price_order(order)
+        totals.add(priced.price)
+        if recorder is not None:
+            start = recorder.clock()
+        yield OrderResult(
+            payload=row, price=priced.price, price_version=priced.price_version
+        )
+        if recorder is not None:
+            start = recorder.lap("pipeline.write", start)
+
+
+def write_results(results: Iterable[OrderResult], path: Path) -> None:
+    """Grava os resultados incrementalmente em ``.jsonl`` ou ``.csv``."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = path.suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        with path.open("w", encoding="utf-8") as handle:
+            _write_jsonl(results, handle)
+    elif suffix == ".csv":
+        with path.open("w", encoding="utf-8", newline="") as handle:
+            _write_csv(results, handle)
+    else:
+        raise ValueError(f"Formato de resultados não suportado: {path.name}")
+
+
+def run_pipeline(
+    source: Path,
+    destination: Path,
+    processor: OrderProcessor | None = None,
+    *,
+    is_known_customer: Callable[[str], bool] | None = None,
+) -> RunningTotals:
+    """Lê, precifica e grava os pedidos de ``source`` em ``destination``."""
+    totals = RunningTotals()
+    results = price_orders(
+        read_orders(source),
+        processor or build_default_order_processor(),
+        totals,
+        is_known_customer=is_known_customer,
+    )
+    write_results(results, destination)
+    return totals
+
+
+def _read_jsonl(path: Path) -> Iterator[object]:
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                row = line.rstrip("\n")
+            yield row
+
+
+def _read_csv(path: Path) -> Iterator[dict[str, object]]:
+    with path.open(encoding="utf-8", newline="") as handle:
+        yield from csv.DictReader(handle)
+
+
+def _write_jsonl(results: Iterable[OrderResult], handle: TextIO) -> None:
+    for result in results:
+        record = {field: result.payload.get(field) for field in ORDER_FIELDS}
+        record["valor"] = result.price
+        record["versao_preco"] = result.price_version
+        handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _write_csv(results: Iterable[OrderResult], handle: TextIO) -> None:
+    writer = csv.writer(handle)
+    writer.writerow(RESULT_FIELDS)
+    for result in results:
+        writer.writerow(
+            [_csv_value(result.payload.get(field)) for field in ORDER_FIELDS]
+            + [result.price, _csv_value(result.price_version)]
+        )
+
+
+def _csv_value(value: object) -> object:
+    return "" if value is None else value
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Linha de comando: ``pedidos.(jsonl|csv) resultados.(jsonl|csv)``."""
+    parser = argparse.ArgumentParser(
+        description="Processa um arquivo de pedidos em fluxo."
+    )
+    parser.add_argument("source", type=Path, help="arquivo de pedidos")
+    parser.add_argument("destination", type=Path, help="arquivo de resultados")
+    parser.add_argument(
+        "--timings", action="store_true", help="imprime os tempos por etapa"
+    )
+    parser.add_argument(
+        "--profile", type=Path, help="grava um perfil cProfile (.pstats) da execução"
+    )
+    args = parser.parse_args(argv)
+
+    with ExitStack() as stack:
+        recorder = None
+        if args.timings:
+            recorder = stack.enter_context(instrumentation.recording())
+        if args.profile:
+            stack.enter_context(instrumentation.profiled(args.profile))
+        totals = run_pipeline(args.source, args.destination)
+    print(f"pedidos processados: {totals.processed}")
+    print(f"pedidos rejeitados : {totals.rejected + totals.invalid}")
+    print("TOTAL GERAL =", totals.total)
+    if recorder is not None:
+        print()
+        print(recorder.format_summary())
+    if args.profile:
+        print(f"perfil gravado em {args.profile}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Tabela de preços recarregável a quente, com snapshots versionados.
+
+Os preços base deixam de ser constantes de módulo copiadas na importação: a
+tabela publica snapshots imutáveis, cada um com um número de versão, e a
+troca do snapshot vigente é uma única atribuição. Cálculos em andamento
+terminam com o snapshot que já tinham; os próximos usam o novo.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+from ._tracking import bump_version
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class PriceSnapshot:
+    """Conjunto imutável de preços base por produto."""
+
+    version: int
+    prices: Mapping[str, float]
+    source: str | None = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "prices", MappingProxyType(dict(self.prices)))
+
+
+class PriceTable:
+    """Mantém o snapshot vigente e publica novas versões de preços.
+
+    Leitores obtêm ``current`` sem lock; a publicação serializa apenas os
+    escritores. Cada publicação incrementa a versão de configuração usada pelo
+    ``PricingCache``, invalidando preços memorizados.
+    """
+
+    def __init__(self, snapshot: PriceSnapshot, path: Path | None = None) -> None:
+        self.current = snapshot
+        self.path = Path(path) if path is not None else None
+        self._file_stamp = _stamp(self.path) if self.path is not None else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_mapping(cls, prices: Mapping[str, float]) -> PriceTable:
+        """Cria a tabela com os preços informados como versão 1."""
+        return cls(PriceSnapshot(version=1, prices=_validate(prices)))
+
+    @classmethod
+    def from_file(cls, path: Path) -> PriceTable:
+        """Cria a tabela a partir de um arquivo JSON ``{"produto": preco}``."""
+        path = Path(path)
+        prices = _read_prices(path)
+        return cls(PriceSnapshot(version=1, prices=prices, source=str(path)), path)
+
+    def publish(
+        self, prices: Mapping[str, float], source: str | None = None
+    ) -> PriceSnapshot:
+        """Publica um novo snapshot e o torna vigente."""
+        prices = _validate(prices)
+        with self._lock:
+            snapshot = PriceSnapshot(
+                version=self.current.version + 1, prices=prices, source=source
+            )
+            self.current = snapshot
+        bump_version()
+        logger.info("tabela de precos atualizada para a versao %s", snapshot.version)
+        return snapshot
+
+    def reload_if_changed(self) -> bool:
+        """Recarrega o arquivo de origem se ele mudou desde a última leitura.
+
+        Um arquivo inválido é registrado em log e o snapshot atual é mantido.
+        Retorna ``True`` quando uma nova versão foi publicada.
+        """
+        if self.path is None:
+            return False
+        try:
+            stamp = _stamp(self.path)
+            if stamp == self._file_stamp:
+                return False
+            prices = _read_prices(self.path)
+        except (OSError, ValueError) as exc:
+            logger.error("falha ao recarregar tabela de precos: %s", exc)
+            return False
+        self._file_stamp = stamp
+        self.publish(prices, source=str(self.path))
+        return True
+
+    def watch(self, interval: float = 1.0) -> PriceTableWatcher:
+        """Inicia uma thread que verifica o arquivo a cada ``interval`` segundos."""
+        watcher = PriceTableWatcher(self, interval)
+        watcher.start()
+        return watcher
+
+
+class PriceTableWatcher(threading.Thread):
+    """Thread que recarrega a tabela quando o arquivo de origem muda."""
+
+    def __init__(self, table: PriceTable, interval: float) -> None:
+        super().__init__(name="petrobahia-price-table", daemon=True)
+        self._table = table
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        """Verifica o arquivo periodicamente até ``stop`` ser chamado."""
+        while not self._stopped.wait(self._interval):
+            self._table.reload_if_changed()
+
+    def stop(self) -> None:
+        """Encerra a verificação e aguarda a thread terminar."""
+        self._stopped.set()
+        self.join()
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_prices(path: Path) -> dict[str, float]:
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Tabela de preços inválida em {path}: {exc}") from exc
+    if not isinstance(data, dict):
+        raise ValueError(f"Tabela de preços inválida em {path}: esperado objeto JSON")
+    return _validate(data)
+
+
+def _validate(prices: Mapping[str, object]) -> dict[str, float]:
+    validated = {}
+    for product, price in prices.items():
+        if isinstance(price, bool) or not isinstance(price, (int, float)) or price < 0:
+            raise ValueError(f"Preço inválido para {product!r}: {price!r}")
+        validated[str(product)] = float(price)
+    return validated
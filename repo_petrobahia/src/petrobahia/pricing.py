@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Protocol
-
+import logging
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Iterable, Mapping, NamedTuple, Protocol
+
+from . import instrumentation
+from ._arrays import group_rows, require_numpy
+from ._dispatch import StrategyIndex
+from ._tracking import TrackedConfig, TrackedDict
+from .fixed_point import (
+    BASIS_POINTS,
+    ML_PER_LITER,
+    from_float,
+    parameter_amount,
+    to_float,
+    to_milliliters,
+    unit_factor,
+)
 from .models import Order
+from .tiers import TierTable
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from numpy import ndarray
+
+    from .price_table import PriceSnapshot, PriceTable
 
-BASE_PRICES = {
-    "diesel": 3.99,
-    "gasolina": 5.19,
-    "etanol": 3.59,
-    "lubrificante": 25.0,
-}
+logger = logging.getLogger(__name__)
+
+BASE_PRICES = TrackedDict(
+    {
+        "diesel": 3.99,
+        "gasolina": 5.19,
+        "etanol": 3.59,
+        "lubrificante": 25.0,
+    }
+)
 
 
 class PricingStrategy(Protocol):
@@ -29,11 +53,16 @@ class PricingStrategy(Protocol):
 
 
 @dataclass(slots=True)
-class DieselPricingStrategy:
+class DieselPricingStrategy(TrackedConfig):
     """Define estratégia de preço para diesel"""
 
     unit_price: float = BASE_PRICES["diesel"]
 
+    @property
+    def dispatch_key(self) -> str:
+        """Produto atendido, usado pelo índice do ``PriceCalculator``."""
+        return "diesel"
+
     def supports(self, order: Order) -> bool:
         """Verifica se o produto é diesel."""
         return order.product == "diesel"
@@ -47,19 +76,43 @@ class DieselPricingStrategy:
             subtotal *= 0.95
         return subtotal
 
+    def calculate_array(self, quantities: ndarray) -> ndarray:
+        """Versão vetorizada de ``calculate`` para um lote de quantidades."""
+        np = require_numpy()
+        subtotal = self.unit_price * quantities
+        return np.where(
+            quantities > 1000,
+            subtotal * 0.9,
+            np.where(quantities > 500, subtotal * 0.95, subtotal),
+        )
+
+    def calculate_fixed(self, quantity_ml: int) -> int:
+        """Versão em ponto fixo de ``calculate`` (mililitros → subcentavos)."""
+        amount = unit_factor(self.unit_price) * quantity_ml
+        if quantity_ml > 1000 * ML_PER_LITER:
+            return amount * 9000 // BASIS_POINTS
+        if quantity_ml > 500 * ML_PER_LITER:
+            return amount * 9500 // BASIS_POINTS
+        return amount
+
     def debug_message(self, price: float) -> str:
         """Mensagem de debug opcional após o cálculo do preço para diesel."""
         return f"calc diesel {price}"
 
 
 @dataclass(slots=True)
-class GasolinePricingStrategy:
+class GasolinePricingStrategy(TrackedConfig):
     """Define estratégia de preço para gasolina"""
 
     unit_price: float = BASE_PRICES["gasolina"]
     bonus_threshold: float = 200
     bonus_value: float = 100
 
+    @property
+    def dispatch_key(self) -> str:
+        """Produto atendido, usado pelo índice do ``PriceCalculator``."""
+        return "gasolina"
+
     def supports(self, order: Order) -> bool:
         """Verifica se o produto é gasolina."""
         return order.product == "gasolina"
@@ -71,17 +124,37 @@ class GasolinePricingStrategy:
             subtotal -= self.bonus_value
         return subtotal
 
+    def calculate_array(self, quantities: ndarray) -> ndarray:
+        """Versão vetorizada de ``calculate`` para um lote de quantidades."""
+        np = require_numpy()
+        subtotal = self.unit_price * quantities
+        return np.where(
+            quantities > self.bonus_threshold, subtotal - self.bonus_value, subtotal
+        )
+
+    def calculate_fixed(self, quantity_ml: int) -> int:
+        """Versão em ponto fixo de ``calculate`` (mililitros → subcentavos)."""
+        amount = unit_factor(self.unit_price) * quantity_ml
+        if quantity_ml > self.bonus_threshold * ML_PER_LITER:
+            amount -= parameter_amount(self.bonus_value)
+        return amount
+
     def debug_message(self, price: float) -> str:
         """Mensagem de debug opcional após o cálculo do preço para gasolina."""
         return f"calc gas {price}"
 
 
 @dataclass(slots=True)
-class EthanolPricingStrategy:
+class EthanolPricingStrategy(TrackedConfig):
     """Define estratégia de preço para etanol"""
 
     unit_price: float = BASE_PRICES["etanol"]
 
+    @property
+    def dispatch_key(self) -> str:
+        """Produto atendido, usado pelo índice do ``PriceCalculator``."""
+        return "etanol"
+
     def supports(self, order: Order) -> bool:
         """Verifica se o produto é etanol."""
         return order.product == "etanol"
@@ -93,17 +166,35 @@ class EthanolPricingStrategy:
             subtotal *= 0.97
         return subtotal
 
+    def calculate_array(self, quantities: ndarray) -> ndarray:
+        """Versão vetorizada de ``calculate`` para um lote de quantidades."""
+        np = require_numpy()
+        subtotal = self.unit_price * quantities
+        return np.where(quantities > 80, subtotal * 0.97, subtotal)
+
+    def calculate_fixed(self, quantity_ml: int) -> int:
+        """Versão em ponto fixo de ``calculate`` (mililitros → subcentavos)."""
+        amount = unit_factor(self.unit_price) * quantity_ml
+        if quantity_ml > 80 * ML_PER_LITER:
+            return amount * 9700 // BASIS_POINTS
+        return amount
+
     def debug_message(self, price: float) -> str:
         """Mensagem de debug opcional após o cálculo do preço para etanol."""
         return f"calc eta {price}"
 
 
 @dataclass(slots=True)
-class LubricantPricingStrategy:
+class LubricantPricingStrategy(TrackedConfig):
     """Define estratégia de preço para lubrificantes."""
 
     unit_price: float = BASE_PRICES["lubrificante"]
 
+    @property
+    def dispatch_key(self) -> str:
+        """Produto atendido, usado pelo índice do ``PriceCalculator``."""
+        return "lubrificante"
+
     def supports(self, order: Order) -> bool:
         """Verifica se o produto é lubrificante."""
         return order.product == "lubrificante"
@@ -112,51 +203,293 @@ class LubricantPricingStrategy:
         """Calcula o preço do pedido conforme a estratégia para lubrificantes."""
         return self.unit_price * order.quantity
 
+    def calculate_array(self, quantities: ndarray) -> ndarray:
+        """Versão vetorizada de ``calculate`` para um lote de quantidades."""
+        return self.unit_price * quantities
+
+    def calculate_fixed(self, quantity_ml: int) -> int:
+        """Versão em ponto fixo de ``calculate`` (mililitros → subcentavos)."""
+        return unit_factor(self.unit_price) * quantity_ml
+
     def debug_message(self, price: float) -> str:
         """Mensagem de debug opcional após o cálculo do preço para lubrificantes."""
         return f"calc lub {price}"
 
 
 @dataclass(slots=True)
-class UnknownProductStrategy:
+class TieredPricingStrategy(TrackedConfig):
+    """Estratégia genérica por faixas de quantidade de um produto.
+
+    O subtotal é ``unit_price * quantidade`` ajustado pela faixa de
+    ``tiers`` em que a quantidade cai, encontrada por busca binária. Com
+    ``DEFAULT_TIERS`` reproduz exatamente diesel, gasolina, etanol e
+    lubrificante, inclusive nas versões vetorizada e em ponto fixo.
+    """
+
+    product: str
+    unit_price: float
+    tiers: TierTable = TierTable()
+    label: str | None = None
+
+    @property
+    def dispatch_key(self) -> str:
+        """Produto atendido, usado pelo índice do ``PriceCalculator``."""
+        return self.product
+
+    def supports(self, order: Order) -> bool:
+        """Verifica se o pedido é do produto da estratégia."""
+        return order.product == self.product
+
+    def calculate(self, order: Order) -> float:
+        """Calcula o preço do pedido aplicando a faixa da quantidade."""
+        return self.tiers.apply(self.unit_price * order.quantity, order.quantity)
+
+    def calculate_array(self, quantities: ndarray) -> ndarray:
+        """Versão vetorizada de ``calculate`` para um lote de quantidades."""
+        return self.tiers.apply_array(self.unit_price * quantities, quantities)
+
+    def calculate_fixed(self, quantity_ml: int) -> int:
+        """Versão em ponto fixo de ``calculate`` (mililitros → subcentavos)."""
+        return self.tiers.apply_fixed(
+            unit_factor(self.unit_price) * quantity_ml, quantity_ml
+        )
+
+    def debug_message(self, price: float) -> str:
+        """Mensagem de debug opcional após o cálculo do preço."""
+        return f"calc {self.label or self.product} {price}"
+
+
+# Rótulos das mensagens de debug das estratégias originais.
+DEBUG_LABELS = {"gasolina": "gas", "etanol": "eta", "lubrificante": "lub"}
+
+
+def build_tiered_strategies(
+    tables: Mapping[str, TierTable], prices: Mapping[str, float] = BASE_PRICES
+) -> list[TieredPricingStrategy]:
+    """Uma ``TieredPricingStrategy`` por produto de ``tables``.
+
+    Lança ``ValueError`` se algum produto não tiver preço base em ``prices``.
+    """
+    missing = sorted(set(tables) - set(prices))
+    if missing:
+        raise ValueError(f"Produtos sem preço base: {', '.join(missing)}")
+    return [
+        TieredPricingStrategy(
+            product, prices[product], table, label=DEBUG_LABELS.get(product)
+        )
+        for product, table in tables.items()
+    ]
+
+
+@dataclass(slots=True)
+class UnknownProductStrategy(TrackedConfig):
     """Fallback para produtos não cadastrados."""
 
     message: str = "tipo desconhecido, devolvendo 0"
 
-    def supports(self) -> bool:  # pragma: no cover - fallback sempre usado por último
+    def supports(self, _order: Order) -> bool:
         """Sempre suporta qualquer pedido como fallback."""
         return True
 
-    def calculate(self) -> float:
+    def calculate(self, _order: Order) -> float:
         """Retorna preço zero para produtos desconhecidos."""
-        print(self.message)
+        logger.warning("%s", self.message)
         return 0.0
 
-    def debug_message(self) -> str:
+    def calculate_array(self, quantities: ndarray) -> ndarray:
+        """Retorna preço zero para todo o lote, sem mensagens por pedido."""
+        np = require_numpy()
+        return np.zeros(len(quantities))
+
+    def calculate_fixed(self, _quantity_ml: int) -> int:
+        """Retorna preço zero para produtos desconhecidos."""
+        logger.warning("%s", self.message)
+        return 0
+
+    def debug_message(self, _price: float) -> str:
         """Mensagem de debug opcional após o cálculo do preço para produtos desconhecidos."""
         return self.message
 
 
+class PricingBinding(NamedTuple):
+    """Estratégias vigentes em um cálculo e a versão da tabela de preços usada."""
+
+    version: int | None
+    strategies: list[PricingStrategy]
+    index: StrategyIndex | None
+
+
 class PriceCalculator:  # pylint: disable=too-few-public-methods
     """Orquestra o cálculo de preço escolhendo a melhor estratégia."""
 
-    def __init__(self, strategies: Iterable[PricingStrategy]) -> None:
+    def __init__(
+        self,
+        strategies: Iterable[PricingStrategy],
+        *,
+        indexed: bool = True,
+        price_table: PriceTable | None = None,
+    ) -> None:
+        """Inicializa o calculador.
+
+        Com ``indexed=True`` as estratégias que declaram ``dispatch_key`` são
+        indexadas por produto; com ``False`` a escolha é uma varredura linear.
+        Com ``price_table``, o ``unit_price`` de cada estratégia passa a vir do
+        snapshot vigente da tabela, trocado sem reiniciar o processo.
+        """
         strategies = list(strategies)
         if not strategies:
             raise ValueError("É necessário informar ao menos uma estratégia de preço.")
         self._strategies = strategies
+        self._indexed = indexed
+        self._price_table = price_table
+        self._binding = self._bind(strategies, version=None)
+        if price_table is not None:
+            self._binding = self._bind_snapshot(price_table.current)
+
+    @property
+    def price_version(self) -> int | None:
+        """Versão da tabela de preços vigente (``None`` sem tabela)."""
+        return self.pin().version
+
+    def pin(self) -> PricingBinding:
+        """Fixa as estratégias vigentes para um ou mais cálculos.
+
+        Quando a tabela de preços publica um novo snapshot, as estratégias são
+        recriadas uma única vez com os novos preços; cálculos em andamento
+        continuam usando o conjunto que fixaram.
+        """
+        binding = self._binding
+        if self._price_table is None:
+            return binding
+        snapshot = self._price_table.current
+        if binding.version != snapshot.version:
+            binding = self._bind_snapshot(snapshot)
+            self._binding = binding
+        return binding
+
+    def calculate(self, order: Order, binding: PricingBinding | None = None) -> float:
+        """Calcula o preço do pedido escolhendo a melhor estratégia disponível.
+
+        ``binding`` (obtido com ``pin``) permite saber qual versão da tabela
+        de preços foi usada no cálculo.
+        """
+        recorder = instrumentation.active
+        if recorder is None:
+            strategy = self.select(order, binding)
+            price = strategy.calculate(order)
+        else:
+            start = recorder.clock()
+            strategy = self.select(order, binding)
+            start = recorder.lap("pricing.select", start)
+            price = strategy.calculate(order)
+            recorder.lap("pricing.calculate", start)
+            recorder.count(f"pricing.{type(strategy).__name__}")
+        if logger.isEnabledFor(logging.DEBUG):
+            debug_message = strategy.debug_message(price)
+            if debug_message:
+                logger.debug("%s", debug_message)
+        return price
 
-    def calculate(self, order: Order) -> float:
-        """Calcula o preço do pedido escolhendo a melhor estratégia disponível."""
-        for strategy in self._strategies:
-            if strategy.supports(order):
-                price = strategy.calculate(order)
-                debug_message = strategy.debug_message(price)
-                if debug_message:
-                    print(debug_message)
-                return price
+    def calculate_fixed(
+        self, order: Order, binding: PricingBinding | None = None
+    ) -> int:
+        """Versão em ponto fixo de ``calculate``, em subcentavos inteiros.
+
+        A quantidade é convertida em mililitros e passada ao
+        ``calculate_fixed`` da estratégia; estratégias sem essa operação são
+        calculadas em ``float`` e convertidas com precisão de centavo.
+        """
+        recorder = instrumentation.active
+        if recorder is None:
+            strategy = self.select(order, binding)
+            amount = self._calculate_fixed(strategy, order)
+        else:
+            start = recorder.clock()
+            strategy = self.select(order, binding)
+            start = recorder.lap("pricing.select", start)
+            amount = self._calculate_fixed(strategy, order)
+            recorder.lap("pricing.calculate", start)
+            recorder.count(f"pricing.{type(strategy).__name__}")
+        if logger.isEnabledFor(logging.DEBUG):
+            debug_message = strategy.debug_message(to_float(amount))
+            if debug_message:
+                logger.debug("%s", debug_message)
+        return amount
+
+    def calculate_batch(
+        self,
+        products: ndarray,
+        quantities: ndarray,
+        binding: PricingBinding | None = None,
+    ) -> ndarray:
+        """Calcula os preços de um lote colunar de pedidos.
+
+        As linhas são agrupadas por produto e cada grupo é precificado de uma
+        vez pela estratégia escolhida, com o mesmo resultado de ``calculate``.
+        Estratégias sem ``calculate_array`` são avaliadas linha a linha. O lote
+        inteiro usa um único snapshot da tabela de preços.
+        """
+        np = require_numpy()
+        binding = binding or self.pin()
+        products = np.asarray(products, dtype=str)
+        quantities = np.asarray(quantities, dtype=float)
+        prices = np.zeros(len(quantities))
+        for product, rows in group_rows(products):
+            group_quantities = quantities[rows]
+            strategy = self.select(
+                Order(
+                    customer_name="",
+                    product=product,
+                    quantity=float(group_quantities[0]),
+                ),
+                binding,
+            )
+            calculate_array = getattr(strategy, "calculate_array", None)
+            if calculate_array is not None:
+                prices[rows] = calculate_array(group_quantities)
+            else:
+                prices[rows] = [
+                    strategy.calculate(
+                        Order(customer_name="", product=product, quantity=float(qty))
+                    )
+                    for qty in group_quantities
+                ]
+        return prices
+
+    def select(
+        self, order: Order, binding: PricingBinding | None = None
+    ) -> PricingStrategy:
+        """Estratégia que precifica o pedido no ``binding`` (ou no vigente)."""
+        binding = binding or self.pin()
+        if binding.index is not None:
+            strategy = binding.index.find(order.product, order)
+            if strategy is not None:
+                return strategy
+        else:
+            for strategy in binding.strategies:
+                if strategy.supports(order):
+                    return strategy
         # Fallback garantido pelas estratégias configuradas.
-        last_strategy = self._strategies[-1]
-        price = last_strategy.calculate(order)
-        print(last_strategy.debug_message(price))
-        return price
+        return binding.strategies[-1]
+
+    @staticmethod
+    def _calculate_fixed(strategy: PricingStrategy, order: Order) -> int:
+        calculate_fixed = getattr(strategy, "calculate_fixed", None)
+        if calculate_fixed is None:
+            return from_float(strategy.calculate(order))
+        return calculate_fixed(to_milliliters(order.quantity))
+
+    def _bind(
+        self, strategies: list[PricingStrategy], version: int | None
+    ) -> PricingBinding:
+        index = StrategyIndex(strategies) if self._indexed else None
+        return PricingBinding(version=version, strategies=strategies, index=index)
+
+    def _bind_snapshot(self, snapshot: PriceSnapshot) -> PricingBinding:
+        strategies = []
+        for strategy in self._strategies:
+            product = getattr(strategy, "dispatch_key", None)
+            if product in snapshot.prices and hasattr(strategy, "unit_price"):
+                strategy = replace(strategy, unit_price=snapshot.prices[product])
+            strategies.append(strategy)
+        return self._bind(strategies, version=snapshot.version)
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import os
+import time
 from abc import ABC
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Protocol
 
 from .models import Customer
 
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from .indexes import HashIndex
+
+
+class DuplicateCustomerError(ValueError):
+    """Indica que já existe um cliente cadastrado com o mesmo CNPJ."""
+
 
 class CustomerRepository(Protocol):
     """Contrato para persistência de clientes."""
@@ -19,6 +28,28 @@ class CustomerRepository(Protocol):
         pass
 
 
+class QueryableCustomerRepository(CustomerRepository, Protocol):
+    """Repositório de clientes que também permite consultas."""
+
+    # pylint: disable=unnecessary-pass
+
+    def get_by_cnpj(self, cnpj: str) -> Customer | None:
+        """Retorna o cliente com o CNPJ informado, se existir."""
+        pass
+
+    def get_by_name(self, name: str) -> Customer | None:
+        """Retorna o primeiro cliente cadastrado com o nome informado."""
+        pass
+
+    def exists(self, cnpj: str) -> bool:
+        """Indica se há cliente cadastrado com o CNPJ informado."""
+        pass
+
+    def iter_all(self) -> Iterator[Customer]:
+        """Percorre todos os clientes sem carregá-los de uma só vez."""
+        pass
+
+
 class BaseFileRepository(ABC):
     """Comportamentos comuns a repositórios baseados em arquivo."""
 
@@ -37,10 +68,256 @@ class FileCustomerRepository(BaseFileRepository, CustomerRepository):
 
     def save(self, customer: Customer) -> None:
         """Salva um cliente no arquivo configurado."""
+        with self._file_path.open("a", encoding="utf-8") as handle:
+            handle.write(self._serialize(customer))
+
+    @staticmethod
+    def _serialize(customer: Customer) -> str:
         record = {
             "nome": customer.name,
             "email": customer.email,
             "cnpj": customer.cnpj,
         }
-        with self._file_path.open("a", encoding="utf-8") as handle:
-            handle.write(f"{record}\n")
+        return f"{record}\n"
+
+
+class BatchedFileCustomerRepository(FileCustomerRepository):
+    """Grava clientes em lote mantendo um único descritor de arquivo aberto.
+
+    Os registros ficam em memória e são gravados quando o lote atinge
+    ``max_records`` registros, ``max_bytes`` bytes ou quando ``flush_interval``
+    segundos se passaram desde a última gravação (verificado a cada ``save``).
+    Com ``fsync=True`` cada ``flush`` também força a escrita em disco,
+    trocando vazão por durabilidade. O formato do arquivo é o mesmo de
+    ``FileCustomerRepository``.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        file_path: Path,
+        *,
+        max_records: int = 1000,
+        max_bytes: int = 1024 * 1024,
+        flush_interval: float | None = 1.0,
+        fsync: bool = False,
+    ) -> None:
+        """Abre o arquivo em modo de acréscimo com a política de gravação informada."""
+        super().__init__(file_path)
+        self._max_records = max_records
+        self._max_bytes = max_bytes
+        self._flush_interval = flush_interval
+        self._fsync = fsync
+        self._buffer: list[bytes] = []
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+        self._handle: BinaryIO | None = self._file_path.open("ab")
+
+    def save(self, customer: Customer) -> None:
+        """Adiciona o cliente ao lote, gravando-o se algum limite for atingido."""
+        self._append(customer)
+        if self._should_flush():
+            self.flush()
+
+    def save_many(self, customers: Iterable[Customer]) -> None:
+        """Adiciona vários clientes, gravando o lote sempre que ele enche."""
+        for customer in customers:
+            self._append(customer)
+            if self._should_flush():
+                self.flush()
+
+    def flush(self, *, fsync: bool | None = None) -> None:
+        """Grava os registros pendentes.
+
+        ``fsync`` sobrepõe a política configurada para esta chamada.
+        """
+        if self._handle is None:
+            raise ValueError("Repositório já foi fechado.")
+        if self._buffer:
+            self._handle.write(b"".join(self._buffer))
+            self._buffer.clear()
+            self._buffered_bytes = 0
+        self._handle.flush()
+        if self._fsync if fsync is None else fsync:
+            os.fsync(self._handle.fileno())
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Grava o lote pendente e fecha o arquivo."""
+        if self._handle is None:
+            return
+        self.flush()
+        self._handle.close()
+        self._handle = None
+
+    def __enter__(self) -> "BatchedFileCustomerRepository":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _append(self, customer: Customer) -> None:
+        if self._handle is None:
+            raise ValueError("Repositório já foi fechado.")
+        line = self._serialize(customer).encode("utf-8")
+        self._buffer.append(line)
+        self._buffered_bytes += len(line)
+
+    def _should_flush(self) -> bool:
+        if len(self._buffer) >= self._max_records:
+            return True
+        if self._buffered_bytes >= self._max_bytes:
+            return True
+        return (
+            self._flush_interval is not None
+            and time.monotonic() - self._last_flush >= self._flush_interval
+        )
+
+
+class IndexedFileCustomerRepository(FileCustomerRepository):
+    """Arquivo texto de clientes com índices persistentes por CNPJ e nome.
+
+    Os índices (``<arquivo>.cnpj.idx`` e ``<arquivo>.nome.idx``) são tabelas
+    hash em disco que apontam para o offset de cada linha, então as consultas
+    são O(1) e a abertura não relê o arquivo: apenas linhas acrescentadas por
+    outros escritores desde a última execução são indexadas. ``save`` lança
+    ``DuplicateCustomerError`` se o CNPJ já estiver cadastrado.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        """Abre o arquivo de dados e os índices, atualizando-os se necessário."""
+        # Importado aqui: ``main`` usa apenas ``FileCustomerRepository``.
+        # pylint: disable=import-outside-toplevel
+        from .customer_files import parse_customer_line
+
+        super().__init__(file_path)
+        self._parse_line = parse_customer_line
+        self._file_path.touch(exist_ok=True)
+        self._writer = self._file_path.open("ab")
+        self._reader = self._file_path.open("rb")
+        self._cnpj_index = self._open_index("cnpj")
+        self._name_index = self._open_index("nome")
+        self._catch_up()
+
+    def save(self, customer: Customer) -> None:
+        """Acrescenta o cliente ao arquivo e aos índices."""
+        if self._writer.seek(0, os.SEEK_END) != self._cnpj_index.indexed_size:
+            self._catch_up()
+        if self.exists(customer.cnpj):
+            raise DuplicateCustomerError(f"CNPJ ja cadastrado: {customer.cnpj}")
+
+        offset = self._writer.seek(0, os.SEEK_END)
+        if offset != self._cnpj_index.indexed_size:
+            # Linha incompleta deixada por uma gravação interrompida.
+            self._writer.write(b"\n")
+            offset += 1
+        line = self._serialize(customer).encode("utf-8")
+        self._writer.write(line)
+        self._writer.flush()
+        self._index(customer, offset, offset + len(line))
+
+    def get_by_cnpj(self, cnpj: str) -> Customer | None:
+        """Retorna o cliente com o CNPJ informado, se existir."""
+        for offset in self._cnpj_index.candidates(cnpj):
+            customer = self._read_at(offset)
+            if customer is not None and customer.cnpj == cnpj:
+                return customer
+        return None
+
+    def get_by_name(self, name: str) -> Customer | None:
+        """Retorna o primeiro cliente cadastrado com o nome informado."""
+        for offset in self._name_index.candidates(name):
+            customer = self._read_at(offset)
+            if customer is not None and customer.name == name:
+                return customer
+        return None
+
+    def exists(self, cnpj: str) -> bool:
+        """Indica se há cliente cadastrado com o CNPJ informado."""
+        return self.get_by_cnpj(cnpj) is not None
+
+    def iter_all(self) -> Iterator[Customer]:
+        """Percorre o arquivo linha a linha, ignorando linhas inválidas."""
+        # pylint: disable=import-outside-toplevel
+        from .customer_files import iter_customers
+
+        yield from iter_customers(self._file_path)
+
+    def close(self) -> None:
+        """Fecha o arquivo de dados e grava os índices."""
+        self._writer.close()
+        self._reader.close()
+        self._cnpj_index.close()
+        self._name_index.close()
+
+    def __enter__(self) -> "IndexedFileCustomerRepository":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _index_path(self, key: str) -> Path:
+        return self._file_path.with_name(f"{self._file_path.name}.{key}.idx")
+
+    def _open_index(self, key: str) -> HashIndex:
+        # Importado aqui: só o repositório indexado precisa de hashlib e mmap.
+        from .indexes import HashIndex  # pylint: disable=import-outside-toplevel
+
+        return HashIndex(self._index_path(key))
+
+    def _catch_up(self) -> None:
+        size = self._file_path.stat().st_size
+        start = min(self._cnpj_index.indexed_size, self._name_index.indexed_size)
+        if start > size:
+            # Arquivo de dados foi truncado ou substituído: reconstrói os índices.
+            self._cnpj_index.close()
+            self._name_index.close()
+            self._index_path("cnpj").unlink()
+            self._index_path("nome").unlink()
+            self._cnpj_index = self._open_index("cnpj")
+            self._name_index = self._open_index("nome")
+            start = 0
+
+        offset = start
+        with self._file_path.open("rb") as handle:
+            handle.seek(start)
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    break
+                end = offset + len(raw)
+                try:
+                    customer = self._parse_line(raw.decode("utf-8"))
+                except (ValueError, UnicodeDecodeError):
+                    customer = None
+                if customer is not None and not self.exists(customer.cnpj):
+                    self._index(customer, offset, end)
+                offset = end
+        self._cnpj_index.indexed_size = offset
+        self._name_index.indexed_size = offset
+
+    def _index(self, customer: Customer, offset: int, end: int) -> None:
+        self._cnpj_index.add(customer.cnpj, offset)
+        if self.get_by_name(customer.name) is None:
+            self._name_index.add(customer.name, offset)
+        self._cnpj_index.indexed_size = end
+        self._name_index.indexed_size = end
+
+    def _read_at(self, offset: int) -> Customer | None:
+        self._reader.seek(offset)
+        try:
+            return self._parse_line(self._reader.readline().decode("utf-8"))
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+
+def __getattr__(name: str) -> object:
+    # ``parse_customer_line`` vive em ``customer_files``; a reexportação é
+    # resolvida sob demanda para não carregar o leitor ao importar este módulo.
+    if name != "parse_customer_line":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # pylint: disable=import-outside-toplevel
+    from .customer_files import parse_customer_line
+
+    globals()[name] = parse_customer_line
+    return parse_customer_line
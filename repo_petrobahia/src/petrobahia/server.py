@@ -0,0 +1,335 @@
+"""Serviço local de precificação de pedidos sobre asyncio.
+
+Cada conexão (TCP ou socket Unix) envia pedidos em JSON, um por linha, no
+formato de ``PEDIDOS``; o serviço responde uma linha JSON por pedido, na mesma
+ordem. O número de pedidos em processamento é limitado globalmente e por
+conexão: quando os limites são atingidos o serviço para de ler do socket, e a
+pressão volta ao cliente pelo próprio TCP.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Literal, Sequence
+
+from . import parallel
+from .coalescer import OrderCoalescer
+from .logs import configure_console_logging
+from .models import PricedOrder
+from .orders import OrderProcessor, build_default_order_processor, map_order
+
+logger = logging.getLogger(__name__)
+
+ExecutorKind = Literal["inline", "thread", "process"]
+
+MAX_LINE_BYTES = 64 * 1024
+
+# Pedido lido e o ``Future`` do seu preço; sem ``Future``, o primeiro item já é
+# a resposta (pedido inválido).
+_Reply = tuple[dict[str, object], "asyncio.Future[PricedOrder] | None"]
+
+
+@dataclass(slots=True)
+class ServerStats:
+    """Contadores do serviço desde a inicialização."""
+
+    connections: int = 0
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+
+
+class OrderServer:
+    """Precifica pedidos recebidos por socket com concorrência limitada.
+
+    ``executor`` define onde roda a precificação, que é CPU pura:
+
+    - ``"inline"`` (padrão): no próprio laço de eventos; é o mais rápido para
+      pedidos individuais, pois o cálculo custa menos que a troca de thread;
+    - ``"thread"``: em um ``ThreadPoolExecutor`` com ``workers`` threads;
+    - ``"process"``: em um ``ProcessPoolExecutor``, com um ``OrderProcessor``
+      construído por ``processor_factory`` uma única vez em cada processo.
+
+    ``max_in_flight`` limita os pedidos em processamento no serviço todo e
+    ``max_pending_per_connection`` os pedidos lidos e ainda não respondidos de
+    cada conexão. Com ``batch_window`` (segundos), pedidos de todas as
+    conexões passam por um ``OrderCoalescer`` e são precificados em lotes de
+    até ``max_batch``; as métricas ficam em ``coalescer.metrics()``.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        processor_factory: Callable[[], OrderProcessor] = build_default_order_processor,
+        *,
+        executor: ExecutorKind = "inline",
+        workers: int | None = None,
+        max_in_flight: int = 1024,
+        max_pending_per_connection: int = 128,
+        batch_window: float | None = None,
+        max_batch: int = 256,
+    ) -> None:
+        if max_in_flight < 1 or max_pending_per_connection < 1:
+            raise ValueError("Os limites de pedidos devem ser positivos")
+        self.stats = ServerStats()
+        self._processor_factory = processor_factory
+        self._executor_kind = executor
+        self._workers = workers or os.cpu_count() or 1
+        self._max_in_flight = max_in_flight
+        self._max_pending = max_pending_per_connection
+        self._batch_window = batch_window
+        self._max_batch = max_batch
+        self.coalescer: OrderCoalescer | None = None
+        self._processor: OrderProcessor | None = None
+        self._executor: Executor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._connections: dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Passa a aceitar conexões TCP e retorna a porta efetivamente usada."""
+        self._prepare()
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=MAX_LINE_BYTES
+        )
+        port = self._server.sockets[0].getsockname()[1]
+        logger.info("servico de pedidos ouvindo em %s:%s", host, port)
+        return port
+
+    async def start_unix(self, path: Path) -> None:
+        """Passa a aceitar conexões em um socket Unix."""
+        self._prepare()
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, str(path), limit=MAX_LINE_BYTES
+        )
+        logger.info("servico de pedidos ouvindo em %s", path)
+
+    async def serve_forever(self) -> None:
+        """Atende conexões até o serviço ser cancelado ou fechado."""
+        if self._server is None:
+            raise RuntimeError("Servico nao iniciado")
+        await self._server.serve_forever()
+
+    async def close(self, timeout: float = 1.0) -> None:
+        """Para de aceitar conexões e libera o executor.
+
+        Conexões ativas têm até ``timeout`` segundos para terminar; depois
+        disso são encerradas.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._connections:
+            _done, remaining = await asyncio.wait(self._connections, timeout=timeout)
+            for task in remaining:
+                self._connections[task].close()
+            if remaining:
+                await asyncio.wait(remaining)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> OrderServer:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.close()
+
+    def _prepare(self) -> None:
+        self._slots = asyncio.Semaphore(self._max_in_flight)
+        if self._executor_kind == "inline":
+            self._processor = self._processor_factory()
+        elif self._executor_kind == "thread":
+            self._processor = self._processor_factory()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="petrobahia-pricing"
+            )
+        elif self._executor_kind == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                initializer=parallel.init_worker,
+                initargs=(self._processor_factory, logging.WARNING),
+            )
+        else:
+            raise ValueError(f"Executor desconhecido: {self._executor_kind!r}")
+        if self._batch_window is not None:
+            if self._processor is None:
+                price_many = parallel.price_orders
+            else:
+                price_many = self._processor.price_many
+            self.coalescer = OrderCoalescer(
+                price_many,
+                window=self._batch_window,
+                max_batch=self._max_batch,
+                executor=self._executor,
+            )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats.connections += 1
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        # Fila limitada: com ``max_pending`` respostas pendentes a leitura para.
+        pending: asyncio.Queue[_Reply | None] = asyncio.Queue(self._max_pending)
+        responder = asyncio.create_task(self._respond(pending, writer))
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                await pending.put(await self._submit(line))
+        except (ValueError, ConnectionError) as exc:
+            # ``ValueError``: linha acima de ``MAX_LINE_BYTES``.
+            logger.warning("conexao encerrada: %s", exc)
+        finally:
+            await pending.put(None)
+            await responder
+            del self._connections[task]
+
+    async def _submit(self, line: bytes) -> _Reply:
+        try:
+            payload = json.loads(line)
+            order = map_order(payload)
+        except (TypeError, ValueError, AttributeError) as exc:
+            self.stats.errors += 1
+            return {"erro": f"pedido invalido: {exc}"}, None
+
+        await self._slots.acquire()
+        self.stats.in_flight += 1
+        self.stats.requests += 1
+        loop = asyncio.get_running_loop()
+        if self.coalescer is not None:
+            priced = self.coalescer.submit(order)
+        elif self._executor is None:
+            priced = loop.create_future()
+            try:
+                priced.set_result(self._processor.price_order(order))
+            except Exception as exc:  # pylint: disable=broad-except
+                priced.set_exception(exc)
+        elif self._processor is None:
+            priced = loop.run_in_executor(
+                self._executor,
+                partial(parallel.price_order, order),
+            )
+        else:
+            priced = loop.run_in_executor(
+                self._executor, partial(self._processor.price_order, order)
+            )
+        if priced.done():
+            self._release()
+        else:
+            priced.add_done_callback(lambda _future: self._release())
+        return payload, priced
+
+    def _release(self) -> None:
+        self.stats.in_flight -= 1
+        self._slots.release()
+
+    async def _respond(
+        self, pending: asyncio.Queue[_Reply | None], writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while (reply := await pending.get()) is not None:
+                payload, priced = reply
+                writer.write(self._encode(payload, await _settled(priced)))
+                # Cliente lento: aguarda o buffer de saída esvaziar.
+                await writer.drain()
+        except ConnectionError:
+            # Cliente desconectou: descarta as respostas restantes.
+            while (reply := await pending.get()) is not None:
+                if reply[1] is not None:
+                    reply[1].cancel()
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def _encode(
+        self, payload: dict[str, object], priced: asyncio.Future[PricedOrder] | None
+    ) -> bytes:
+        if priced is None:
+            response = payload
+        elif priced.exception() is not None:
+            self.stats.errors += 1
+            logger.error("falha ao precificar pedido: %s", priced.exception())
+            response = {"erro": "falha interna ao precificar"}
+        else:
+            response = _response(payload, priced.result())
+        return json.dumps(response, ensure_ascii=False).encode() + b"\n"
+
+
+async def _settled(
+    priced: asyncio.Future[PricedOrder] | None,
+) -> asyncio.Future[PricedOrder] | None:
+    # Aguarda sem propagar a exceção: ela vira uma resposta de erro.
+    if priced is not None and not priced.done():
+        await asyncio.wait((priced,))
+    return priced
+
+
+def _response(payload: dict[str, object], priced: PricedOrder) -> dict[str, object]:
+    response: dict[str, object] = {"valor": priced.price}
+    if priced.price_version is not None:
+        response["versao_preco"] = priced.price_version
+    if "id" in payload:
+        response["id"] = payload["id"]
+    return response
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = OrderServer(
+        executor=args.executor,
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+        max_pending_per_connection=args.max_pending,
+        batch_window=args.batch_window,
+        max_batch=args.max_batch,
+    )
+    async with server:
+        if args.unix:
+            await server.start_unix(args.unix)
+        else:
+            await server.start_tcp(args.host, args.port)
+        await server.serve_forever()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Linha de comando: inicia o serviço em TCP ou socket Unix."""
+    parser = argparse.ArgumentParser(description="Serviço local de precificação.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", type=Path, help="caminho do socket Unix")
+    parser.add_argument(
+        "--executor", choices=("inline", "thread", "process"), default="inline"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-in-flight", type=int, default=1024)
+    parser.add_argument("--max-pending", type=int, default=128)
+    parser.add_argument(
+        "--batch-window",
+        type=float,
+        default=None,
+        help="janela de agrupamento em segundos (desligado por padrão)",
+    )
+    parser.add_argument("--max-batch", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    configure_console_logging(logging.WARNING)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
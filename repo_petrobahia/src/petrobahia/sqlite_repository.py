@@ -0,0 +1,165 @@
+"""Repositório de clientes baseado em SQLite."""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from ._sqlite import synchronous_mode
+from .customer_files import iter_customers
+from .models import Customer
+from .repositories import DuplicateCustomerError, QueryableCustomerRepository
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS clientes (
+        id INTEGER PRIMARY KEY,
+        nome TEXT NOT NULL,
+        email TEXT NOT NULL,
+        cnpj TEXT NOT NULL
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS clientes_cnpj ON clientes (cnpj)",
+    "CREATE INDEX IF NOT EXISTS clientes_nome ON clientes (nome)",
+)
+_INSERT = "INSERT INTO clientes (nome, email, cnpj) VALUES (?, ?, ?)"
+_INSERT_IGNORE = "INSERT OR IGNORE INTO clientes (nome, email, cnpj) VALUES (?, ?, ?)"
+_SELECT = "SELECT nome, email, cnpj FROM clientes"
+
+
+class SqliteCustomerRepository(QueryableCustomerRepository):
+    """Persiste clientes em um banco SQLite em modo WAL.
+
+    Uma única conexão é reutilizada por toda a vida do repositório. O CNPJ
+    tem índice único, então cadastros repetidos lançam
+    ``DuplicateCustomerError``.
+    """
+
+    def __init__(self, db_path: Path, *, synchronous: str | int = "NORMAL") -> None:
+        """Abre (ou cria) o banco e garante o esquema.
+
+        ``synchronous`` segue o ``PRAGMA`` do SQLite: ``FULL`` para máxima
+        durabilidade, ``NORMAL`` (padrão) para mais vazão com WAL. Valores fora
+        de ``OFF``, ``NORMAL``, ``FULL``, ``EXTRA`` (ou 0 a 3) lançam
+        ``ValueError``.
+        """
+        synchronous = synchronous_mode(synchronous)
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(db_path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(f"PRAGMA synchronous={synchronous}")
+        with self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+
+    def save(self, customer: Customer) -> None:
+        """Insere um cliente em sua própria transação."""
+        try:
+            with self._connection:
+                self._connection.execute(_INSERT, _row(customer))
+        except sqlite3.IntegrityError as exc:
+            raise DuplicateCustomerError(
+                f"CNPJ ja cadastrado: {customer.cnpj}"
+            ) from exc
+
+    def save_many(
+        self, customers: Iterable[Customer], *, skip_duplicates: bool = False
+    ) -> int:
+        """Insere vários clientes com ``executemany`` em uma única transação.
+
+        Por padrão um CNPJ repetido desfaz a transação inteira e lança
+        ``DuplicateCustomerError``; com ``skip_duplicates=True`` os repetidos
+        são ignorados. Retorna a quantidade de clientes inseridos.
+        """
+        statement = _INSERT_IGNORE if skip_duplicates else _INSERT
+        try:
+            with self._connection:
+                cursor = self._connection.executemany(
+                    statement, (_row(customer) for customer in customers)
+                )
+        except sqlite3.IntegrityError as exc:
+            raise DuplicateCustomerError("CNPJ ja cadastrado no lote") from exc
+        return cursor.rowcount
+
+    def get_by_cnpj(self, cnpj: str) -> Customer | None:
+        """Retorna o cliente com o CNPJ informado, se existir."""
+        return self._fetch_one(f"{_SELECT} WHERE cnpj = ?", (cnpj,))
+
+    def get_by_name(self, name: str) -> Customer | None:
+        """Retorna o primeiro cliente cadastrado com o nome informado."""
+        return self._fetch_one(f"{_SELECT} WHERE nome = ? ORDER BY id LIMIT 1", (name,))
+
+    def exists(self, cnpj: str) -> bool:
+        """Indica se há cliente cadastrado com o CNPJ informado."""
+        cursor = self._connection.execute(
+            "SELECT 1 FROM clientes WHERE cnpj = ?", (cnpj,)
+        )
+        return cursor.fetchone() is not None
+
+    def iter_all(self) -> Iterator[Customer]:
+        """Percorre os clientes na ordem de cadastro, sem carregá-los de uma vez."""
+        cursor = self._connection.execute(f"{_SELECT} ORDER BY id")
+        for name, email, cnpj in cursor:
+            yield Customer(name=name, email=email, cnpj=cnpj)
+
+    def count(self) -> int:
+        """Quantidade de clientes cadastrados."""
+        return self._connection.execute("SELECT COUNT(*) FROM clientes").fetchone()[0]
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._connection.close()
+
+    def __enter__(self) -> "SqliteCustomerRepository":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _fetch_one(self, query: str, params: Sequence[str]) -> Customer | None:
+        row = self._connection.execute(query, params).fetchone()
+        if row is None:
+            return None
+        return Customer(name=row[0], email=row[1], cnpj=row[2])
+
+
+def import_customer_file(
+    source: Path, repository: SqliteCustomerRepository, *, batch_size: int = 10_000
+) -> int:
+    """Importa um ``clientes.txt`` existente para o repositório SQLite.
+
+    O arquivo é lido em fluxo e gravado em lotes de ``batch_size``. Linhas
+    inválidas ou incompletas e CNPJs já cadastrados são ignorados. Retorna a
+    quantidade de clientes importados.
+    """
+    imported = 0
+    customers = iter_customers(Path(source))
+    while batch := list(islice(customers, batch_size)):
+        imported += repository.save_many(batch, skip_duplicates=True)
+    return imported
+
+
+def _row(customer: Customer) -> tuple[str, str, str]:
+    return (customer.name, customer.email, customer.cnpj)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Linha de comando do importador: ``origem.txt destino.db``."""
+    parser = argparse.ArgumentParser(
+        description="Importa um clientes.txt para um banco SQLite."
+    )
+    parser.add_argument("source", type=Path, help="arquivo clientes.txt de origem")
+    parser.add_argument("database", type=Path, help="banco SQLite de destino")
+    args = parser.parse_args(argv)
+
+    with SqliteCustomerRepository(args.database) as repository:
+        imported = import_customer_file(args.source, repository)
+        print(f"{imported} clientes importados ({repository.count()} no banco)")
+
+
+if __name__ == "__main__":
+    main()
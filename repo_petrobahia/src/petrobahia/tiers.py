@@ -0,0 +1,170 @@
+"""Tabelas de faixas de quantidade para a precificação por volume.
+
+Uma faixa vale para quantidades estritamente acima do seu limite (``acima``)
+e multiplica o subtotal por ``multiplier`` e, em seguida, abate
+``deduction`` reais. A tabela guarda os limites ordenados e a busca da faixa
+é um ``bisect`` (``searchsorted`` no NumPy para lotes), logarítmica no número
+de faixas: ``bisect_left`` conta os limites menores que a quantidade, o que
+reproduz as comparações ``>`` das estratégias originais.
+
+``DEFAULT_TIERS`` exprime as regras de diesel, gasolina, etanol e
+lubrificante; ``load_tier_tables`` lê tabelas de um arquivo JSON no formato
+``{"diesel": [{"acima": 500, "fator": 0.95}], "gasolina": [{"acima": 200,
+"abatimento": 100}]}``.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Mapping
+
+from ._arrays import require_numpy
+from .fixed_point import (BASIS_POINTS, parameter_amount, parameter_basis_points,
+                          to_milliliters)
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para anotações
+    from numpy import ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class QuantityTier:
+    """Faixa aplicada a quantidades acima de ``above``."""
+
+    above: float
+    multiplier: float = 1.0
+    deduction: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class TierTable:
+    """Faixas de um produto ordenadas pelo limite, com busca binária.
+
+    As posições das listas auxiliares são deslocadas de um: a posição 0 é a
+    ausência de faixa (fator 1 e nenhum abatimento), e a posição ``i`` é a
+    ``i``-ésima faixa, exatamente o valor devolvido por ``bisect_left``.
+    """
+
+    tiers: tuple[QuantityTier, ...] = ()
+    thresholds: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    multipliers: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    deductions: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    thresholds_ml: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    basis_points: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    deduction_amounts: tuple[int, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _arrays: tuple[ndarray, ...] | None = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        tiers = tuple(sorted(self.tiers, key=lambda tier: tier.above))
+        for previous, tier in zip(tiers, tiers[1:]):
+            if previous.above == tier.above:
+                raise ValueError(f"Limite de faixa repetido: {tier.above!r}")
+        assign = object.__setattr__
+        assign(self, "tiers", tiers)
+        assign(self, "thresholds", tuple(tier.above for tier in tiers))
+        assign(self, "multipliers", (1.0, *(tier.multiplier for tier in tiers)))
+        assign(self, "deductions", (0.0, *(tier.deduction for tier in tiers)))
+        assign(self, "thresholds_ml", tuple(map(to_milliliters, self.thresholds)))
+        basis_points = (parameter_basis_points(tier.multiplier) for tier in tiers)
+        assign(self, "basis_points", (BASIS_POINTS, *basis_points))
+        assign(
+            self,
+            "deduction_amounts",
+            (0, *(parameter_amount(tier.deduction) for tier in tiers)),
+        )
+        assign(self, "_arrays", None)
+
+    def __len__(self) -> int:
+        return len(self.tiers)
+
+    def lookup(self, quantity: float) -> QuantityTier | None:
+        """Faixa que se aplica a ``quantity``, se houver."""
+        position = bisect_left(self.thresholds, quantity)
+        return self.tiers[position - 1] if position else None
+
+    def apply(self, subtotal: float, quantity: float) -> float:
+        """Aplica ao subtotal a faixa de ``quantity``."""
+        position = bisect_left(self.thresholds, quantity)
+        if not position:
+            return subtotal
+        return subtotal * self.multipliers[position] - self.deductions[position]
+
+    def apply_array(self, subtotals: ndarray, quantities: ndarray) -> ndarray:
+        """Versão vetorizada de ``apply``, com ``searchsorted``."""
+        np = require_numpy()
+        if self._arrays is None:
+            object.__setattr__(
+                self,
+                "_arrays",
+                tuple(
+                    np.asarray(values, dtype=float)
+                    for values in (self.thresholds, self.multipliers, self.deductions)
+                ),
+            )
+        thresholds, multipliers, deductions = self._arrays
+        positions = np.searchsorted(thresholds, quantities, side="left")
+        return subtotals * multipliers[positions] - deductions[positions]
+
+    def apply_fixed(self, amount: int, quantity_ml: int) -> int:
+        """Versão em ponto fixo de ``apply`` (subcentavos e mililitros)."""
+        position = bisect_left(self.thresholds_ml, quantity_ml)
+        if not position:
+            return amount
+        return (
+            amount * self.basis_points[position] // BASIS_POINTS
+            - self.deduction_amounts[position]
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, object]]) -> TierTable:
+        """Cria a tabela a partir de linhas ``{"acima", "fator", "abatimento"}``."""
+        tiers = []
+        for row in rows:
+            if not isinstance(row, Mapping) or set(row) - _ROW_KEYS:
+                raise ValueError(f"Faixa inválida: {row!r}")
+            values = [row.get(key, default) for key, default in _ROW_DEFAULTS]
+            if any(
+                isinstance(value, bool) or not isinstance(value, (int, float))
+                for value in values
+            ):
+                raise ValueError(f"Faixa inválida: {row!r}")
+            above, multiplier, deduction = map(float, values)
+            if multiplier < 0 or deduction < 0:
+                raise ValueError(f"Faixa inválida: {row!r}")
+            tiers.append(QuantityTier(above, multiplier, deduction))
+        return cls(tuple(tiers))
+
+
+_ROW_DEFAULTS = (("acima", None), ("fator", 1.0), ("abatimento", 0.0))
+_ROW_KEYS = {key for key, _default in _ROW_DEFAULTS}
+
+DEFAULT_TIERS: Mapping[str, TierTable] = {
+    "diesel": TierTable(
+        (QuantityTier(500, multiplier=0.95), QuantityTier(1000, multiplier=0.9))
+    ),
+    "gasolina": TierTable((QuantityTier(200, deduction=100),)),
+    "etanol": TierTable((QuantityTier(80, multiplier=0.97),)),
+    "lubrificante": TierTable(),
+}
+
+
+def load_tier_tables(path: Path) -> dict[str, TierTable]:
+    """Lê as tabelas de faixas por produto de um arquivo JSON."""
+    import json  # pylint: disable=import-outside-toplevel
+
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Tabela de faixas inválida em {path}: {exc}") from exc
+    if not isinstance(data, dict) or not all(
+        isinstance(rows, list) for rows in data.values()
+    ):
+        raise ValueError(
+            f"Tabela de faixas inválida em {path}: esperado objeto de listas"
+        )
+    return {str(product): TierTable.from_rows(rows) for product, rows in data.items()}
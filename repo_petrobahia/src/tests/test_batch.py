@@ -0,0 +1,84 @@
+"""Testes do lote compacto de pedidos."""
+
+from __future__ import annotations
+
+import pytest
+
+from petrobahia.batch import OrderBatch, OrderBatchBuilder
+from petrobahia.discounts import PercentageCouponDiscount
+from petrobahia.models import Order
+from petrobahia.orders import build_default_order_processor
+from petrobahia.pricing import DieselPricingStrategy
+
+PEDIDOS = [
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 600, "cupom": None},
+]
+
+
+def test_from_payloads_interns_repeated_values() -> None:
+    batch = OrderBatch.from_payloads(PEDIDOS)
+
+    assert len(batch) == 5
+    assert batch.customer_table == ["TransLog", "MoveMais", "EcoFrota", "PetroPark"]
+    assert batch.product_table == ["diesel", "gasolina", "etanol", "lubrificante"]
+    assert batch[0].to_order() == Order("TransLog", "diesel", 1200.0, "MEGA10")
+    assert batch[-1].coupon is None
+
+
+def test_slices_share_buffers_without_copying() -> None:
+    batch = OrderBatch.from_payloads(PEDIDOS)
+
+    tail = batch[1:4]
+
+    assert len(tail) == 3
+    assert tail.quantities.obj is batch.quantities.obj
+    assert tail.customer_table is batch.customer_table
+    assert [view.product for view in tail] == ["gasolina", "etanol", "lubrificante"]
+    assert [view.quantity for view in batch[::2]] == [1200.0, 50.0, 600.0]
+
+
+def test_views_work_with_pricing_and_discount_strategies() -> None:
+    view = OrderBatch.from_payloads(PEDIDOS)[0]
+
+    assert DieselPricingStrategy().supports(view) is True
+    assert DieselPricingStrategy().calculate(view) == pytest.approx(3.99 * 1200 * 0.9)
+    assert PercentageCouponDiscount("MEGA10", 0.1).supports(view) is True
+
+    processor = build_default_order_processor()
+    assert [processor.process_order(v) for v in OrderBatch.from_payloads(PEDIDOS)] == [
+        processor.process(payload) for payload in PEDIDOS
+    ]
+
+
+def test_columns_feed_process_batch() -> None:
+    pytest.importorskip("numpy")
+    batch = OrderBatch.from_payloads(PEDIDOS)
+    processor = build_default_order_processor()
+
+    prices = processor.process_batch(*batch[1:].columns())
+
+    assert prices.tolist() == [processor.process(p) for p in PEDIDOS[1:]]
+
+
+def test_index_out_of_range_raises() -> None:
+    builder = OrderBatchBuilder()
+    builder.append("Cliente", "diesel", 10.0)
+    batch = builder.build()
+
+    with pytest.raises(IndexError):
+        batch[1]
+
+
+def test_builder_accepts_more_than_65536_products() -> None:
+    builder = OrderBatchBuilder()
+    for product in range(70_000):
+        builder.append("C", f"p{product}", 1.0)
+
+    batch = builder.build()
+
+    assert len(batch.product_table) == 70_000
+    assert batch[-1].product == "p69999"
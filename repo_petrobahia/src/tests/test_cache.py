@@ -0,0 +1,106 @@
+"""Testes do cache de precos."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import replace
+
+import pytest
+
+from petrobahia._tracking import current_version
+from petrobahia.cache import PricingCache
+from petrobahia.models import Order
+from petrobahia.orders import build_default_order_processor
+from petrobahia.pricing import BASE_PRICES, DieselPricingStrategy
+
+STANDING_ORDER = Order("TransLog", "diesel", 1200, "MEGA10")
+
+
+def test_cache_counts_hits_and_misses() -> None:
+    cache = PricingCache()
+    processor = build_default_order_processor(cache=cache)
+
+    first = processor.process_order(STANDING_ORDER)
+    second = processor.process_order(Order("Outra Frota", "diesel", 1200.0, "MEGA10"))
+
+    assert first == second == 3878.0
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.hit_rate == pytest.approx(0.5)
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = PricingCache(maxsize=2)
+
+    cache.get_or_compute("a", lambda: 1.0)
+    cache.get_or_compute("b", lambda: 2.0)
+    cache.get_or_compute("a", lambda: 0.0)  # "a" volta a ser o mais recente
+    cache.get_or_compute("c", lambda: 3.0)
+
+    assert cache.get_or_compute("a", lambda: -1.0) == 1.0
+    assert cache.get_or_compute("b", lambda: -2.0) == -2.0
+    assert cache.stats().evictions == 2
+
+
+def test_cache_is_invalidated_when_strategy_parameters_change() -> None:
+    cache = PricingCache()
+    processor = build_default_order_processor(cache=cache)
+    processor.process_order(STANDING_ORDER)
+
+    diesel = processor.price_calculator.select(STANDING_ORDER)
+    diesel.unit_price = 4.99
+
+    assert processor.process_order(STANDING_ORDER) == round(4.99 * 1200 * 0.9 * 0.9)
+    assert cache.stats().invalidations == 1
+
+
+def test_building_strategies_keeps_cache_valid() -> None:
+    cache = PricingCache()
+    processor = build_default_order_processor(cache=cache)
+    processor.process_order(STANDING_ORDER)
+    version = current_version()
+
+    build_default_order_processor()
+    replace(DieselPricingStrategy(), unit_price=4.99)
+
+    assert current_version() == version
+    assert processor.process_order(STANDING_ORDER) == 3878.0
+    assert cache.stats().invalidations == 0
+
+
+def test_cache_is_invalidated_when_base_prices_change() -> None:
+    cache = PricingCache()
+    cache.get_or_compute("diesel", lambda: 1.0)
+    original = BASE_PRICES["diesel"]
+    try:
+        BASE_PRICES["diesel"] = 4.5
+    finally:
+        BASE_PRICES["diesel"] = original
+
+    assert cache.get_or_compute("diesel", lambda: 2.0) == 2.0
+    assert len(cache) == 1
+
+
+def test_cache_is_safe_for_concurrent_readers() -> None:
+    cache = PricingCache(maxsize=8)
+    processor = build_default_order_processor(cache=cache)
+    orders = [Order("C", "etanol", float(q), None) for q in range(16)]
+    expected = [build_default_order_processor().process_order(o) for o in orders]
+    errors: list[str] = []
+
+    def worker() -> None:
+        for _ in range(200):
+            for order, price in zip(orders, expected):
+                if processor.process_order(order) != price:
+                    errors.append(order.product)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 4 * 200 * 15  # qtd zero nao passa pelo cache
+    assert len(cache) <= 8
@@ -0,0 +1,44 @@
+"""Testes da verificacao dos digitos verificadores do CNPJ."""
+
+from __future__ import annotations
+
+import pytest
+
+from petrobahia.cnpj import check_digits_valid, check_digits_valid_many, is_valid_cnpj
+
+VALIDOS = ["11222333000181", "11444777000161"]
+INVALIDOS = [
+    "11222333000182",
+    "11222333000191",
+    "12345678000199",
+    "00000000000000",
+    "1122233300018",
+    "11.222.333/0001-81",
+    "１１２２２３３３０００１８１",
+]
+
+
+@pytest.mark.parametrize("cnpj", VALIDOS)
+def test_is_valid_cnpj_accepts_known_numbers(cnpj: str) -> None:
+    assert is_valid_cnpj(cnpj)
+    assert check_digits_valid(cnpj.encode("ascii"))
+
+
+@pytest.mark.parametrize("cnpj", INVALIDOS)
+def test_is_valid_cnpj_rejects_bad_digits_and_formats(cnpj: str) -> None:
+    assert not is_valid_cnpj(cnpj)
+
+
+def test_check_digits_valid_many_matches_scalar() -> None:
+    pytest.importorskip("numpy")
+    values = VALIDOS + INVALIDOS + [f"{i:012d}00" for i in range(200)]
+
+    result = check_digits_valid_many(values)
+
+    assert result.tolist() == [is_valid_cnpj(value) for value in values]
+
+
+def test_check_digits_valid_many_handles_empty_and_unformatted_batches() -> None:
+    pytest.importorskip("numpy")
+    assert check_digits_valid_many([]).tolist() == []
+    assert check_digits_valid_many(["123", ""]).tolist() == [False, False]
@@ -0,0 +1,111 @@
+"""Testes do agrupador de pedidos em lotes."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from petrobahia.coalescer import OrderCoalescer
+from petrobahia.models import Order
+from petrobahia.orders import build_default_order_processor
+
+PEDIDOS = [
+    Order("TransLog", "diesel", 1200, "MEGA10"),
+    Order("MoveMais", "gasolina", 300),
+    Order("EcoFrota", "etanol", 50, "NOVO5"),
+    Order("PetroPark", "lubrificante", 12, "LUB2"),
+]
+VALORES = [3878.0, 1457.0, 170.52, 298.0]
+
+
+class _RecordingPriceMany:
+    def __init__(self) -> None:
+        self.processor = build_default_order_processor()
+        self.calls: list[int] = []
+
+    def __call__(self, orders):
+        self.calls.append(len(orders))
+        return self.processor.price_many(orders)
+
+
+def test_coalescer_batches_concurrent_orders_and_routes_results() -> None:
+    price_many = _RecordingPriceMany()
+
+    async def scenario():
+        coalescer = OrderCoalescer(price_many, window=0.01, max_batch=100)
+        results = await asyncio.gather(*(coalescer.price(order) for order in PEDIDOS))
+        return results, coalescer.metrics()
+
+    results, metrics = asyncio.run(scenario())
+
+    assert [result.order for result in results] == PEDIDOS
+    assert [result.price for result in results] == VALORES
+    assert price_many.calls == [4]
+    assert (metrics.batches, metrics.orders, metrics.batch_sizes) == (1, 4, {4: 1})
+    assert metrics.mean_added_latency_us > 0
+
+
+def test_coalescer_dispatches_when_batch_is_full() -> None:
+    price_many = _RecordingPriceMany()
+
+    async def scenario():
+        coalescer = OrderCoalescer(price_many, window=10.0, max_batch=2)
+        return await asyncio.wait_for(
+            asyncio.gather(*(coalescer.price(order) for order in PEDIDOS)), timeout=1
+        )
+
+    results = asyncio.run(scenario())
+
+    assert [result.price for result in results] == VALORES
+    assert price_many.calls == [2, 2]
+
+
+def test_coalescer_flush_sends_partial_batch() -> None:
+    price_many = _RecordingPriceMany()
+
+    async def scenario():
+        coalescer = OrderCoalescer(price_many, window=10.0, max_batch=100)
+        future = coalescer.submit(PEDIDOS[0])
+        coalescer.flush()
+        return await asyncio.wait_for(future, timeout=1)
+
+    assert asyncio.run(scenario()).price == 3878.0
+    assert price_many.calls == [1]
+
+
+def test_coalescer_propagates_failures_to_every_caller() -> None:
+    def failing(_orders):
+        raise RuntimeError("tabela indisponivel")
+
+    async def scenario():
+        coalescer = OrderCoalescer(failing, window=0.001)
+        return await asyncio.gather(
+            *(coalescer.price(order) for order in PEDIDOS), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_coalescer_prices_batches_in_executor() -> None:
+    price_many = _RecordingPriceMany()
+
+    async def scenario():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            coalescer = OrderCoalescer(
+                price_many, window=0.001, max_batch=3, executor=executor
+            )
+            return await asyncio.gather(*(coalescer.price(order) for order in PEDIDOS))
+
+    results = asyncio.run(scenario())
+
+    assert [result.price for result in results] == VALORES
+    assert price_many.calls == [3, 1]
+
+
+def test_coalescer_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError):
+        OrderCoalescer(lambda orders: [], max_batch=0)
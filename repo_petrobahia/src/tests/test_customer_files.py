@@ -0,0 +1,127 @@
+"""Testes da leitura em fluxo e da migração de arquivos de clientes."""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from petrobahia.customer_files import (TSV_HEADER, format_tsv_line,
+                                       iter_customers, migrate_to_tsv,
+                                       parse_customer_line, parse_record,
+                                       parse_tsv_line)
+from petrobahia.models import Customer
+from petrobahia.repositories import FileCustomerRepository
+
+TRICKY = [
+    Customer("Ana", "ana@example.com", "12.345.678/0001-90"),
+    Customer("D'Ávila", "d@example.com", "1"),
+    Customer('Aspas "duplas"', "x\\y@example.com", "2"),
+    Customer("Tab\there", "nova\nlinha@example.com", "3\r"),
+    Customer("", "", ""),
+]
+
+
+@pytest.mark.parametrize("customer", TRICKY)
+def test_parse_customer_line_reads_repository_format(customer: Customer) -> None:
+    line = repr({"nome": customer.name, "email": customer.email, "cnpj": customer.cnpj})
+
+    assert parse_customer_line(line + "\n") == customer
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "{'email': 'a@b.c', 'nome': 'x', 'cnpj': '1', 'idade': 3}",
+        '{ "nome" : "x" , "ativo": True, "limite": -1.5e3, "obs": None, }',
+        "{'nome': '\\x41\\u00e9\\101', 'lista': 0.5}",
+        "{}",
+    ],
+)
+def test_parse_record_matches_literal_eval(line: str) -> None:
+    assert parse_record(line) == ast.literal_eval(line)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "",
+        "{'nome': 'x'",
+        "{'nome': 'x',, 'cnpj': '1'}",
+        "{'nome': ['x']}",
+        "{1: 'x'}",
+        "{'nome': 'x'} extra",
+        "['nome', 'x']",
+    ],
+)
+def test_parse_record_rejects_invalid_lines(line: str) -> None:
+    with pytest.raises(ValueError):
+        parse_record(line)
+
+
+def test_parse_customer_line_requires_text_fields() -> None:
+    with pytest.raises(ValueError):
+        parse_customer_line("{'nome': 'x', 'email': 'e'}")
+    with pytest.raises(ValueError):
+        parse_customer_line("{'nome': 'x', 'email': 'e', 'cnpj': 123}")
+
+
+@pytest.mark.parametrize("customer", TRICKY)
+def test_tsv_line_round_trip(customer: Customer) -> None:
+    line = format_tsv_line(customer)
+
+    assert line.count("\n") == 1 and line.count("\t") == 2
+    assert parse_tsv_line(line) == customer
+
+
+def test_iter_customers_skips_invalid_and_partial_lines(tmp_path: Path) -> None:
+    path = tmp_path / "clientes.txt"
+    path.write_text(
+        "{'nome': 'A', 'email': 'a@x', 'cnpj': '1'}\n"
+        "lixo\n"
+        "{'nome': 'B', 'email': 'b@x', 'cnpj': '2'}\n"
+        "{'nome': 'C', 'email': 'c@x', 'cnpj': '3'}",
+        encoding="utf-8",
+    )
+
+    assert [c.cnpj for c in iter_customers(path)] == ["1", "2"]
+    with pytest.raises(ValueError, match=":2:"):
+        list(iter_customers(path, strict=True))
+
+
+def test_iter_customers_is_lazy(tmp_path: Path) -> None:
+    path = tmp_path / "clientes.txt"
+    path.write_text("{'nome': 'A', 'email': 'a@x', 'cnpj': '1'}\nlixo\n")
+
+    customers = iter_customers(path, strict=True)
+
+    assert next(customers) == Customer("A", "a@x", "1")
+    with pytest.raises(ValueError):
+        next(customers)
+
+
+def test_migrate_to_tsv_keeps_every_valid_customer(tmp_path: Path) -> None:
+    source = tmp_path / "clientes.txt"
+    repo = FileCustomerRepository(source)
+    for customer in TRICKY:
+        repo.save(customer)
+    with source.open("a", encoding="utf-8") as handle:
+        handle.write("invalida\n{'nome': 'parcial'")
+    destination = tmp_path / "clientes.tsv"
+
+    stats = migrate_to_tsv(source, destination)
+
+    assert (stats.migrated, stats.skipped) == (len(TRICKY), 2)
+    assert destination.read_text(encoding="utf-8").startswith(TSV_HEADER)
+    assert list(iter_customers(destination, strict=True)) == TRICKY
+    assert not destination.with_name("clientes.tsv.tmp").exists()
+
+
+def test_migrate_to_tsv_drops_partial_trailing_tsv_line(tmp_path: Path) -> None:
+    source = tmp_path / "clientes.tsv"
+    source.write_text(TSV_HEADER + "A\ta@x\t1\nB\tb@", encoding="utf-8")
+
+    stats = migrate_to_tsv(source, tmp_path / "copia.tsv")
+
+    assert (stats.migrated, stats.skipped) == (1, 1)
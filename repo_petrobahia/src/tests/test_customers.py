@@ -8,6 +8,7 @@ import pytest
 
 from petrobahia.customers import CustomerService
 from petrobahia.models import Customer
+from petrobahia.repositories import DuplicateCustomerError
 from petrobahia.validators import CustomerValidator, ValidationResult
 
 
@@ -76,3 +77,16 @@ def test_register_saves_customer_when_valid() -> None:
     assert saved.email == payload["email"]
     assert saved.cnpj == payload["cnpj"]
     assert validator.email_called_with == payload["email"]
+
+
+class DuplicateRepository(DummyRepository):
+    """Recusa qualquer cliente como se o CNPJ ja existisse."""
+
+    def save(self, customer: Customer) -> None:
+        raise DuplicateCustomerError(customer.cnpj)
+
+
+def test_register_returns_false_when_cnpj_already_registered() -> None:
+    service = CustomerService(repository=DuplicateRepository(), validator=DummyValidator())
+
+    assert service.register(_valid_payload()) is False
@@ -50,3 +50,47 @@ def test_discount_engine_returns_original_price_when_no_match() -> None:
     order = _order(coupon="MEGA10")
 
     assert engine.apply(200.0, order) == pytest.approx(200.0)
+
+
+def test_discount_engine_apply_batch_matches_scalar_path() -> None:
+    np = pytest.importorskip("numpy")
+    engine = DiscountEngine(
+        [
+            PercentageCouponDiscount("MEGA10", 0.10),
+            FlatCouponDiscount("LUB2", value=2, required_product="lubrificante"),
+        ]
+    )
+    products = ["diesel", "lubrificante", "lubrificante", "diesel", "etanol"]
+    coupons = ["MEGA10", "LUB2", None, "LUB2", ""]
+    prices = np.array([100.0, 50.0, 50.0, 30.0, 10.0])
+
+    result = engine.apply_batch(prices, np.array(products), coupons)
+    expected = [
+        engine.apply(price, _order(coupon=coupon or None, product=product))
+        for price, product, coupon in zip(prices.tolist(), products, coupons)
+    ]
+
+    assert result.tolist() == expected
+    assert prices.tolist() == [100.0, 50.0, 50.0, 30.0, 10.0]
+
+
+def test_discount_engine_index_keeps_first_match_order() -> None:
+    strategies = [
+        FlatCouponDiscount("LUB2", value=2, required_product="lubrificante"),
+        PercentageCouponDiscount("LUB2", 0.5),
+        PercentageCouponDiscount("LUB2", 0.1),
+    ]
+    indexed = DiscountEngine(strategies)
+    linear = DiscountEngine(strategies, indexed=False)
+
+    for product in ("lubrificante", "diesel"):
+        order = _order(coupon="LUB2", product=product)
+        assert indexed.apply(100.0, order) == linear.apply(100.0, order)
+
+    assert indexed.apply(100.0, _order(coupon="LUB2", product="diesel")) == 50.0
+
+
+def test_flat_coupon_discount_dispatch_key_depends_on_required_product() -> None:
+    assert FlatCouponDiscount("LUB2", value=2).dispatch_key == "LUB2"
+    restricted = FlatCouponDiscount("LUB2", value=2, required_product="lubrificante")
+    assert restricted.dispatch_key is None
@@ -0,0 +1,95 @@
+"""Testes da precificacao em ponto fixo (centavos e mililitros inteiros)."""
+
+from __future__ import annotations
+
+import pytest
+
+from petrobahia.discounts import DiscountEngine, FlatCouponDiscount
+from petrobahia.fixed_point import (
+    SUBUNITS,
+    round_half_even,
+    subtotal,
+    to_milliliters,
+    truncate,
+)
+from petrobahia.models import Order
+from petrobahia.orders import build_default_order_processor
+from petrobahia.pricing import PriceCalculator, UnknownProductStrategy
+
+
+@pytest.fixture
+def fixed():
+    return build_default_order_processor(fixed_point=True)
+
+
+@pytest.mark.parametrize(
+    ("amount", "expected"),
+    [(5, 0), (15, 2), (25, 2), (26, 3), (35, 4), (-15, -2), (-25, -2)],
+)
+def test_round_half_even_matches_round(amount: int, expected: int) -> None:
+    assert round_half_even(amount, 10) == expected == round(amount / 10)
+
+
+def test_truncate_goes_toward_zero() -> None:
+    assert truncate(19, 10) == 1
+    assert truncate(-19, 10) == -1
+
+
+def test_subtotal_is_exact_in_subunits() -> None:
+    # 3,59 R$/L x 11 L = 39,49 R$ exatos
+    assert subtotal(359, to_milliliters(11)) == 3949 * SUBUNITS
+
+
+def test_truncation_does_not_drift_a_centavo(fixed) -> None:
+    order = Order(customer_name="c", product="etanol", quantity=11)
+
+    assert build_default_order_processor().process_order(order) == 39.48
+    assert fixed.process_order(order) == 39.49
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        ({"produto": "diesel", "qtd": 1200, "cupom": "MEGA10"}, 3878.0),
+        ({"produto": "diesel", "qtd": 600}, 2274.0),
+        ({"produto": "gasolina", "qtd": 300, "cupom": "NOVO5"}, 1384.15),
+        ({"produto": "etanol", "qtd": 100}, 348.23),
+        ({"produto": "lubrificante", "qtd": 3, "cupom": "LUB2"}, 73.0),
+        ({"produto": "querosene", "qtd": 10}, 0.0),
+        ({"produto": "diesel", "qtd": 0}, 0.0),
+    ],
+)
+def test_fixed_point_matches_float_path(fixed, payload, expected) -> None:
+    payload = {"cliente": "c", **payload}
+
+    assert fixed.process(payload) == expected
+    assert build_default_order_processor().process(payload) == expected
+
+
+def test_negative_price_is_clamped_before_discount(fixed) -> None:
+    fixed.price_calculator.calculate_fixed = lambda _order, _binding: -SUBUNITS
+    order = Order(customer_name="c", product="lubrificante", quantity=1, coupon="LUB2")
+
+    assert fixed.process_order(order) == -2.0
+
+
+def test_strategies_without_fixed_point_fall_back_to_float() -> None:
+    class Legacy:
+        def supports(self, _order):
+            return True
+
+        def calculate(self, order):
+            return 1.005 * order.quantity
+
+        def apply(self, price, _order):
+            return price - 0.5
+
+        def debug_message(self, _price):
+            return ""
+
+    order = Order(customer_name="c", product="x", quantity=2, coupon="X")
+    calculator = PriceCalculator([Legacy(), UnknownProductStrategy()])
+    engine = DiscountEngine([Legacy(), FlatCouponDiscount("Y", 1)])
+
+    assert calculator.calculate_fixed(order) == 201 * SUBUNITS
+    assert engine.apply_fixed(201 * SUBUNITS, order) == 151 * SUBUNITS
@@ -0,0 +1,57 @@
+"""Testes das importacoes sob demanda do pacote."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import petrobahia
+from petrobahia import logs
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+
+# Módulos que só devem ser carregados quando a funcionalidade é usada.
+DEFERRED = (
+    "argparse",
+    "cProfile",
+    "hashlib",
+    "json",
+    "logging.handlers",
+    "numpy",
+    "petrobahia._json_logs",
+    "petrobahia.customer_files",
+    "petrobahia.discounts",
+    "petrobahia.fixed_point",
+    "petrobahia.indexes",
+    "petrobahia.pricing",
+    "pstats",
+    "sqlite3",
+)
+
+
+def test_importing_main_skips_deferred_modules() -> None:
+    code = (
+        "import sys; before = set(sys.modules); import main; "
+        "print(','.join(sorted(set(sys.modules) - before)))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BASE_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    loaded = set(completed.stdout.strip().split(","))
+
+    assert "petrobahia.customers" in loaded
+    assert loaded.isdisjoint(DEFERRED)
+
+
+def test_lazy_attributes_resolve_on_first_access() -> None:
+    from petrobahia.models import Customer, Order
+
+    assert petrobahia.Customer is Customer
+    assert petrobahia.Order is Order
+    assert {"Customer", "Order"} <= set(dir(petrobahia))
+    assert logs.JsonLinesSink.__module__ == "petrobahia._json_logs"
@@ -0,0 +1,38 @@
+"""Testes do indice hash persistente."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from petrobahia.indexes import HashIndex, key_hash
+
+
+def test_key_hash_is_stable_and_never_zero() -> None:
+    assert key_hash("12345678000199") == key_hash("12345678000199")
+    assert key_hash("") != 0
+
+
+def test_hash_index_returns_candidates_for_key(tmp_path: Path) -> None:
+    index = HashIndex(tmp_path / "dados.idx")
+    index.add("a", 0)
+    index.add("b", 10)
+
+    assert list(index.candidates("a")) == [0]
+    assert list(index.candidates("b")) == [10]
+    assert list(index.candidates("c")) == []
+    index.close()
+
+
+def test_hash_index_grows_and_persists(tmp_path: Path) -> None:
+    path = tmp_path / "dados.idx"
+    index = HashIndex(path)
+    for number in range(5000):
+        index.add(str(number), number * 10)
+    index.indexed_size = 50_000
+    index.close()
+
+    reopened = HashIndex(path)
+    assert len(reopened) == 5000
+    assert reopened.indexed_size == 50_000
+    assert list(reopened.candidates("4321")) == [43210]
+    reopened.close()
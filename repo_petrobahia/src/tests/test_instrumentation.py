@@ -0,0 +1,111 @@
+"""Testes da instrumentacao opcional."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from petrobahia import instrumentation
+from petrobahia.customers import CustomerService
+from petrobahia.models import Customer
+from petrobahia.orders import build_default_order_processor
+from petrobahia.pipeline import RunningTotals, price_orders
+from petrobahia.validators import CustomerValidator
+
+PEDIDO = {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"}
+
+
+class _MemoryRepository:
+    def __init__(self) -> None:
+        self.saved: list[Customer] = []
+
+    def save(self, customer: Customer) -> None:
+        self.saved.append(customer)
+
+
+def test_instrumentation_is_disabled_by_default() -> None:
+    assert instrumentation.active is None
+    assert build_default_order_processor().process(PEDIDO) == 3878.0
+
+
+def test_recording_times_order_stages_and_counts_strategies() -> None:
+    processor = build_default_order_processor()
+
+    with instrumentation.recording() as recorder:
+        processor.process(PEDIDO)
+        processor.process({**PEDIDO, "produto": "gasolina", "cupom": None})
+
+    summary = recorder.summary()
+    assert {
+        "orders.map_payload",
+        "orders.price_order",
+        "orders.rounding",
+        "pricing.select",
+        "pricing.calculate",
+        "discounts.select",
+        "discounts.apply",
+    } <= set(summary["stages"])
+    assert summary["stages"]["orders.map_payload"]["calls"] == 2
+    assert summary["counters"] == {
+        "discounts.PercentageCouponDiscount": 1,
+        "discounts.sem_desconto": 1,
+        "pricing.DieselPricingStrategy": 1,
+        "pricing.GasolinePricingStrategy": 1,
+    }
+    assert "orders.price_order" in recorder.format_summary()
+    assert instrumentation.active is None
+
+
+def test_recording_restores_previous_recorder() -> None:
+    with instrumentation.recording() as outer:
+        with instrumentation.recording() as inner:
+            assert instrumentation.active is inner
+        assert instrumentation.active is outer
+    assert instrumentation.active is None
+
+
+def test_recording_measures_customer_registration() -> None:
+    service = CustomerService(
+        repository=_MemoryRepository(), validator=CustomerValidator()
+    )
+
+    with instrumentation.recording() as recorder:
+        service.register(
+            {
+                "nome": "TransLog",
+                "email": "contato@translog.com.br",
+                "cnpj": "12345678000199",
+            }
+        )
+        service.register({"nome": "X", "email": "ana@@petrobahia", "cnpj": "123"})
+
+    summary = recorder.summary()
+    assert summary["stages"]["customers.validate"]["calls"] == 2
+    assert summary["stages"]["customers.save"]["calls"] == 1
+    assert summary["counters"] == {
+        "customers.cadastrados": 1,
+        "customers.rejeitados": 1,
+    }
+
+
+def test_recording_separates_pipeline_io_from_pricing() -> None:
+    processor = build_default_order_processor()
+
+    with instrumentation.recording() as recorder:
+        results = list(price_orders([PEDIDO, PEDIDO], processor, RunningTotals()))
+
+    assert len(results) == 2
+    stages = recorder.summary()["stages"]
+    assert stages["pipeline.read"]["calls"] == 2
+    assert stages["pipeline.write"]["calls"] == 2
+
+
+def test_profiled_captures_and_dumps_stats(tmp_path: Path) -> None:
+    processor = build_default_order_processor()
+    path = tmp_path / "lote.pstats"
+
+    with instrumentation.profiled(path) as capture:
+        for _ in range(10):
+            processor.process(PEDIDO)
+
+    assert path.exists()
+    assert "process" in capture.report(limit=10)
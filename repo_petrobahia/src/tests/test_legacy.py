@@ -0,0 +1,71 @@
+"""Testes das fachadas de compatibilidade do legado."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from legacy import _original, differential
+from legacy.pedido_service import processar_pedido
+from legacy.preco_calculadora import calcular_preco
+
+
+def test_lubricant_is_priced_without_the_unit_loop(capsys) -> None:
+    start = time.perf_counter()
+    price = calcular_preco("lubrificante", 1_000_000)
+
+    assert time.perf_counter() - start < 0.05
+    assert price == 25_000_000.0
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("quantity", [0, -3])
+def test_lubricant_keeps_range_semantics(quantity: int) -> None:
+    assert calcular_preco("lubrificante", quantity) == 0
+    with pytest.raises(TypeError):
+        calcular_preco("lubrificante", 12.0)
+
+
+def test_unknown_product_returns_integer_zero(capsys) -> None:
+    price = calcular_preco("querosene", 10)
+
+    assert price == 0 and isinstance(price, int)
+    assert capsys.readouterr().out == "tipo desconhecido, devolvendo 0\n"
+
+
+def test_processar_pedido_prints_like_the_original(capsys) -> None:
+    pedido = {
+        "cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"
+    }
+
+    assert processar_pedido(pedido) == 3878.0
+    facade = capsys.readouterr().out
+    assert _original.processar_pedido(pedido) == 3878.0
+    assert facade == capsys.readouterr().out
+    assert facade == "calc diesel 4309.2\npedido ok: TransLog diesel 1200 => 3878.0\n"
+
+
+def test_differential_harness_finds_no_divergence() -> None:
+    report = differential.compare(differential.generate_orders(20_000, seed=3))
+
+    assert report.orders == 20_000
+    assert report.identical, report.examples
+
+
+def test_differential_harness_reports_divergent_orders(monkeypatch) -> None:
+    def calcular_preco_arredondado(tipo, qtd):
+        return round(calcular_preco(tipo, qtd), 1)
+
+    monkeypatch.setattr(
+        differential, "FACADE", (calcular_preco_arredondado, processar_pedido)
+    )
+    orders = [
+        {"cliente": "a", "produto": "etanol", "qtd": 3, "cupom": None},
+        {"cliente": "b", "produto": "diesel", "qtd": 0, "cupom": None},
+    ]
+    report = differential.compare(orders)
+
+    assert report.mismatches == 1
+    assert report.examples[0].entry_point == "calcular_preco"
+    assert report.examples[0].original[1] == ("float", "10.77")
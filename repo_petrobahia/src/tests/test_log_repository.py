@@ -0,0 +1,132 @@
+"""Testes do repositório de clientes em log binário."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from petrobahia.log_repository import LogCustomerRepository
+from petrobahia.models import Customer
+from petrobahia.repositories import DuplicateCustomerError
+
+
+def test_log_repository_saves_and_queries(tmp_path: Path) -> None:
+    with LogCustomerRepository(tmp_path / "clientes.log") as repo:
+        repo.save(Customer("Maria", "m@example.com", "1"))
+        repo.save(Customer("Maria", "m2@example.com", "2"))
+
+        assert repo.get_by_cnpj("2") == Customer("Maria", "m2@example.com", "2")
+        assert repo.get_by_name("Maria") == Customer("Maria", "m@example.com", "1")
+        assert repo.exists("1") is True
+        assert repo.exists("3") is False
+        assert [c.cnpj for c in repo.iter_all()] == ["1", "2"]
+        with pytest.raises(DuplicateCustomerError):
+            repo.save(Customer("Outra", "o@example.com", "1"))
+
+
+def test_log_repository_updates_and_deletes(tmp_path: Path) -> None:
+    path = tmp_path / "clientes.log"
+    with LogCustomerRepository(path) as repo:
+        repo.save_many(Customer(f"C{i}", f"{i}@x", str(i)) for i in range(3))
+
+        assert repo.update(Customer("Novo", "novo@x", "1")) is True
+        assert repo.update(Customer("Novo", "novo@x", "9")) is False
+        assert repo.delete("0") is True
+        assert repo.delete("0") is False
+        assert repo.get_by_name("C1") is None
+        assert repo.garbage_bytes > 0
+
+    with LogCustomerRepository(path) as repo:
+        assert list(repo.iter_all()) == [
+            Customer("Novo", "novo@x", "1"),
+            Customer("C2", "2@x", "2"),
+        ]
+        assert repo.get_by_cnpj("0") is None
+
+
+def test_log_repository_save_many_is_all_or_nothing(tmp_path: Path) -> None:
+    with LogCustomerRepository(tmp_path / "clientes.log") as repo:
+        repo.save(Customer("A", "a@x", "1"))
+        batch = [Customer("B", "b@x", "2"), Customer("A2", "a2@x", "1")]
+
+        with pytest.raises(DuplicateCustomerError):
+            repo.save_many(batch)
+        assert repo.count() == 1
+        assert repo.save_many(batch, skip_duplicates=True) == 1
+        assert repo.count() == 2
+
+
+@pytest.mark.parametrize(
+    "tail",
+    [b"\x20\x00\x00\x00\x00", b"\x02\x00\x00\x00\x00\x00\x00\x00ab"],
+)
+def test_log_repository_discards_torn_or_corrupted_tail(
+    tmp_path: Path, tail: bytes
+) -> None:
+    path = tmp_path / "clientes.log"
+    with LogCustomerRepository(path) as repo:
+        repo.save(Customer("A", "a@x", "1"))
+    size = path.stat().st_size
+    with path.open("ab") as handle:
+        handle.write(tail)
+
+    with LogCustomerRepository(path) as repo:
+        assert path.stat().st_size == size
+        repo.save(Customer("B", "b@x", "2"))
+    with LogCustomerRepository(path) as repo:
+        assert [c.cnpj for c in repo.iter_all()] == ["1", "2"]
+
+
+def test_log_repository_rejects_foreign_files(tmp_path: Path) -> None:
+    path = tmp_path / "clientes.txt"
+    path.write_text("{'nome': 'A', 'email': 'a@x', 'cnpj': '1'}\n")
+
+    with pytest.raises(ValueError):
+        LogCustomerRepository(path)
+
+
+def test_log_repository_compaction_keeps_only_live_records(tmp_path: Path) -> None:
+    path = tmp_path / "clientes.log"
+    with LogCustomerRepository(path, compaction_ratio=None) as repo:
+        repo.save_many(Customer(f"C{i}", "0@x", str(i)) for i in range(50))
+        for round_ in range(1, 20):
+            for i in range(50):
+                repo.update(Customer(f"C{i}", f"{round_}@x", str(i)))
+        repo.delete("7")
+        before = path.stat().st_size
+
+        repo.compact()
+
+        assert repo.garbage_bytes == 0
+        assert path.stat().st_size < before / 10
+        assert repo.get_by_cnpj("3") == Customer("C3", "19@x", "3")
+        assert repo.count() == 49
+    assert not path.with_name("clientes.log.compact").exists()
+
+
+def test_background_compaction_with_concurrent_writes(tmp_path: Path) -> None:
+    path = tmp_path / "clientes.log"
+    rng = random.Random(3)
+    expected: dict[str, Customer] = {}
+    with LogCustomerRepository(
+        path, compaction_ratio=0.3, min_compaction_bytes=4096
+    ) as repo:
+        for step in range(5000):
+            cnpj = str(rng.randrange(200))
+            customer = Customer(f"C{rng.randrange(20)}", f"{step}@x", cnpj)
+            if cnpj in expected and rng.random() < 0.2:
+                repo.delete(cnpj)
+                del expected[cnpj]
+            elif cnpj in expected:
+                repo.update(customer)
+                expected[cnpj] = customer
+            else:
+                repo.save(customer)
+                expected[cnpj] = customer
+        assert {c.cnpj: c for c in repo.iter_all()} == expected
+
+    with LogCustomerRepository(path) as repo:
+        assert {c.cnpj: c for c in repo.iter_all()} == expected
+        assert path.stat().st_size < 5000 * 20
@@ -0,0 +1,65 @@
+"""Testes do modulo de configuracao de logs."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from petrobahia.logs import (PACKAGE_LOGGER, JsonLinesSink,
+                             configure_console_logging)
+from petrobahia.orders import build_default_order_processor
+
+
+@pytest.fixture(autouse=True)
+def _restore_package_logger():
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    handlers, level = list(logger.handlers), logger.level
+    yield
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+def test_console_logging_reproduces_legacy_output() -> None:
+    stream = io.StringIO()
+    configure_console_logging(stream=stream)
+
+    build_default_order_processor().process(
+        {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"}
+    )
+
+    assert stream.getvalue().splitlines() == [
+        "calc diesel 4309.2",
+        "pedido ok: TransLog diesel 1200 => 3878.0",
+    ]
+
+
+def test_json_lines_sink_writes_structured_records(tmp_path: Path) -> None:
+    path = tmp_path / "logs" / "pedidos.jsonl"
+    processor = build_default_order_processor()
+
+    with JsonLinesSink(path, level=logging.INFO, flush_every=2):
+        for quantity in (10, 20, 30):
+            processor.process({"cliente": "EcoFrota", "produto": "etanol", "qtd": quantity})
+
+    records = [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+
+    assert len(records) == 3
+    assert {record["level"] for record in records} == {"INFO"}
+    assert records[0]["msg"] == "pedido ok: %s %s %s => %s"
+    assert records[0]["args"] == ["EcoFrota", "etanol", 10, 35.9]
+    assert records[0]["message"] == "pedido ok: EcoFrota etanol 10 => 35.9"
+
+
+def test_json_lines_sink_stops_receiving_after_stop(tmp_path: Path) -> None:
+    path = tmp_path / "pedidos.jsonl"
+    sink = JsonLinesSink(path).start()
+    logging.getLogger("petrobahia.orders").warning("antes")
+    sink.stop()
+    logging.getLogger("petrobahia.orders").warning("depois")
+
+    messages = [json.loads(line)["message"] for line in path.read_text("utf-8").splitlines()]
+    assert messages == ["antes"]
@@ -0,0 +1,170 @@
+"""Testes da caixa de saida de notificacoes."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from petrobahia.customers import CustomerService
+from petrobahia.models import Customer
+from petrobahia.notifications import (FAILED, WELCOME, LoggingNotifier,
+                                      Notification, NotificationDispatcher,
+                                      NotificationOutbox)
+from petrobahia.validators import CustomerValidator
+
+CLIENTE = {
+    "nome": "TransLog",
+    "email": "contato@translog.com.br",
+    "cnpj": "12345678000199",
+}
+
+
+class _MemoryRepository:
+    def __init__(self) -> None:
+        self.saved: list[Customer] = []
+
+    def save(self, customer: Customer) -> None:
+        self.saved.append(customer)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _RecordingNotifier:
+    """Relay local: guarda as notificações e falha nas primeiras ``failures``."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0) -> None:
+        self.failures = failures
+        self.delay = delay
+        self.sent: list[Notification] = []
+        self.delivered = threading.Event()
+
+    def send(self, notification: Notification) -> None:
+        time.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("relay indisponivel")
+        self.sent.append(notification)
+        self.delivered.set()
+
+
+def test_register_enqueues_welcome_instead_of_sending(tmp_path: Path) -> None:
+    with NotificationOutbox(tmp_path / "outbox.db") as outbox:
+        service = CustomerService(
+            repository=_MemoryRepository(), validator=CustomerValidator(), outbox=outbox
+        )
+        assert service.register(CLIENTE) is True
+        assert service.register({**CLIENTE, "email": "invalido"}) is False
+
+        assert outbox.count() == 1
+        notifier = _RecordingNotifier()
+        assert NotificationDispatcher(outbox, notifier).run_once() == 1
+
+    assert [(n.kind, n.payload) for n in notifier.sent] == [(WELCOME, CLIENTE)]
+
+
+def test_outbox_rejects_invalid_synchronous(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        NotificationOutbox(tmp_path / "outbox.db", synchronous="OFF; DROP TABLE outbox")
+    assert not (tmp_path / "outbox.db").exists()
+
+    with NotificationOutbox(tmp_path / "outbox.db", synchronous="extra") as outbox:
+        assert outbox._connection.execute("PRAGMA synchronous").fetchone()[0] == 3
+
+
+def test_outbox_is_durable_across_reopen(tmp_path: Path) -> None:
+    path = tmp_path / "outbox.db"
+    with NotificationOutbox(path) as outbox:
+        outbox.enqueue_welcome(Customer(name="A", email="a@b.c", cnpj="1"))
+
+    with NotificationOutbox(path) as outbox:
+        notifier = _RecordingNotifier()
+        NotificationDispatcher(outbox, notifier).run_once()
+        assert outbox.count() == 0
+    assert notifier.sent[0].payload["nome"] == "A"
+
+
+def test_failed_delivery_is_retried_with_exponential_backoff(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    notifier = _RecordingNotifier(failures=2)
+    with NotificationOutbox(tmp_path / "outbox.db", clock=clock) as outbox:
+        dispatcher = NotificationDispatcher(outbox, notifier, base_delay=1.0)
+        outbox.enqueue(WELCOME, {"nome": "A"})
+
+        assert dispatcher.run_once() == 1
+        clock.now += 0.9
+        assert dispatcher.run_once() == 0
+        clock.now += 0.1
+        assert dispatcher.run_once() == 1
+        clock.now += 1.9
+        assert dispatcher.run_once() == 0
+        clock.now += 0.1
+        assert dispatcher.run_once() == 1
+
+    assert [n.attempts for n in notifier.sent] == [2]
+    assert (dispatcher.stats.sent, dispatcher.stats.retried) == (1, 2)
+    assert [dispatcher.backoff(n) for n in (1, 2, 3, 10)] == [1.0, 2.0, 4.0, 60.0]
+
+
+def test_delivery_gives_up_after_max_attempts(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    with NotificationOutbox(tmp_path / "outbox.db", clock=clock) as outbox:
+        dispatcher = NotificationDispatcher(
+            outbox, _RecordingNotifier(failures=10), max_attempts=3, base_delay=0.0
+        )
+        outbox.enqueue(WELCOME, {"nome": "A"})
+        for _ in range(5):
+            dispatcher.run_once()
+
+        assert outbox.count() == 0
+        assert outbox.count(FAILED) == 1
+    assert dispatcher.stats.failed == 1
+
+
+def test_claimed_batch_is_not_handed_out_twice_until_lease_expires(
+    tmp_path: Path,
+) -> None:
+    clock = _FakeClock()
+    with NotificationOutbox(tmp_path / "outbox.db", clock=clock) as outbox:
+        for i in range(3):
+            outbox.enqueue(WELCOME, {"nome": str(i)})
+
+        assert len(outbox.claim(2, lease=10.0)) == 2
+        assert [n.payload["nome"] for n in outbox.claim(10, lease=10.0)] == ["2"]
+        assert outbox.claim(10, lease=10.0) == []
+        clock.now += 10.0
+        assert len(outbox.claim(10, lease=10.0)) == 3
+
+
+def test_registration_does_not_wait_for_slow_relay(tmp_path: Path) -> None:
+    notifier = _RecordingNotifier(delay=0.5)
+    with NotificationOutbox(tmp_path / "outbox.db") as outbox:
+        service = CustomerService(
+            repository=_MemoryRepository(), validator=CustomerValidator(), outbox=outbox
+        )
+        with NotificationDispatcher(outbox, notifier, poll_interval=0.01):
+            start = time.perf_counter()
+            service.register(CLIENTE)
+            elapsed = time.perf_counter() - start
+            assert notifier.delivered.wait(5)
+
+    assert elapsed < 0.25
+    assert len(notifier.sent) == 1
+
+
+def test_logging_notifier_keeps_legacy_message(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with caplog.at_level(logging.INFO, logger="petrobahia"):
+        LoggingNotifier().send(Notification(id=1, kind=WELCOME, payload={"nome": "X"}))
+
+    assert caplog.messages == ["enviando mensagem de boas vindas para X"]
@@ -0,0 +1,190 @@
+"""Testes do cadastro de clientes em massa."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from petrobahia.onboarding import onboard_customers
+from petrobahia.repositories import parse_customer_line
+
+
+def _record(i: int, **overrides: object) -> dict[str, object]:
+    return {
+        "nome": f"Cliente {i}",
+        "email": f"cliente{i}@example.com",
+        "cnpj": f"{i:014d}",
+        **overrides,
+    }
+
+
+def _write_source(path: Path, total: int) -> None:
+    lines = []
+    for i in range(total):
+        if i % 10 == 3:
+            lines.append(str(_record(i, email="sem-arroba")))
+        elif i % 10 == 7:
+            lines.append(str(_record(i - 1)))
+        elif i % 10 == 9:
+            lines.append("isto nao e um cliente")
+        else:
+            lines.append(str(_record(i)))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _customers(path: Path) -> list[str]:
+    return [parse_customer_line(line).cnpj for line in path.read_text().splitlines()]
+
+
+def _rejects(path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_onboard_customers_validates_dedupes_and_collects_rejects(
+    tmp_path: Path,
+) -> None:
+    source, destination = tmp_path / "novos.txt", tmp_path / "clientes.txt"
+    rejects = tmp_path / "rejeitados.jsonl"
+    _write_source(source, 20)
+
+    stats = onboard_customers(source, destination, rejects, workers=1, chunk_size=6)
+
+    assert (stats.read, stats.accepted, stats.rejected, stats.duplicates) == (
+        20,
+        14,
+        6,
+        2,
+    )
+    assert _customers(destination) == [
+        f"{i:014d}" for i in range(20) if i % 10 not in (3, 7, 9)
+    ]
+    assert [(item["linha"], item["motivos"]) for item in _rejects(rejects)] == [
+        (4, ["email invalido"]),
+        (8, ["cnpj duplicado"]),
+        (10, ["linha invalida"]),
+        (14, ["email invalido"]),
+        (18, ["cnpj duplicado"]),
+        (20, ["linha invalida"]),
+    ]
+    assert not (tmp_path / "clientes.txt.checkpoint").exists()
+
+
+def test_onboard_customers_skips_cnpjs_already_in_destination(tmp_path: Path) -> None:
+    source, destination = tmp_path / "novos.jsonl", tmp_path / "clientes.txt"
+    destination.write_text(f"{_record(1)}\n", encoding="utf-8")
+    source.write_text(
+        "".join(json.dumps(_record(i)) + "\n" for i in range(3)), encoding="utf-8"
+    )
+
+    stats = onboard_customers(source, destination, tmp_path / "rej.jsonl", workers=1)
+
+    assert stats.accepted == 2
+    assert stats.duplicates == 1
+    assert _customers(destination) == [f"{i:014d}" for i in (1, 0, 2)]
+
+
+def test_onboard_customers_rejects_padded_duplicate_cnpj(tmp_path: Path) -> None:
+    source, destination = tmp_path / "novos.jsonl", tmp_path / "clientes.txt"
+    rejects = tmp_path / "rej.jsonl"
+    destination.write_text(f"{_record(1)}\n", encoding="utf-8")
+    source.write_text(
+        json.dumps(_record(1, cnpj=" 00000000000001 ")) + "\n"
+        + json.dumps(_record(2, nome=" Cliente 2 ", cnpj="00000000000002 ")) + "\n"
+        + json.dumps(_record(2, cnpj=" 00000000000002")) + "\n",
+        encoding="utf-8",
+    )
+
+    stats = onboard_customers(source, destination, rejects, workers=1)
+
+    assert (stats.accepted, stats.duplicates) == (1, 2)
+    assert destination.read_text(encoding="utf-8").splitlines()[1] == str(
+        _record(2)
+    )
+    assert [item["motivos"] for item in _rejects(rejects)] == [
+        ["cnpj duplicado"],
+        ["cnpj duplicado"],
+    ]
+
+
+def test_onboard_customers_resumes_from_checkpoint(tmp_path: Path) -> None:
+    source = tmp_path / "novos.txt"
+    _write_source(source, 50)
+    expected_dir = tmp_path / "completo"
+    expected_dir.mkdir()
+    onboard_customers(
+        source,
+        expected_dir / "clientes.txt",
+        expected_dir / "rej.jsonl",
+        workers=1,
+        chunk_size=7,
+    )
+
+    destination, rejects = tmp_path / "clientes.txt", tmp_path / "rej.jsonl"
+
+    def interrupt(stats) -> None:
+        if stats.read >= 21:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        onboard_customers(
+            source, destination, rejects, workers=1, chunk_size=7, progress=interrupt
+        )
+    assert (tmp_path / "clientes.txt.checkpoint").exists()
+    # Gravação parcial após o checkpoint, descartada na retomada.
+    with destination.open("a", encoding="utf-8") as handle:
+        handle.write("{'nome': 'meia linha'")
+
+    stats = onboard_customers(source, destination, rejects, workers=1, chunk_size=7)
+
+    assert stats.resumed_from == 21
+    assert stats.read == 50
+    assert destination.read_text() == (expected_dir / "clientes.txt").read_text()
+    assert _rejects(rejects) == _rejects(expected_dir / "rej.jsonl")
+
+
+def test_onboard_customers_with_worker_processes_matches_inline(
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "novos.txt"
+    _write_source(source, 200)
+
+    inline = onboard_customers(
+        source, tmp_path / "a.txt", tmp_path / "a.jsonl", workers=1, chunk_size=16
+    )
+    parallel = onboard_customers(
+        source,
+        tmp_path / "b.txt",
+        tmp_path / "b.jsonl",
+        workers=2,
+        chunk_size=16,
+        max_pending_chunks=3,
+    )
+
+    assert (parallel.accepted, parallel.rejected) == (inline.accepted, inline.rejected)
+    assert (tmp_path / "b.txt").read_text() == (tmp_path / "a.txt").read_text()
+    assert _rejects(tmp_path / "b.jsonl") == _rejects(tmp_path / "a.jsonl")
+
+
+def test_onboard_customers_rejects_checkpoint_from_other_source(tmp_path: Path) -> None:
+    source = tmp_path / "novos.txt"
+    _write_source(source, 5)
+    checkpoint = tmp_path / "clientes.txt.checkpoint"
+    checkpoint.write_text(
+        json.dumps(
+            {
+                "source": str(tmp_path / "outro.txt"),
+                "offset": 0,
+                "destination_size": 0,
+                "rejects_size": 0,
+                "read": 0,
+                "accepted": 0,
+                "rejected": 0,
+                "duplicates": 0,
+            }
+        )
+    )
+
+    with pytest.raises(ValueError):
+        onboard_customers(source, tmp_path / "clientes.txt", tmp_path / "r.jsonl")
@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import Mock
 
-from petrobahia.orders import OrderProcessor
+from petrobahia.orders import OrderProcessor, build_default_order_processor
 from petrobahia.models import Order
 
 
@@ -115,3 +115,52 @@ def test_format_quantity_integer():
 
 def test_format_quantity_float():
     assert OrderProcessor._format_quantity(10.5) == 10.5
+
+
+def test_process_batch_matches_process_exactly():
+    np = pytest.importorskip("numpy")
+    processor = build_default_order_processor()
+    payloads = [
+        {"cliente": "C", "produto": produto, "qtd": qtd, "cupom": cupom}
+        for produto in ("diesel", "gasolina", "etanol", "lubrificante", "outro")
+        for qtd in (0, 1, 12, 50, 80.5, 201, 300, 501.25, 1001, 1200)
+        for cupom in (None, "MEGA10", "NOVO5", "LUB2")
+    ]
+
+    expected = [processor.process(payload) for payload in payloads]
+    result = processor.process_batch(
+        np.array([p["produto"] for p in payloads]),
+        np.array([p["qtd"] for p in payloads]),
+        np.array([p["cupom"] for p in payloads], dtype=object),
+    )
+
+    assert result.tolist() == expected
+
+
+def test_apply_rounding_batch_matches_round_on_gasoline_ties():
+    np = pytest.importorskip("numpy")
+    prices = np.array([0.125, 1.005, 2.675, 1.115, 8.345, 1003.455])
+
+    result = OrderProcessor._apply_rounding_batch(
+        np.full(len(prices), "gasolina"), prices
+    )
+
+    assert result.tolist() == [round(price, 2) for price in prices.tolist()]
+
+
+@pytest.mark.parametrize("copies", [1, 4])
+def test_price_many_matches_price_order(copies):
+    processor = build_default_order_processor()
+    orders = [
+        Order("C", produto, qtd, cupom)
+        for produto in ("diesel", "gasolina", "etanol", "lubrificante", "outro")
+        for qtd in (0, 12, 80.5, 300, 1200)
+        for cupom in (None, "MEGA10", "LUB2")
+    ] * copies
+
+    result = processor.price_many(orders)
+
+    assert [priced.order for priced in result] == orders
+    assert [priced.price for priced in result] == [
+        processor.process_order(order) for order in orders
+    ]
@@ -0,0 +1,40 @@
+"""Testes da precificacao em multiplos processos."""
+
+from __future__ import annotations
+
+import itertools
+
+from petrobahia.models import Order
+from petrobahia.orders import build_default_order_processor
+from petrobahia.parallel import process_parallel
+
+
+def _orders(total: int) -> list[Order]:
+    products = itertools.cycle(["diesel", "gasolina", "etanol", "lubrificante", "outro"])
+    coupons = itertools.cycle([None, "MEGA10", "NOVO5", "LUB2"])
+    return [
+        Order(
+            customer_name=f"Cliente {i}",
+            product=next(products),
+            quantity=float(i % 1500),
+            coupon=next(coupons),
+        )
+        for i in range(total)
+    ]
+
+
+def test_process_parallel_keeps_input_order_and_values() -> None:
+    orders = _orders(1000)
+    processor = build_default_order_processor()
+
+    prices = list(process_parallel(orders, workers=2, chunk_size=64, max_pending_chunks=3))
+
+    assert prices == [processor.process_order(order) for order in orders]
+
+
+def test_process_parallel_consumes_generators_lazily() -> None:
+    orders = itertools.cycle(_orders(10))
+
+    prices = list(itertools.islice(process_parallel(orders, workers=1, chunk_size=4), 25))
+
+    assert len(prices) == 25
@@ -0,0 +1,153 @@
+"""Testes do pipeline de pedidos em fluxo."""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from petrobahia.orders import build_default_order_processor
+from petrobahia.pipeline import (RunningTotals, map_order, price_orders,
+                                 read_orders, run_pipeline)
+
+PEDIDOS = [
+    {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+    {"cliente": "Cliente Invalido", "produto": "diesel", "qtd": 10, "cupom": None},
+]
+CLIENTES_VALIDOS = {"TransLog", "MoveMais", "EcoFrota", "PetroPark"}
+
+
+def _write_jsonl(path: Path) -> None:
+    path.write_text(
+        "".join(json.dumps(pedido) + "\n" for pedido in PEDIDOS), encoding="utf-8"
+    )
+
+
+def _write_csv(path: Path) -> None:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=["cliente", "produto", "qtd", "cupom"])
+        writer.writeheader()
+        for pedido in PEDIDOS:
+            writer.writerow({**pedido, "cupom": pedido["cupom"] or ""})
+
+
+def test_run_pipeline_matches_main_totals_for_jsonl(tmp_path: Path) -> None:
+    source = tmp_path / "pedidos.jsonl"
+    destination = tmp_path / "resultados.jsonl"
+    _write_jsonl(source)
+
+    totals = run_pipeline(
+        source, destination, is_known_customer=CLIENTES_VALIDOS.__contains__
+    )
+
+    results = [json.loads(line) for line in destination.read_text("utf-8").splitlines()]
+    assert [r["valor"] for r in results] == [3878.0, 1457.0, 170.52, 298.0]
+    assert totals.processed == 4
+    assert totals.rejected == 1
+    assert totals.total == pytest.approx(5803.52)
+
+
+def test_run_pipeline_reads_and_writes_csv(tmp_path: Path) -> None:
+    source = tmp_path / "pedidos.csv"
+    destination = tmp_path / "resultados.csv"
+    _write_csv(source)
+
+    totals = run_pipeline(source, destination)
+
+    with destination.open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["valor"] for row in rows] == ["3878.0", "1457.0", "170.52", "298.0", "40.0"]
+    assert rows[1]["cupom"] == ""
+    assert totals.processed == 5
+
+
+def test_price_orders_is_lazy_and_counts_invalid_rows() -> None:
+    rows = itertools.chain(
+        [{"cliente": "X", "produto": "diesel", "qtd": "abc"}],
+        itertools.repeat({"cliente": "X", "produto": "diesel", "qtd": 10}),
+    )
+    totals = RunningTotals()
+
+    results = list(itertools.islice(
+        price_orders(rows, build_default_order_processor(), totals), 3
+    ))
+
+    assert len(results) == 3
+    assert totals.invalid == 1
+    assert totals.processed == 3
+
+
+def test_run_pipeline_skips_malformed_jsonl_lines(tmp_path: Path) -> None:
+    source = tmp_path / "pedidos.jsonl"
+    destination = tmp_path / "resultados.jsonl"
+    lines = [json.dumps(pedido) for pedido in PEDIDOS[:2]]
+    source.write_text(
+        "\n".join([lines[0], '{"cliente": "X", "produto"', lines[1]]) + "\n",
+        encoding="utf-8",
+    )
+
+    totals = run_pipeline(source, destination)
+
+    assert len(destination.read_text("utf-8").splitlines()) == 2
+    assert totals.processed == 2
+    assert totals.invalid == 1
+
+
+def test_price_orders_counts_rows_that_are_not_objects() -> None:
+    rows = [[1, 2], "x", None, {"cliente": "X", "produto": "diesel", "qtd": 10}]
+    totals = RunningTotals()
+
+    results = list(price_orders(rows, build_default_order_processor(), totals))
+
+    assert [result.price for result in results] == [40.0]
+    assert totals.invalid == 3
+    assert totals.processed == 1
+
+
+def test_run_pipeline_counts_non_finite_csv_quantities(tmp_path: Path) -> None:
+    source = tmp_path / "pedidos.csv"
+    source.write_text(
+        "cliente,produto,qtd,cupom\n"
+        "X,diesel,10,\nX,diesel,nan,\nX,etanol,inf,\nX,etanol,-Infinity,\n",
+        encoding="utf-8",
+    )
+
+    totals = run_pipeline(source, tmp_path / "resultados.csv")
+
+    assert (totals.processed, totals.invalid) == (1, 3)
+    assert totals.total == 40.0
+
+
+def test_run_pipeline_counts_json_nan_quantities(tmp_path: Path) -> None:
+    source = tmp_path / "pedidos.jsonl"
+    destination = tmp_path / "resultados.jsonl"
+    source.write_text(
+        '{"cliente": "X", "produto": "diesel", "qtd": NaN}\n'
+        '{"cliente": "X", "produto": "diesel", "qtd": Infinity}\n'
+        '{"cliente": "X", "produto": "diesel", "qtd": 10}\n',
+        encoding="utf-8",
+    )
+
+    totals = run_pipeline(source, destination)
+
+    assert (totals.processed, totals.invalid) == (1, 2)
+    assert totals.total == 40.0
+    assert [json.loads(line)["valor"] for line in destination.open()] == [40.0]
+
+
+def test_map_order_normalizes_csv_values() -> None:
+    order = map_order({"cliente": "X", "produto": "etanol", "qtd": "12.5", "cupom": ""})
+
+    assert order.quantity == 12.5
+    assert order.coupon is None
+
+
+def test_read_orders_rejects_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        read_orders(tmp_path / "pedidos.xml")
@@ -0,0 +1,142 @@
+"""Testes da tabela de precos versionada."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from petrobahia.cache import PricingCache
+from petrobahia.models import Order
+from petrobahia.orders import build_default_order_processor
+from petrobahia.pipeline import RunningTotals, price_orders
+from petrobahia.price_table import PriceTable
+
+PRECOS = {"diesel": 3.99, "gasolina": 5.19, "etanol": 3.59, "lubrificante": 25.0}
+PEDIDO_DIESEL = Order("TransLog", "diesel", 100)
+
+
+def _write_prices(path: Path, prices: dict[str, float]) -> None:
+    path.write_text(json.dumps(prices), encoding="utf-8")
+
+
+def _touch_later(path: Path) -> None:
+    # Garante mtime diferente mesmo em sistemas de arquivos com baixa resolução.
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_price_table_loads_snapshot_from_file(tmp_path: Path) -> None:
+    path = tmp_path / "precos.json"
+    _write_prices(path, PRECOS)
+
+    table = PriceTable.from_file(path)
+
+    assert table.current.version == 1
+    assert table.current.prices["diesel"] == 3.99
+    assert table.current.source == str(path)
+    with pytest.raises(TypeError):
+        table.current.prices["diesel"] = 0.0  # type: ignore[index]
+
+
+def test_price_table_rejects_invalid_prices() -> None:
+    with pytest.raises(ValueError):
+        PriceTable.from_mapping({"diesel": -1})
+
+
+def test_published_prices_apply_without_rebuilding_processor() -> None:
+    table = PriceTable.from_mapping(PRECOS)
+    processor = build_default_order_processor(price_table=table)
+
+    before = processor.price_order(PEDIDO_DIESEL)
+    table.publish({**PRECOS, "diesel": 4.50})
+    after = processor.price_order(PEDIDO_DIESEL)
+
+    assert (before.price, before.price_version) == (399.0, 1)
+    assert (after.price, after.price_version) == (450.0, 2)
+
+
+def test_pinned_binding_keeps_snapshot_during_publish() -> None:
+    table = PriceTable.from_mapping(PRECOS)
+    processor = build_default_order_processor(price_table=table)
+    calculator = processor.price_calculator
+
+    binding = calculator.pin()
+    table.publish({**PRECOS, "diesel": 4.50})
+
+    assert calculator.calculate(PEDIDO_DIESEL, binding) == pytest.approx(399.0)
+    assert calculator.calculate(PEDIDO_DIESEL) == pytest.approx(450.0)
+
+
+def test_reload_if_changed_publishes_new_version(tmp_path: Path) -> None:
+    path = tmp_path / "precos.json"
+    _write_prices(path, PRECOS)
+    table = PriceTable.from_file(path)
+
+    assert table.reload_if_changed() is False
+
+    _write_prices(path, {**PRECOS, "gasolina": 6.0})
+    _touch_later(path)
+
+    assert table.reload_if_changed() is True
+    assert table.current.version == 2
+    assert table.current.prices["gasolina"] == 6.0
+
+
+def test_reload_keeps_snapshot_when_file_is_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "precos.json"
+    _write_prices(path, PRECOS)
+    table = PriceTable.from_file(path)
+
+    path.write_text("{quebrado", encoding="utf-8")
+    _touch_later(path)
+
+    assert table.reload_if_changed() is False
+    assert table.current.version == 1
+    assert table.current.prices["diesel"] == 3.99
+
+
+def test_watcher_reloads_changed_file(tmp_path: Path) -> None:
+    path = tmp_path / "precos.json"
+    _write_prices(path, PRECOS)
+    table = PriceTable.from_file(path)
+
+    watcher = table.watch(interval=0.01)
+    try:
+        _write_prices(path, {**PRECOS, "etanol": 4.0})
+        _touch_later(path)
+        deadline = time.monotonic() + 5
+        while table.current.version == 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    assert table.current.version == 2
+    assert table.current.prices["etanol"] == 4.0
+
+
+def test_publish_invalidates_cached_prices() -> None:
+    table = PriceTable.from_mapping(PRECOS)
+    cache = PricingCache()
+    processor = build_default_order_processor(cache=cache, price_table=table)
+
+    assert processor.process_order(PEDIDO_DIESEL) == 399.0
+    assert processor.process_order(PEDIDO_DIESEL) == 399.0
+    table.publish({**PRECOS, "diesel": 5.0})
+
+    assert processor.price_order(PEDIDO_DIESEL).price == 500.0
+    assert cache.stats().invalidations >= 1
+
+
+def test_pipeline_results_record_price_version() -> None:
+    table = PriceTable.from_mapping(PRECOS)
+    table.publish(PRECOS)
+    processor = build_default_order_processor(price_table=table)
+    rows = [{"cliente": "TransLog", "produto": "diesel", "qtd": 10, "cupom": None}]
+
+    results = list(price_orders(rows, processor, RunningTotals()))
+
+    assert [result.price_version for result in results] == [2]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+
 import pytest
 
 from petrobahia.models import Order
@@ -12,6 +14,7 @@ from petrobahia.pricing import (
     GasolinePricingStrategy,
     LubricantPricingStrategy,
     PriceCalculator,
+    UnknownProductStrategy,
 )
 
 
@@ -79,17 +82,44 @@ def test_price_calculator_requires_at_least_one_strategy() -> None:
         PriceCalculator(strategies=[])
 
 
-def test_price_calculator_uses_matching_strategy_and_prints_debug(
-    capsys: pytest.CaptureFixture[str],
+def test_price_calculator_uses_matching_strategy_and_logs_debug(
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
+    caplog.set_level(logging.DEBUG, logger="petrobahia")
     calculator = PriceCalculator(strategies=[DieselPricingStrategy()])
     order = _order("diesel", 100)
 
     price = calculator.calculate(order)
-    out = capsys.readouterr().out
 
     assert price == pytest.approx(BASE_PRICES["diesel"] * 100)
-    assert "calc diesel" in out
+    assert "calc diesel" in caplog.text
+
+
+class CountingDieselStrategy(DieselPricingStrategy):
+    """Conta quantas vezes a mensagem de debug foi construida."""
+
+    __slots__ = ("debug_calls",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.debug_calls = 0
+
+    def debug_message(self, price: float) -> str:
+        self.debug_calls += 1
+        return super().debug_message(price)
+
+
+def test_price_calculator_skips_debug_message_when_debug_disabled(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.INFO, logger="petrobahia")
+    strategy = CountingDieselStrategy()
+    calculator = PriceCalculator(strategies=[strategy])
+
+    calculator.calculate(_order("diesel", 100))
+
+    assert strategy.debug_calls == 0
+    assert caplog.text == ""
 
 
 class DummyFallbackStrategy:
@@ -111,15 +141,81 @@ class DummyFallbackStrategy:
 
 
 def test_price_calculator_uses_fallback_when_no_strategy_supports(
-    capsys: pytest.CaptureFixture[str],
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
+    caplog.set_level(logging.DEBUG, logger="petrobahia")
     fallback = DummyFallbackStrategy()
     calculator = PriceCalculator(strategies=[fallback])
     order = _order("desconhecido", 10)
 
     price = calculator.calculate(order)
-    out = capsys.readouterr().out
 
     assert price == pytest.approx(0.0)
     assert fallback.called_with == [order]
-    assert "tipo desconhecido" in out
+    assert "tipo desconhecido" in caplog.text
+
+
+def test_unknown_product_strategy_is_used_as_fallback(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    calculator = PriceCalculator(
+        strategies=[DieselPricingStrategy(), UnknownProductStrategy()]
+    )
+
+    price = calculator.calculate(_order("querosene", 10))
+
+    assert price == 0.0
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+    assert "tipo desconhecido" in caplog.text
+
+
+def test_price_calculator_calculate_batch_matches_scalar_path() -> None:
+    np = pytest.importorskip("numpy")
+    calculator = PriceCalculator(
+        strategies=[
+            DieselPricingStrategy(),
+            GasolinePricingStrategy(),
+            EthanolPricingStrategy(),
+            LubricantPricingStrategy(),
+            UnknownProductStrategy(),
+        ]
+    )
+    products = ["diesel", "gasolina", "etanol", "lubrificante", "querosene"] * 4
+    quantities = [1, 80, 81, 200, 201, 500, 501, 1000, 1001, 1200.5] * 2
+
+    prices = calculator.calculate_batch(np.array(products), np.array(quantities))
+    expected = [
+        calculator.calculate(_order(product, float(quantity)))
+        for product, quantity in zip(products, quantities)
+    ]
+
+    assert prices.tolist() == expected
+
+
+def test_price_calculator_calculate_batch_falls_back_to_scalar_strategy() -> None:
+    np = pytest.importorskip("numpy")
+    fallback = DummyFallbackStrategy()
+    calculator = PriceCalculator(strategies=[fallback])
+
+    prices = calculator.calculate_batch(np.array(["x", "y"]), np.array([1.0, 2.0]))
+
+    assert prices.tolist() == [0.0, 0.0]
+    assert [order.quantity for order in fallback.called_with] == [1.0, 2.0]
+
+
+def test_price_calculator_index_matches_linear_scan() -> None:
+    strategies = [
+        DieselPricingStrategy(),
+        GasolinePricingStrategy(),
+        DieselPricingStrategy(unit_price=1.0),
+        UnknownProductStrategy(),
+    ]
+    indexed = PriceCalculator(strategies)
+    linear = PriceCalculator(strategies, indexed=False)
+
+    for product in ("diesel", "gasolina", "etanol"):
+        order = _order(product, 100)
+        assert indexed.calculate(order) == linear.calculate(order)
+    assert indexed.calculate(_order("diesel", 100)) == pytest.approx(
+        BASE_PRICES["diesel"] * 100
+    )
@@ -1,10 +1,16 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from petrobahia.models import Customer
 from petrobahia.repositories import (
     BaseFileRepository,
+    BatchedFileCustomerRepository,
+    DuplicateCustomerError,
     FileCustomerRepository,
+    IndexedFileCustomerRepository,
+    parse_customer_line,
 )
 
 
@@ -66,3 +72,129 @@ def test_filecustomerrepository_appends_multiple_records():
         assert len(lines) == 2
         assert lines[0] == "{'nome': 'Maria', 'email': 'm@example.com', 'cnpj': '1'}"
         assert lines[1] == "{'nome': 'João', 'email': 'j@example.com', 'cnpj': '2'}"
+
+
+# ---------------------------
+# BatchedFileCustomerRepository
+# ---------------------------
+
+def test_batchedrepository_buffers_until_max_records():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repo_path = Path(tmp_dir) / "customers.txt"
+
+        with BatchedFileCustomerRepository(
+            repo_path, max_records=3, flush_interval=None
+        ) as repo:
+            repo.save(Customer("Maria", "m@example.com", "1"))
+            repo.save(Customer("João", "j@example.com", "2"))
+            # Nada gravado ainda: lote abaixo do limite
+            assert repo_path.read_text("utf-8") == ""
+
+            repo.save(Customer("Ana", "a@example.com", "3"))
+            assert len(repo_path.read_text("utf-8").splitlines()) == 3
+
+
+def test_batchedrepository_flushes_by_byte_size():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repo_path = Path(tmp_dir) / "customers.txt"
+
+        with BatchedFileCustomerRepository(
+            repo_path, max_records=1000, max_bytes=1, flush_interval=None
+        ) as repo:
+            repo.save(Customer("Maria", "m@example.com", "1"))
+            assert repo_path.read_text("utf-8") != ""
+
+
+def test_batchedrepository_save_many_matches_file_repository_format():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        batched_path = Path(tmp_dir) / "batched.txt"
+        plain_path = Path(tmp_dir) / "plain.txt"
+        customers = [Customer(f"Cliente {i}", f"c{i}@example.com", str(i)) for i in range(10)]
+
+        with BatchedFileCustomerRepository(batched_path, max_records=4) as repo:
+            repo.save_many(customers)
+        plain = FileCustomerRepository(plain_path)
+        for customer in customers:
+            plain.save(customer)
+
+        assert batched_path.read_bytes() == plain_path.read_bytes()
+
+
+def test_batchedrepository_rejects_writes_after_close():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repo = BatchedFileCustomerRepository(Path(tmp_dir) / "customers.txt")
+        repo.close()
+
+        with pytest.raises(ValueError):
+            repo.save(Customer("Maria", "m@example.com", "1"))
+
+
+# ---------------------------
+# IndexedFileCustomerRepository
+# ---------------------------
+
+def test_parse_customer_line_reads_file_repository_format():
+    line = "{'nome': 'Maria', 'email': 'maria@example.com', 'cnpj': '123456789'}\n"
+
+    assert parse_customer_line(line) == Customer("Maria", "maria@example.com", "123456789")
+    with pytest.raises(ValueError):
+        parse_customer_line("{'nome': 'Maria'")
+
+
+def test_indexedrepository_looks_up_by_cnpj_and_name():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repo_path = Path(tmp_dir) / "customers.txt"
+
+        with IndexedFileCustomerRepository(repo_path) as repo:
+            repo.save(Customer("Maria", "m@example.com", "1"))
+            repo.save(Customer("João", "j@example.com", "2"))
+
+            assert repo.get_by_cnpj("2") == Customer("João", "j@example.com", "2")
+            assert repo.get_by_name("Maria") == Customer("Maria", "m@example.com", "1")
+            assert repo.exists("1") is True
+            assert repo.exists("3") is False
+            assert [c.cnpj for c in repo.iter_all()] == ["1", "2"]
+
+
+def test_indexedrepository_rejects_duplicate_cnpj():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repo_path = Path(tmp_dir) / "customers.txt"
+
+        with IndexedFileCustomerRepository(repo_path) as repo:
+            repo.save(Customer("Maria", "m@example.com", "1"))
+            with pytest.raises(DuplicateCustomerError):
+                repo.save(Customer("Outra Maria", "o@example.com", "1"))
+
+        assert len(repo_path.read_text("utf-8").splitlines()) == 1
+
+
+def test_indexedrepository_indexes_only_appended_lines_on_reopen():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repo_path = Path(tmp_dir) / "customers.txt"
+        FileCustomerRepository(repo_path).save(Customer("Maria", "m@example.com", "1"))
+
+        with IndexedFileCustomerRepository(repo_path) as repo:
+            assert repo.exists("1")
+
+        # Outro escritor acrescenta uma linha e deixa uma linha incompleta.
+        FileCustomerRepository(repo_path).save(Customer("João", "j@example.com", "2"))
+        with repo_path.open("a", encoding="utf-8") as handle:
+            handle.write("{'nome': 'Parcial'")
+
+        with IndexedFileCustomerRepository(repo_path) as repo:
+            assert repo.get_by_name("João") == Customer("João", "j@example.com", "2")
+            repo.save(Customer("Ana", "a@example.com", "3"))
+            assert repo.get_by_cnpj("3") == Customer("Ana", "a@example.com", "3")
+            assert [c.cnpj for c in repo.iter_all()] == ["1", "2", "3"]
+
+
+def test_indexedrepository_rebuilds_indexes_when_file_is_replaced():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repo_path = Path(tmp_dir) / "customers.txt"
+        with IndexedFileCustomerRepository(repo_path) as repo:
+            repo.save(Customer("Maria", "m@example.com", "1"))
+            repo.save(Customer("João", "j@example.com", "2"))
+
+        repo_path.write_text("", encoding="utf-8")
+        with IndexedFileCustomerRepository(repo_path) as repo:
+            assert repo.exists("1") is False
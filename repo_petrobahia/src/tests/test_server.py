@@ -0,0 +1,155 @@
+"""Testes do servico asyncio de precificacao."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from petrobahia.orders import OrderProcessor, build_default_order_processor
+from petrobahia.server import OrderServer
+
+PEDIDOS = [
+    {"id": 1, "cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
+    {"id": 2, "cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
+    {"id": 3, "cliente": "EcoFrota", "produto": "etanol", "qtd": 50, "cupom": "NOVO5"},
+    {"id": 4, "cliente": "PetroPark", "produto": "lubrificante", "qtd": 12, "cupom": "LUB2"},
+]
+VALORES = [3878.0, 1457.0, 170.52, 298.0]
+
+
+async def _exchange(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, lines: list[bytes]
+) -> list[dict[str, object]]:
+    writer.writelines(lines)
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in lines]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+def _lines(payloads: list[dict[str, object]]) -> list[bytes]:
+    return [json.dumps(payload).encode() + b"\n" for payload in payloads]
+
+
+@pytest.mark.parametrize("executor", ["inline", "thread", "process"])
+def test_server_prices_orders_in_request_order(executor: str) -> None:
+    async def scenario() -> list[dict[str, object]]:
+        async with OrderServer(executor=executor, workers=2) as server:
+            port = await server.start_tcp()
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            return await _exchange(reader, writer, _lines(PEDIDOS))
+
+    responses = asyncio.run(scenario())
+
+    assert [response["id"] for response in responses] == [1, 2, 3, 4]
+    assert [response["valor"] for response in responses] == VALORES
+
+
+def test_server_reports_invalid_lines_and_keeps_connection() -> None:
+    async def scenario() -> tuple[list[dict[str, object]], OrderServer]:
+        async with OrderServer() as server:
+            port = await server.start_tcp()
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            lines = [b"{quebrado\n", b'{"produto": "diesel", "qtd": "x"}\n']
+            lines += _lines(PEDIDOS[:1])
+            return await _exchange(reader, writer, lines), server
+
+    responses, server = asyncio.run(scenario())
+
+    assert "erro" in responses[0] and "erro" in responses[1]
+    assert responses[2] == {"valor": 3878.0, "id": 1}
+    assert (server.stats.errors, server.stats.requests) == (2, 1)
+
+
+def test_server_accepts_unix_socket(tmp_path: Path) -> None:
+    path = tmp_path / "pedidos.sock"
+
+    async def scenario() -> list[dict[str, object]]:
+        async with OrderServer() as server:
+            await server.start_unix(path)
+            reader, writer = await asyncio.open_unix_connection(str(path))
+            return await _exchange(reader, writer, _lines(PEDIDOS))
+
+    responses = asyncio.run(scenario())
+
+    assert [response["valor"] for response in responses] == VALORES
+
+
+class _SlowProcessor(OrderProcessor):
+    """Processador que registra a concorrencia maxima observada."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def price_order(self, order):  # type: ignore[override]
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.01)
+        with cls.lock:
+            cls.active -= 1
+        return super().price_order(order)
+
+
+def _slow_processor() -> OrderProcessor:
+    default = build_default_order_processor()
+    return _SlowProcessor(default.price_calculator, default.discount_engine)
+
+
+def test_server_bounds_in_flight_requests() -> None:
+    async def scenario() -> list[list[dict[str, object]]]:
+        async with OrderServer(
+            _slow_processor,
+            executor="thread",
+            workers=8,
+            max_in_flight=2,
+            max_pending_per_connection=4,
+        ) as server:
+            port = await server.start_tcp()
+            clients = [
+                await asyncio.open_connection("127.0.0.1", port) for _ in range(3)
+            ]
+            return await asyncio.gather(
+                *(
+                    _exchange(reader, writer, _lines(PEDIDOS * 3))
+                    for reader, writer in clients
+                )
+            )
+
+    results = asyncio.run(scenario())
+
+    assert all(
+        [response["valor"] for response in responses] == VALORES * 3
+        for responses in results
+    )
+    assert _SlowProcessor.peak <= 2
+
+
+@pytest.mark.parametrize("executor", ["inline", "process"])
+def test_server_coalesces_orders_across_connections(executor: str) -> None:
+    async def scenario():
+        async with OrderServer(
+            executor=executor, workers=1, batch_window=0.005, max_batch=64
+        ) as server:
+            port = await server.start_tcp()
+            clients = [
+                await asyncio.open_connection("127.0.0.1", port) for _ in range(2)
+            ]
+            results = await asyncio.gather(
+                *(_exchange(reader, writer, _lines(PEDIDOS)) for reader, writer in clients)
+            )
+            return results, server.coalescer.metrics()
+
+    results, metrics = asyncio.run(scenario())
+
+    assert all([r["valor"] for r in responses] == VALORES for responses in results)
+    assert metrics.orders == 8
+    assert metrics.batches < 8
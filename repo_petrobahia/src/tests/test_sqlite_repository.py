@@ -0,0 +1,91 @@
+"""Testes do repositorio de clientes em SQLite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from petrobahia.models import Customer
+from petrobahia.repositories import DuplicateCustomerError, FileCustomerRepository
+from petrobahia.sqlite_repository import (SqliteCustomerRepository,
+                                          import_customer_file)
+
+
+def test_sqlite_repository_saves_and_queries(tmp_path: Path) -> None:
+    with SqliteCustomerRepository(tmp_path / "clientes.db") as repo:
+        repo.save(Customer("Maria", "m@example.com", "1"))
+        repo.save(Customer("Maria", "m2@example.com", "2"))
+
+        assert repo.get_by_cnpj("2") == Customer("Maria", "m2@example.com", "2")
+        assert repo.get_by_name("Maria") == Customer("Maria", "m@example.com", "1")
+        assert repo.exists("1") is True
+        assert repo.exists("3") is False
+        assert [c.cnpj for c in repo.iter_all()] == ["1", "2"]
+
+
+def test_sqlite_repository_uses_wal_mode(tmp_path: Path) -> None:
+    with SqliteCustomerRepository(tmp_path / "clientes.db") as repo:
+        mode = repo._connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert mode == "wal"
+
+
+@pytest.mark.parametrize("synchronous", ["FULL; DROP TABLE clientes", "fast", 4, True])
+def test_sqlite_repository_rejects_invalid_synchronous(
+    tmp_path: Path, synchronous: object
+) -> None:
+    with pytest.raises(ValueError):
+        SqliteCustomerRepository(tmp_path / "clientes.db", synchronous=synchronous)
+    assert not (tmp_path / "clientes.db").exists()
+
+
+def test_sqlite_repository_accepts_synchronous_levels(tmp_path: Path) -> None:
+    with SqliteCustomerRepository(tmp_path / "a.db", synchronous="full") as repo:
+        level = repo._connection.execute("PRAGMA synchronous").fetchone()[0]
+    with SqliteCustomerRepository(tmp_path / "b.db", synchronous=0) as repo:
+        off = repo._connection.execute("PRAGMA synchronous").fetchone()[0]
+
+    assert (level, off) == (2, 0)
+
+
+def test_sqlite_repository_rejects_duplicate_cnpj(tmp_path: Path) -> None:
+    with SqliteCustomerRepository(tmp_path / "clientes.db") as repo:
+        repo.save(Customer("Maria", "m@example.com", "1"))
+
+        with pytest.raises(DuplicateCustomerError):
+            repo.save(Customer("Outra", "o@example.com", "1"))
+
+
+def test_save_many_is_atomic_unless_skipping_duplicates(tmp_path: Path) -> None:
+    batch = [
+        Customer("Maria", "m@example.com", "1"),
+        Customer("João", "j@example.com", "2"),
+        Customer("Maria", "m@example.com", "1"),
+    ]
+    with SqliteCustomerRepository(tmp_path / "clientes.db") as repo:
+        with pytest.raises(DuplicateCustomerError):
+            repo.save_many(batch)
+        assert repo.count() == 0
+
+        assert repo.save_many(batch, skip_duplicates=True) == 2
+        assert repo.count() == 2
+
+
+def test_import_customer_file_skips_duplicates_and_partial_lines(tmp_path: Path) -> None:
+    source = tmp_path / "clientes.txt"
+    text_repo = FileCustomerRepository(source)
+    for customer in (
+        Customer("Maria", "m@example.com", "1"),
+        Customer("João", "j@example.com", "2"),
+        Customer("Maria", "m@example.com", "1"),
+    ):
+        text_repo.save(customer)
+    with source.open("a", encoding="utf-8") as handle:
+        handle.write("{'nome': 'Parc")
+
+    with SqliteCustomerRepository(tmp_path / "clientes.db") as repo:
+        imported = import_customer_file(source, repo, batch_size=2)
+
+        assert imported == 2
+        assert [c.cnpj for c in repo.iter_all()] == ["1", "2"]
@@ -0,0 +1,146 @@
+"""Testes das tabelas de faixas de quantidade."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from petrobahia.fixed_point import to_milliliters
+from petrobahia.models import Order
+from petrobahia.orders import build_default_order_processor
+from petrobahia.pricing import (DieselPricingStrategy, EthanolPricingStrategy,
+                                GasolinePricingStrategy,
+                                LubricantPricingStrategy,
+                                TieredPricingStrategy, build_tiered_strategies)
+from petrobahia.tiers import (DEFAULT_TIERS, QuantityTier, TierTable,
+                              load_tier_tables)
+
+ORIGINAL = {
+    "diesel": DieselPricingStrategy(),
+    "gasolina": GasolinePricingStrategy(),
+    "etanol": EthanolPricingStrategy(),
+    "lubrificante": LubricantPricingStrategy(),
+}
+EDGES = [
+    0, 1, 80, 80.0004, 80.001, 200, 200.0005, 200.001, 500, 500.001, 1000,
+    1000.0004, 1000.001, 2500.5, -3,
+]
+
+
+def _quantities() -> list[float]:
+    rng = random.Random(11)
+    return EDGES + [round(rng.uniform(0, 3000), rng.randint(0, 4)) for _ in range(2000)]
+
+
+@pytest.mark.parametrize("product", sorted(ORIGINAL))
+def test_default_tiers_reproduce_original_strategies(product: str) -> None:
+    original = ORIGINAL[product]
+    tiered = {s.product: s for s in build_tiered_strategies(DEFAULT_TIERS)}[product]
+
+    for quantity in _quantities():
+        order = Order("x", product, quantity)
+        milliliters = to_milliliters(quantity)
+        assert tiered.calculate(order) == original.calculate(order)
+        assert tiered.calculate_fixed(milliliters) == original.calculate_fixed(
+            milliliters
+        )
+    assert tiered.debug_message(1.5) == original.debug_message(1.5)
+
+
+@pytest.mark.parametrize("product", sorted(ORIGINAL))
+def test_default_tiers_reproduce_original_arrays(product: str) -> None:
+    np = pytest.importorskip("numpy")
+    quantities = np.array(_quantities(), dtype=float)
+    tiered = {s.product: s for s in build_tiered_strategies(DEFAULT_TIERS)}[product]
+
+    assert np.array_equal(
+        tiered.calculate_array(quantities),
+        ORIGINAL[product].calculate_array(quantities),
+    )
+
+
+def test_tier_lookup_uses_strict_thresholds() -> None:
+    table = TierTable(
+        (QuantityTier(1000, multiplier=0.9), QuantityTier(500, multiplier=0.95))
+    )
+
+    assert table.thresholds == (500, 1000)
+    assert table.lookup(500) is None
+    assert table.lookup(500.5) == QuantityTier(500, multiplier=0.95)
+    assert table.lookup(1000) == QuantityTier(500, multiplier=0.95)
+    assert table.lookup(1001) == QuantityTier(1000, multiplier=0.9)
+
+
+def test_tier_table_rejects_repeated_thresholds() -> None:
+    with pytest.raises(ValueError):
+        TierTable((QuantityTier(10), QuantityTier(10, multiplier=0.5)))
+
+
+def test_load_tier_tables_reads_json(tmp_path: Path) -> None:
+    path = tmp_path / "faixas.json"
+    rows = [
+        {"acima": limit, "fator": 1 - limit / 100_000}
+        for limit in range(0, 5000, 100)
+    ]
+    random.Random(1).shuffle(rows)
+    path.write_text(
+        json.dumps({"diesel": rows, "gasolina": [{"acima": 200, "abatimento": 100}]}),
+        encoding="utf-8",
+    )
+
+    tables = load_tier_tables(path)
+
+    assert len(tables["diesel"]) == 50
+    assert tables["diesel"].lookup(250) == QuantityTier(200, multiplier=0.998)
+    assert tables["gasolina"] == DEFAULT_TIERS["gasolina"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[]",
+        '{"diesel": {"acima": 1}}',
+        '{"diesel": [{"fator": 0.9}]}',
+        '{"diesel": [{"acima": 1, "fator": "0.9"}]}',
+        '{"diesel": [{"acima": 1, "fator": -1}]}',
+        '{"diesel": [{"acima": 1, "desconto": 5}]}',
+        "{nao e json",
+    ],
+)
+def test_load_tier_tables_rejects_invalid_files(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "faixas.json"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        load_tier_tables(path)
+
+
+def test_build_tiered_strategies_requires_base_price() -> None:
+    with pytest.raises(ValueError, match="querosene"):
+        build_tiered_strategies({"querosene": TierTable()})
+
+
+def test_processor_with_tier_tables() -> None:
+    default = build_default_order_processor()
+    tiered = build_default_order_processor(tiers=DEFAULT_TIERS)
+    orders = [
+        Order("x", product, quantity, coupon)
+        for product in (*ORIGINAL, "querosene")
+        for quantity in EDGES
+        for coupon in (None, "MEGA10", "LUB2")
+    ]
+
+    assert [tiered.process_order(o) for o in orders] == [
+        default.process_order(o) for o in orders
+    ]
+
+    custom = build_default_order_processor(
+        tiers={"diesel": TierTable((QuantityTier(10, deduction=1),))}
+    )
+    strategy = custom.price_calculator.select(Order("x", "diesel", 11))
+    assert isinstance(strategy, TieredPricingStrategy)
+    assert custom.process_order(Order("x", "diesel", 100)) == 398.0
+    assert custom.process_order(Order("x", "etanol", 100)) == 348.23
@@ -2,6 +2,8 @@ import pytest
 from petrobahia.validators import (
     ValidationResult,
     CustomerValidator,
+    CustomerError,
+    decode_errors,
 )
 
 
@@ -90,3 +92,87 @@ def test_validate_email_invalid():
 
     assert result.is_valid is False
     assert result.messages == ["email invalido"]
+
+
+# ---------------------------
+# Validação em lote
+# ---------------------------
+
+CADASTROS = [
+    {"nome": "Maria", "email": "maria@example.com", "cnpj": "12345678901234"},
+    {"nome": "Maria", "email": "maria@example.com"},
+    {"nome": "   ", "email": "maria@example.com", "cnpj": " 12345678901234 "},
+    {"nome": "Maria", "email": "ana@@petrobahia", "cnpj": "123"},
+    {"nome": 7, "email": "a@b.co\n", "cnpj": 12345678901234},
+    {"nome": "Maria", "email": None, "cnpj": "1234567890123٣"},
+    {},
+]
+
+
+def _legacy_messages(validator, payload):
+    messages = validator.validate_registration(dict(payload)).messages
+    email = payload.get("email")
+    if not isinstance(email, str) or not validator.validate_email(email).is_valid:
+        messages.append("email invalido")
+    return messages
+
+
+def test_validate_many_matches_individual_validations():
+    validator = CustomerValidator()
+
+    masks = validator.validate_many(CADASTROS)
+
+    assert len(masks) == len(CADASTROS)
+    assert masks[0] == 0
+    assert [decode_errors(mask) for mask in masks] == [
+        _legacy_messages(validator, payload) for payload in CADASTROS
+    ]
+
+
+def test_validate_many_returns_compact_bitmask():
+    validator = CustomerValidator()
+
+    masks = validator.validate_many(CADASTROS[:4])
+
+    assert masks.typecode == "B"
+    assert list(masks) == [
+        0,
+        CustomerError.MISSING_FIELD | CustomerError.INVALID_CNPJ,
+        CustomerError.INVALID_NAME,
+        CustomerError.INVALID_CNPJ | CustomerError.INVALID_EMAIL,
+    ]
+    assert validator.error_mask(CADASTROS[3]) == masks[3]
+
+
+def test_decode_errors_keeps_legacy_message_order():
+    assert decode_errors(0) == []
+    assert decode_errors(CustomerError.INVALID_EMAIL | CustomerError.MISSING_FIELD) == [
+        "faltou campo",
+        "email invalido",
+    ]
+
+
+def test_check_digits_are_opt_in():
+    payload = {"nome": "TransLog", "email": "a@b.com", "cnpj": "11222333000182"}
+
+    assert CustomerValidator().validate_registration(dict(payload)).is_valid
+    result = CustomerValidator(verify_check_digits=True).validate_registration(payload)
+    assert result.messages == ["cnpj invalido (digitos verificadores)"]
+
+
+@pytest.mark.parametrize("total", [3, 2000])
+def test_validate_many_verifies_check_digits(total):
+    validator = CustomerValidator(verify_check_digits=True)
+    records = [
+        {"nome": "Posto", "email": "posto@bahia.com", "cnpj": cnpj}
+        for cnpj in ("11222333000181", "11222333000182", "123")
+    ] * (total // 3 + 1)
+
+    masks = validator.validate_many(records[:total])
+
+    assert list(masks[:3]) == [
+        0,
+        CustomerError.INVALID_CHECK_DIGITS,
+        CustomerError.INVALID_CNPJ,
+    ]
+    assert list(masks) == [validator.error_mask(record) for record in records[:total]]